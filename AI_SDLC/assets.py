@@ -0,0 +1,145 @@
+"""
+Content-addressed image asset store for generated decks
+Source images are identified by a hash of their bytes, so the same logo under
+two paths is one asset. Each image is downscaled once to the size it is shown
+at (at TARGET_DPI) and the result is cached on disk across runs; within a
+package every distinct image is embedded as a single shared image part.
+"""
+
+import hashlib
+import io
+import os
+import weakref
+from collections import namedtuple
+
+from PIL import Image as PILImage
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image, ImagePart
+from pptx.util import Emu
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_CACHE_DIR = os.path.join(HERE, "build", ".cache", "assets")
+
+# Resolution images are resampled to for their on-slide size
+TARGET_DPI = 150
+
+# Bump when the resize/re-encode settings change
+ASSET_VERSION = "1"
+
+EMU_PER_INCH = 914400
+
+# A source image: content digest, pixel size and PIL format name
+SourceImage = namedtuple("SourceImage", ["digest", "size", "format"])
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class AssetStore:
+    """Source digests, fitted image bytes and the on-disk resize cache"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, dpi=TARGET_DPI):
+        self.cache_dir = cache_dir
+        self.dpi = dpi
+        self._sources = {}  # (path, mtime_ns, size) -> SourceImage
+        self._fitted = {}  # (digest, width px, height px) -> bytes
+
+    def source(self, path):
+        """Digest and pixel size of an image file (re-read only when it changes)"""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        source = self._sources.get(key)
+        if source is None:
+            with PILImage.open(path) as image:
+                size, image_format = image.size, image.format
+            source = self._sources[key] = SourceImage(file_digest(path), size, image_format)
+        return source
+
+    def fit(self, path, width, height):
+        """Image bytes for path shown at width x height EMU (downscaled, never enlarged)"""
+        source = self.source(path)
+        target = (max(1, round(width * self.dpi / EMU_PER_INCH)),
+                  max(1, round(height * self.dpi / EMU_PER_INCH)))
+        if target[0] >= source.size[0] or target[1] >= source.size[1]:
+            with open(path, "rb") as f:
+                return f.read()
+
+        key = (source.digest, target[0], target[1])
+        blob = self._fitted.get(key)
+        if blob is not None:
+            return blob
+        ext = "jpg" if source.format == "JPEG" else "png"
+        cached = os.path.join(self.cache_dir, f"{source.digest[:16]}-{target[0]}x{target[1]}-v{ASSET_VERSION}.{ext}")
+        if os.path.isfile(cached):
+            with open(cached, "rb") as f:
+                blob = f.read()
+        else:
+            blob = _resize(path, target, ext)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cached}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, cached)
+        self._fitted[key] = blob
+        return blob
+
+
+def _resize(path, size, ext):
+    buffer = io.BytesIO()
+    with PILImage.open(path) as image:
+        resized = image.resize(size, PILImage.LANCZOS)
+        if ext == "jpg":
+            resized.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True)
+        else:
+            resized.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+_default_store = None
+
+
+def default_store():
+    global _default_store
+    if _default_store is None:
+        _default_store = AssetStore()
+    return _default_store
+
+
+# package -> {image sha1: ImagePart}; python-pptx's own lookup walks every part per image
+_package_images = weakref.WeakKeyDictionary()
+
+
+def _image_part(package, blob, filename):
+    parts = _package_images.setdefault(package, {})
+    image = Image.from_blob(blob, filename)
+    image_part = parts.get(image.sha1)
+    if image_part is None:
+        image_part = parts[image.sha1] = ImagePart.new(package, image)
+    return image_part
+
+
+def add_image(slide, path, left, top, width=None, height=None, store=None):
+    """Add a picture; a missing width or height keeps the aspect ratio
+
+    left=None centers the picture horizontally on the slide.
+    """
+    store = store or default_store()
+    px_width, px_height = store.source(path).size
+    if width is None and height is None:
+        width = Emu(int(px_width * EMU_PER_INCH / store.dpi))
+    if width is None:
+        width = Emu(int(height * px_width / px_height))
+    elif height is None:
+        height = Emu(int(width * px_height / px_width))
+    if left is None:
+        left = Emu((slide.part.package.presentation_part.presentation.slide_width - width) // 2)
+
+    blob = store.fit(path, width, height)
+    image_part = _image_part(slide.part.package, blob, os.path.basename(path))
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+    pic = slide.shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+    slide.shapes._recalculate_extents()
+    return pic
@@ -0,0 +1,187 @@
+"""
+Batch deck generation: render every presentation in parallel
+Discovers presentations/*/index.html (or a deck spec beside it) and decks/*.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+
+from spec_source import SPEC_EXTENSIONS
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SPEC_NAMES = ("deck.json", "deck.yaml", "deck.yml")
+
+# streaming_writer.COMPRESSION_MODES names (listed here so --help does not load python-pptx)
+COMPRESSION_CHOICES = ("fast", "default", "max")
+
+# kind is "spec" (deck_spec file) or "html" (Reveal.js index.html)
+DeckJob = namedtuple("DeckJob", ["name", "source", "kind", "output"])
+
+# cache is "hit", "partial" or "full" (see build_cache), or "off" with --no-cache; changes lists
+# how the output differs from the file it replaced (pptx_diff lines, [] if unchanged, None if new)
+DeckResult = namedtuple("DeckResult", ["name", "output", "slides", "seconds", "cache", "bytes", "changes",
+                                       "error"])
+
+
+def discover_jobs(root=HERE, out_dir=None):
+    """Find every buildable deck under root; outputs go to out_dir/<name>.pptx"""
+    out_dir = out_dir or os.path.join(root, "build")
+    jobs = []
+
+    presentations = os.path.join(root, "presentations")
+    if os.path.isdir(presentations):
+        for name in sorted(os.listdir(presentations)):
+            folder = os.path.join(presentations, name)
+            spec = next((os.path.join(folder, s) for s in SPEC_NAMES
+                         if os.path.isfile(os.path.join(folder, s))), None)
+            html = os.path.join(folder, "index.html")
+            if spec:
+                jobs.append(DeckJob(name, spec, "spec", os.path.join(out_dir, f"{name}.pptx")))
+            elif os.path.isfile(html):
+                jobs.append(DeckJob(name, html, "html", os.path.join(out_dir, f"{name}.pptx")))
+
+    decks = os.path.join(root, "decks")
+    if os.path.isdir(decks):
+        for filename in sorted(os.listdir(decks)):
+            name, ext = os.path.splitext(filename)
+            if ext in SPEC_EXTENSIONS:
+                jobs.append(DeckJob(name, os.path.join(decks, filename), "spec",
+                                    os.path.join(out_dir, f"{name}.pptx")))
+    return jobs
+
+
+def build_job(job, use_cache=True, compression="default", slide_workers=1):
+    """Render one deck (runs inside a worker process); slide_workers render its changed slides"""
+    start = time.perf_counter()
+    try:
+        from pptx_diff import summarize, summary_changes
+
+        os.makedirs(os.path.dirname(job.output), exist_ok=True)
+        previous = summarize(job.output) if os.path.isfile(job.output) else None
+        if use_cache:
+            from build_cache import cached_build_spec_file, cached_convert_html
+            if job.kind == "spec":
+                status = cached_build_spec_file(job.source, job.output, compression=compression,
+                                                workers=slide_workers)
+            else:
+                status = cached_convert_html(job.source, job.output, name=job.name, compression=compression,
+                                             workers=slide_workers)
+            slides = _count_slides(job.output)
+        elif job.kind == "spec":
+            from deck_spec import build_deck
+            status, slides = "off", build_deck(job.source, job.output, compression=compression)
+        else:
+            from reveal_extractor import convert
+            status, slides = "off", convert(job.source, job.output, name=job.name, compression=compression)
+        changes = None if previous is None else summary_changes(previous, summarize(job.output))
+        return DeckResult(job.name, job.output, slides, time.perf_counter() - start, status,
+                          os.path.getsize(job.output), changes, None)
+    except Exception:
+        import traceback
+        return DeckResult(job.name, job.output, 0, time.perf_counter() - start, None, 0, None,
+                          traceback.format_exc())
+
+
+def _count_slides(pptx_path):
+    """Slide count read from the zip listing (no python-pptx needed)"""
+    import zipfile
+    with zipfile.ZipFile(pptx_path) as package:
+        return sum(1 for name in package.namelist() if re.fullmatch(r"ppt/slides/slide\d+\.xml", name))
+
+
+def reproducible_epoch(root=HERE):
+    """SOURCE_DATE_EPOCH for --reproducible: the environment's, else the last commit's time, else 1980"""
+    from streaming_writer import ZIP_EPOCH, source_date_epoch
+
+    epoch = source_date_epoch()
+    if epoch is not None:
+        return epoch
+    import subprocess
+    try:
+        return int(subprocess.run(["git", "log", "-1", "--format=%ct"], cwd=root, capture_output=True,
+                                  text=True, check=True).stdout.strip())
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return ZIP_EPOCH
+
+
+def run_batch(jobs, workers=None, use_cache=True, compression="default"):
+    """Build all jobs across a process pool; yields DeckResults as they finish"""
+    # Largest sources first so one big deck does not start last and straggle
+    jobs = sorted(jobs, key=lambda job: os.path.getsize(job.source), reverse=True)
+    workers = workers or os.cpu_count() or 1
+    # Cores left over when there are fewer decks than workers go to rendering slides in parallel
+    slide_workers = max(1, workers // max(1, len(jobs)))
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield build_job(job, use_cache, compression, slide_workers)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed  # loads multiprocessing
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = [pool.submit(build_job, job, use_cache, compression, slide_workers) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _describe_changes(changes):
+    if changes is None:
+        return "new"
+    return f"{len(changes)} changes" if changes else "unchanged"
+
+
+def build_all(jobs, workers=None, use_cache=True, report=None, compression="default"):
+    """Build jobs, printing one line per deck; returns the process exit code"""
+    print(f"Building {len(jobs)} decks...")
+    start = time.perf_counter()
+    results = []
+    for result in run_batch(jobs, workers, use_cache, compression):
+        results.append(result)
+        if result.error:
+            print(f"✗ {result.name} failed after {result.seconds:.2f}s")
+            print(result.error.rstrip())
+        else:
+            print(f"✓ {result.name}: {result.slides} slides, {result.bytes / 1024:,.0f} KB in {result.seconds:.2f}s "
+                  f"[{result.cache}, {_describe_changes(result.changes)}] -> {result.output}")
+    elapsed = time.perf_counter() - start
+
+    failures = [r for r in results if r.error]
+    unchanged = sum(1 for r in results if r.changes == [])
+    print(f"✓ {len(results) - len(failures)}/{len(results)} decks built in {elapsed:.2f}s "
+          f"({sum(r.bytes for r in results) / 1024:,.0f} KB, {compression} compression, {unchanged} unchanged)")
+    if report:
+        with open(report, "w", encoding="utf-8") as f:
+            json.dump({"seconds": elapsed, "compression": compression,
+                       "decks": [r._asdict() for r in results]}, f, indent=2)
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every presentation deck in parallel")
+    parser.add_argument("--root", default=HERE, help="folder containing presentations/ and decks/")
+    parser.add_argument("--out", help="output folder (default: <root>/build)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--report", help="write a JSON timing/failure report here")
+    parser.add_argument("--no-cache", action="store_true", help="always render every deck from scratch")
+    parser.add_argument("--compression", choices=COMPRESSION_CHOICES, default="default",
+                        help="fast (CI previews), default, or max (published artifacts)")
+    parser.add_argument("--reproducible", action="store_true",
+                        help="byte-identical output for identical input (sets SOURCE_DATE_EPOCH)")
+    args = parser.parse_args(argv)
+    if args.reproducible:
+        os.environ["SOURCE_DATE_EPOCH"] = str(reproducible_epoch(args.root))
+
+    jobs = discover_jobs(args.root, args.out)
+    if not jobs:
+        print("No decks found")
+        return 0
+    return build_all(jobs, args.workers, not args.no_cache, args.report, args.compression)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Benchmark deck_cli.py startup for the metadata commands
+Runs each command in a fresh interpreter several times and reports the median
+wall time on top of a bare `python -c pass`, and fails if a command goes over
+the budget or imports python-pptx/lxml.
+
+Usage:
+    python benchmarks/bench_cli_startup.py              # 15 runs per command
+    python benchmarks/bench_cli_startup.py --runs 50 --budget-ms 40
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+CLI = os.path.join(ROOT, "deck_cli.py")
+
+# Commands that must never load the renderer
+COMMANDS = (
+    ("--help",),
+    ("list", "nxop_ai_native"),
+    ("diff", "nxop_ai_native", "nxop_ai_native"),
+)
+
+# Modules whose import means a command paid for the renderer
+HEAVY_MODULES = ("pptx", "lxml")
+
+BUDGET_MS = 50
+
+
+def _time_runs(argv, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def _heavy_imports(argv):
+    """Heavy top-level packages imported while running argv (from -X importtime)"""
+    result = subprocess.run([sys.executable, "-X", "importtime"] + argv[1:], cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()
+                if line.startswith("import time:")}
+    return sorted(m for m in HEAVY_MODULES if m in imported)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure deck_cli.py startup time")
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS,
+                        help="allowed median time over bare interpreter startup")
+    args = parser.parse_args(argv)
+
+    interpreter = _time_runs([sys.executable, "-c", "pass"], args.runs)
+    print(f"python -c pass: {interpreter:.1f} ms")
+    failures = 0
+    for command in COMMANDS:
+        run = [sys.executable, CLI] + list(command)
+        overhead = _time_runs(run, args.runs) - interpreter
+        heavy = _heavy_imports(run)
+        ok = overhead <= args.budget_ms and not heavy
+        failures += not ok
+        note = f" (imports {', '.join(heavy)})" if heavy else ""
+        print(f"{'✓' if ok else '✗'} deck_cli.py {' '.join(command)}: +{overhead:.1f} ms{note}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
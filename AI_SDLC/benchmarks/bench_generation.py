@@ -0,0 +1,174 @@
+"""
+Benchmark deck generation throughput and memory
+Times create_presentation() and save() for each generator, plus synthetic stress
+decks built from the create_ppt_from_website slide functions, and compares the
+results against a stored baseline. Each case runs in a fresh process so max RSS
+is per case; tracemalloc peak covers Python allocations only (lxml's C heap
+shows up in max RSS instead).
+
+Usage:
+    python benchmarks/bench_generation.py                   # run and compare (fails without a baseline)
+    python benchmarks/bench_generation.py --update-baseline # record new baseline
+    python benchmarks/bench_generation.py --sizes 100 1000  # smaller stress run
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+
+GENERATORS = ("create_ppt_from_website", "enhanced_ppt_from_website", "generate_ppt")
+
+STRESS_SIZES = (100, 1000, 10000)
+
+# Allowed growth over the baseline before a metric counts as a regression
+TOLERANCE = {"build_s": 1.25, "save_s": 1.25, "peak_mb": 1.15, "max_rss_mb": 1.15, "size_kb": 1.05}
+
+# Differences smaller than this are timer noise on small decks, never regressions
+MIN_DELTA = {"build_s": 0.05, "save_s": 0.05, "peak_mb": 0.5, "max_rss_mb": 5}
+
+
+def _build_generator(name):
+    module = __import__(name)
+    return module.create_presentation
+
+
+def _build_stress(slide_count):
+    import create_ppt_from_website as plain
+    from deck_spec import new_presentation
+
+    def build():
+        deck = plain.get_deck()
+        prs = new_presentation(deck.width, deck.height)
+        for index in range(slide_count):
+            plain.SLIDE_BUILDERS[index % len(plain.SLIDE_BUILDERS)](prs)
+        return prs
+    return build
+
+
+def _measure(build, trace_memory):
+    """Build and save once; returns the metrics dict"""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    prs = build()
+    built = time.perf_counter()
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    saved = time.perf_counter()
+    result = {
+        "build_s": round(built - start, 4),
+        "save_s": round(saved - built, 4),
+        "slides": len(prs.slides),
+        "size_kb": round(buffer.tell() / 1024, 1),
+        # ru_maxrss is KiB on Linux
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+    if trace_memory:
+        result["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        tracemalloc.stop()
+    return result
+
+
+def run_case(case, trace_memory=True):
+    """Run one benchmark case (called in a fresh process so RSS is per case)"""
+    kind, arg = case
+    if kind == "generator":
+        build = warm = _build_generator(arg)
+    else:
+        build, warm = _build_stress(arg), _build_stress(13)
+    warm().save(io.BytesIO())  # load imports and template/spec caches outside the timings
+    # Time without tracemalloc overhead, then measure memory in a second pass
+    result = _measure(build, trace_memory=False)
+    if trace_memory:
+        result["peak_mb"] = _measure(build, trace_memory=True)["peak_mb"]
+    return result
+
+
+def case_name(case):
+    kind, arg = case
+    return arg if kind == "generator" else f"stress_{arg}"
+
+
+def run_all(cases, trace_memory=True):
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for case in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(run_case, case, trace_memory).result()
+        results[case_name(case)] = result
+        print(f"  {case_name(case):<28} build {result['build_s']:>8.3f}s  save {result['save_s']:>7.3f}s  "
+              f"peak {result.get('peak_mb', float('nan')):>8.2f}MB  rss {result['max_rss_mb']:>7.1f}MB  "
+              f"{result['size_kb']:>9.1f}KB  ({result['slides']} slides)")
+    return results
+
+
+def compare(results, baseline):
+    """Return a list of regression messages"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric, limit in TOLERANCE.items():
+            if metric in result and base.get(metric):
+                ratio = result[metric] / base[metric]
+                if ratio > limit and result[metric] - base[metric] > MIN_DELTA.get(metric, 0):
+                    regressions.append(f"{name}.{metric}: {base[metric]} -> {result[metric]} "
+                                       f"({ratio:.2f}x, limit {limit:.2f}x)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark deck generation")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(STRESS_SIZES),
+                        help="stress deck slide counts")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", help="also write results as JSON here")
+    args = parser.parse_args(argv)
+
+    cases = [("generator", name) for name in GENERATORS] + [("stress", n) for n in args.sizes]
+    print("Running generation benchmarks...")
+    results = run_all(cases, trace_memory=not args.no_memory)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Baseline written to: {args.baseline}")
+        return 0
+    if not os.path.isfile(args.baseline):
+        # Baselines are per machine and not committed; a check with nothing to compare against must not pass
+        print(f"✗ No baseline at {args.baseline}; run with --update-baseline on this machine to record one")
+        return 1
+
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(results, json.load(f))
+    if regressions:
+        print("✗ Regressions against baseline:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("✓ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Brand and style registry shared by every deck generator
+American Airlines colors are defined once here (named paragraph styles live in
+each deck spec). Each ParagraphStyle is compiled on first use into a ready-made <a:pPr> fragment (alignment,
+level, spacing and <a:defRPr> size/bold/color), so styling a paragraph is one
+element copy or attribute merge instead of a chain of python-pptx setters.
+"""
+
+from collections import namedtuple
+from copy import deepcopy
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.text.text import _Paragraph
+
+# American Airlines Brand Colors (deck specs reference these names)
+BRAND_COLORS = {
+    "AA_RED": (200, 10, 40),
+    "AA_DARK_BLUE": (0, 75, 135),
+    "AA_LIGHT_BLUE": (0, 120, 210),
+    "AA_SILVER": (167, 170, 173),
+    "AA_DARK_GRAY": (43, 43, 43),
+    "SUCCESS_GREEN": (40, 167, 69),
+    "WARNING_ORANGE": (255, 140, 0),
+    "WHITE": (255, 255, 255),
+    # Secondary colors from the AI-SDLC deck
+    "NAVY": (0, 51, 102),
+    "FOREST_GREEN": (0, 102, 51),
+    "LIGHT_GRAY": (220, 220, 220),
+}
+
+# A fully resolved paragraph style; every value is ready to assign to python-pptx
+ParagraphStyle = namedtuple(
+    "ParagraphStyle",
+    ["size", "bold", "color", "level", "space_before", "space_after", "alignment"],
+)
+
+# Leaves a paragraph as python-pptx made it
+EMPTY_STYLE = ParagraphStyle(None, None, None, 0, None, None, None)
+
+
+def _set_properties(p, style):
+    """The python-pptx setter path; used to compile styles and for pre-styled paragraphs"""
+    font = p.font
+    if style.size is not None:
+        font.size = style.size
+    if style.bold is not None:
+        font.bold = style.bold
+    if style.color is not None:
+        font.color.rgb = style.color
+    if style.level:
+        p.level = style.level
+    if style.space_before is not None:
+        p.space_before = style.space_before
+    if style.space_after is not None:
+        p.space_after = style.space_after
+    if style.alignment is not None:
+        p.alignment = style.alignment
+
+
+_compiled = {}
+
+
+def _compiled_pPr(style):
+    """The <a:pPr> element the setters would produce for style (cached)"""
+    pPr = _compiled.get(style)
+    if pPr is None:
+        p = parse_xml(f"<a:p {nsdecls('a')}/>")
+        _set_properties(_Paragraph(p, None), style)
+        pPr = _compiled[style] = p.get_or_add_pPr()
+    return pPr
+
+
+def apply_style(p, style):
+    """Apply a ParagraphStyle to a python-pptx paragraph"""
+    if style == EMPTY_STYLE:
+        return  # no <a:pPr><a:defRPr/></a:pPr> for a paragraph with nothing to set
+    template = _compiled_pPr(style)
+    p_elm = p._p
+    pPr = p_elm.pPr
+    if pPr is None:
+        p_elm.insert(0, deepcopy(template))
+    elif len(pPr) == 0:
+        pPr.attrib.update(template.attrib)
+        pPr.extend(deepcopy(child) for child in template)
+    else:
+        _set_properties(p, style)
@@ -0,0 +1,189 @@
+"""
+Incremental rebuild cache for generated PPTX files
+Decks are keyed by a hash of their input content, the brand palette and the
+generator version. Unchanged decks are copied from the cache without touching
+python-pptx. Spec decks that did change are built through slide_graph, which
+re-renders only the slides whose inputs changed and reuses the rest.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Bump when rendering changes in a way the source digests below cannot see
+GENERATOR_VERSION = "1"
+
+DEFAULT_CACHE_DIR = os.path.join(HERE, "build", ".cache")
+
+# Modules whose source is part of every spec/html deck's cache key
+SPEC_GENERATOR_MODULES = ("assets.py", "brand_styles.py", "charts.py", "data_binding.py", "deck_spec.py",
+                          "metrics.py", "slide_graph.py", "slide_templates.py", "spec_source.py", "streaming_writer.py",
+                          "text_fit.py")
+HTML_GENERATOR_MODULES = SPEC_GENERATOR_MODULES + ("chartjs.py", "reveal_extractor.py")
+
+_source_digests = {}
+
+
+def _digest(*chunks):
+    h = hashlib.sha256()
+    for chunk in chunks:
+        h.update(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def generator_digest(modules):
+    """Hash of GENERATOR_VERSION plus the source of the given generator modules"""
+    key = tuple(modules)
+    if key not in _source_digests:
+        _source_digests[key] = _digest(
+            GENERATOR_VERSION, *(_file_digest(os.path.join(HERE, m)) for m in modules))
+    return _source_digests[key]
+
+
+def _output_options(compression):
+    """What, besides the deck, decides the bytes written: compression mode and SOURCE_DATE_EPOCH"""
+    return f"{compression}\0{os.environ.get('SOURCE_DATE_EPOCH', '').strip()}"
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+class BuildCache:
+    """On-disk cache of built packages and the keys they were built from"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _paths(self, output_path):
+        stem = os.path.splitext(os.path.basename(output_path))[0]
+        tag = hashlib.sha1(os.path.abspath(output_path).encode("utf-8")).hexdigest()[:10]
+        base = os.path.join(self.cache_dir, f"{stem}-{tag}")
+        return base + ".json", base + ".pptx"
+
+    def load(self, output_path):
+        """Return (manifest, cached package path) or (None, None)"""
+        manifest_path, package_path = self._paths(output_path)
+        if not (os.path.isfile(manifest_path) and os.path.isfile(package_path)):
+            return None, None
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f), package_path
+
+    def store(self, output_path, manifest, package_path=None):
+        """Record a freshly written output (or package_path) in the cache"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        manifest_path, cached_package = self._paths(output_path)
+        source = package_path or output_path
+        if os.path.abspath(source) != os.path.abspath(cached_package):
+            shutil.copyfile(source, cached_package)
+        manifest = dict(manifest, package_digest=_file_digest(cached_package))
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+    def restore(self, output_path, manifest, package_path):
+        """Copy the cached package to output_path unless it is already there"""
+        if os.path.isfile(output_path) and _file_digest(output_path) == manifest.get("package_digest"):
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        shutil.copyfile(package_path, output_path)
+
+
+def asset_paths(spec):
+    """Paths of every file a loaded deck spec reads: images and data sources"""
+    from spec_source import asset_path
+
+    sources = [source["source"] for source in spec.get("data", {}).values()]
+    for slide in spec.get("slides", []):
+        sources += [image["src"] for image in slide.get("images", [])]
+        sources += [item["source"] for key in ("tables", "charts") for item in slide.get(key, []) if "source" in item]
+    return list(dict.fromkeys(asset_path(spec.get("base_dir"), src) for src in sources))
+
+
+def _spec_key(spec, palette, generator, compression="default"):
+    """(deck key, {asset path: digest}) for a loaded deck spec"""
+    # Images and data files are keyed by content so replacing a file rebuilds the deck
+    assets = {path: _file_digest(path) for path in asset_paths(spec)}
+    key = _digest(generator, _canonical(spec), _canonical(palette or {}), _canonical(assets),
+                  _output_options(compression))
+    return key, assets
+
+
+def _assets_unchanged(manifest):
+    """True if every asset (image or data file) recorded in the manifest still has the same content"""
+    for path, digest in manifest.get("assets", {}).items():
+        if not os.path.isfile(path) or _file_digest(path) != digest:
+            return False
+    return True
+
+
+def cached_build_spec(spec, output_path, palette=None, generator=None,
+                      source_key=None, force=False, cache=None, compression="default", workers=1):
+    """Build a loaded deck spec through the cache
+
+    Returns "hit" (nothing rendered), "partial" (only changed slides rendered)
+    or "full" (every slide rendered). Slides are reused from the slide store in
+    the cache folder, so a reordered or extended deck still reuses its
+    unchanged slides; force renders everything. compression names a
+    streaming_writer.COMPRESSION_MODES entry; it and SOURCE_DATE_EPOCH are
+    part of the cache key.
+    Changed slides are rendered across workers processes (see build_graph).
+    """
+    cache = cache or BuildCache()
+    generator = generator or generator_digest(SPEC_GENERATOR_MODULES)
+    deck_key, assets = _spec_key(spec, palette, generator, compression)
+    manifest, package_path = cache.load(output_path)
+
+    if not force and manifest and manifest.get("deck_key") == deck_key:
+        cache.restore(output_path, manifest, package_path)
+        return "hit"
+
+    from deck_spec import compile_deck
+    from slide_graph import SlideStore, build_graph, deck_graph
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    graph = deck_graph(compile_deck(spec, palette), generator_digest(SPEC_GENERATOR_MODULES))
+    store = SlideStore(os.path.join(cache.cache_dir, "slides"))
+    rendered, reused = build_graph(graph, output_path, store, rebuild=force, compression=compression,
+                                   workers=workers)
+    cache.store(output_path, {"deck_key": deck_key, "source_key": source_key, "assets": assets})
+    return "partial" if reused else "full"
+
+
+def cached_build_spec_file(spec_path, output_path, palette=None, force=False, cache=None, compression="default",
+                           workers=1):
+    """cached_build_spec() for a spec on disk; unchanged files skip parsing entirely"""
+    cache = cache or BuildCache()
+    generator = generator_digest(SPEC_GENERATOR_MODULES)
+    source_key = _digest(generator, _file_digest(spec_path), _canonical(palette or {}),
+                         _output_options(compression))
+    manifest, package_path = cache.load(output_path)
+    if not force and manifest and manifest.get("source_key") == source_key and _assets_unchanged(manifest):
+        cache.restore(output_path, manifest, package_path)
+        return "hit"
+    from spec_source import load_deck_spec
+    return cached_build_spec(load_deck_spec(spec_path), output_path, palette,
+                             generator, source_key, force, cache, compression, workers)
+
+
+def cached_convert_html(html_path, output_path, name=None, force=False, cache=None, compression="default",
+                        workers=1):
+    """cached_build_spec() for a Reveal.js file; unchanged files skip extraction"""
+    cache = cache or BuildCache()
+    generator = generator_digest(HTML_GENERATOR_MODULES)
+    source_key = _digest(generator, _file_digest(html_path), name or "", _output_options(compression))
+    manifest, package_path = cache.load(output_path)
+    if not force and manifest and manifest.get("source_key") == source_key and _assets_unchanged(manifest):
+        cache.restore(output_path, manifest, package_path)
+        return "hit"
+    from reveal_extractor import extract_deck_spec
+    spec = extract_deck_spec(html_path, name)
+    return cached_build_spec(spec, output_path, None, generator, source_key, force, cache, compression, workers)
@@ -0,0 +1,379 @@
+"""
+Local build server: rebuild decks as their sources change and serve previews
+An asyncio loop polls presentations/, decks/ and the generator modules for
+changes (backing off to IDLE_POLL_SECONDS while nothing changes), waits until
+edits settle (DEBOUNCE_SECONDS), and rebuilds only the
+decks a change affects in a background process pool. Builds go through the
+slide graph, so an edit re-renders just the slides it touched; thumbnails are
+redrawn for those slides only. The latest PPTX and PNG previews are served on
+localhost, and the index page reloads itself after every rebuild.
+
+    python deck_cli.py serve [DECK ...] [--port 8000]
+"""
+
+import asyncio
+import html
+import json
+import os
+import re
+import signal
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import unquote
+
+from batch_build import HERE
+
+# Seconds between polls of the watched files, and of quiet before a rebuild starts
+POLL_SECONDS = 0.1
+DEBOUNCE_SECONDS = 0.15
+
+# Quiet polls double the interval up to this, so an idle server is not rescanning the tree constantly
+IDLE_POLL_SECONDS = 1.0
+
+DEFAULT_PORT = 8000
+
+DEFAULT_OUT_DIR = os.path.join(HERE, "build", "preview")
+
+# Folders under the watched roots that never hold deck sources
+SKIP_DIRS = ("build", "node_modules", "__pycache__")
+
+# deps: every file the deck read (source and assets); error is a traceback or None
+PreviewResult = namedtuple("PreviewResult", ["name", "slides", "rendered", "reused", "thumbnails",
+                                             "seconds", "deps", "error"])
+
+_drawn = {}  # thumbnail path -> repr of the slide drawn there (per worker process)
+
+_CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json",
+    ".png": "image/png",
+    ".pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+}
+
+
+def _refresh_thumbnails(deck, folder):
+    """Redraw the thumbnails of slides that changed; returns how many were drawn"""
+    from thumbnails import render_thumbnail
+
+    os.makedirs(folder, exist_ok=True)
+    drawn = 0
+    for number, slide in enumerate(deck.slides, 1):
+        path = os.path.join(folder, f"slide-{number:03d}.png")
+        key = repr((slide, deck.width, deck.height))
+        if _drawn.get(path) == key and os.path.isfile(path):
+            continue
+        tmp_path = f"{path}.tmp"
+        render_thumbnail(slide, deck.width, deck.height).save(tmp_path, "PNG")
+        os.replace(tmp_path, path)
+        _drawn[path] = key
+        drawn += 1
+    for name in os.listdir(folder):
+        match = re.fullmatch(r"slide-(\d+)\.png", name)
+        if match and int(match.group(1)) > len(deck.slides):
+            os.remove(os.path.join(folder, name))
+            _drawn.pop(os.path.join(folder, name), None)
+    return drawn
+
+
+def build_preview(job, out_dir):
+    """Build one deck's PPTX and thumbnails (runs in a worker process)"""
+    start = time.perf_counter()
+    deps = [job.source]
+    try:
+        from build_cache import HTML_GENERATOR_MODULES, SPEC_GENERATOR_MODULES, asset_paths, generator_digest
+        from deck_spec import compile_deck
+        from slide_graph import build_graph, deck_graph
+        from spec_source import load_source
+
+        spec = load_source(job.source, job.name)
+        deps += [os.path.abspath(path) for path in asset_paths(spec)]
+        deck = compile_deck(spec)
+        modules = HTML_GENERATOR_MODULES if job.kind == "html" else SPEC_GENERATOR_MODULES
+        graph = deck_graph(deck, generator_digest(modules))
+        output_path = os.path.join(out_dir, f"{job.name}.pptx")
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        # Previews favour write speed over size
+        rendered, reused = build_graph(graph, tmp_path, compression="fast")
+        os.replace(tmp_path, output_path)
+        drawn = _refresh_thumbnails(deck, os.path.join(out_dir, job.name))
+        return PreviewResult(job.name, len(deck.slides), rendered, reused, drawn,
+                             time.perf_counter() - start, deps, None)
+    except Exception:
+        import traceback
+        return PreviewResult(job.name, 0, 0, 0, 0, time.perf_counter() - start, deps, traceback.format_exc())
+
+
+def _snapshot(roots, files):
+    """{path: (mtime_ns, size)} for every file under roots plus the given files"""
+    state = {}
+
+    def visit(folder):
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    visit(entry.path)
+            else:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                state[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+    for root in roots:
+        visit(root)
+    for path in files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def next_poll_delay(delay, active):
+    """Seconds until the next poll: POLL_SECONDS while changes are pending, doubling while idle"""
+    return POLL_SECONDS if active else min(delay * 2, IDLE_POLL_SECONDS)
+
+
+class BuildServer:
+    """Watches deck sources, rebuilds affected decks and serves the results"""
+
+    def __init__(self, jobs, out_dir=DEFAULT_OUT_DIR, host="127.0.0.1", port=DEFAULT_PORT, workers=None):
+        from build_cache import HTML_GENERATOR_MODULES, SPEC_GENERATOR_MODULES
+
+        self.jobs = {job.name: job for job in jobs}
+        self.out_dir = out_dir
+        self.host = host
+        self.port = port
+        self.workers = workers or max(1, min(len(jobs), os.cpu_count() or 1))
+        self.spec_modules = {os.path.join(HERE, m) for m in SPEC_GENERATOR_MODULES}
+        self.html_modules = {os.path.join(HERE, m) for m in HTML_GENERATOR_MODULES} - self.spec_modules
+        self.deps = {job.name: {job.source} for job in jobs}
+        self.results = {}
+        self.versions = {name: 0 for name in self.jobs}
+        self.building = set()
+        self.pending = set()
+        self.listeners = set()
+        self.pool = None
+
+    # Watching
+
+    def _watched_files(self):
+        files = self.spec_modules | self.html_modules
+        for deps in self.deps.values():
+            files |= deps
+        return files
+
+    def affected(self, paths):
+        """(deck names to rebuild, whether generator code changed) for changed paths"""
+        names, code_changed = set(), False
+        for path in paths:
+            if path in self.spec_modules:
+                names |= set(self.jobs)
+                code_changed = True
+            elif path in self.html_modules:
+                names |= {name for name, job in self.jobs.items() if job.kind == "html"}
+                code_changed = True
+            for name, job in self.jobs.items():
+                # Everything in a Reveal.js deck's folder (CSS, images, data) belongs to it
+                if path in self.deps[name] or (job.kind == "html" and
+                                               path.startswith(os.path.dirname(job.source) + os.sep)):
+                    names.add(name)
+        return names, code_changed
+
+    async def watch(self):
+        roots = [os.path.join(HERE, "presentations"), os.path.join(HERE, "decks")]
+        loop = asyncio.get_running_loop()
+        state = await loop.run_in_executor(None, _snapshot, roots, self._watched_files())
+        changed, last_change, delay = set(), 0.0, POLL_SECONDS
+        while True:
+            await asyncio.sleep(delay)
+            current = await loop.run_in_executor(None, _snapshot, roots, self._watched_files())
+            diff = {path for path in state.keys() | current.keys() if state.get(path) != current.get(path)}
+            state = current
+            delay = next_poll_delay(delay, bool(diff or changed))
+            if diff:
+                changed |= diff
+                last_change = time.monotonic()
+            elif changed and time.monotonic() - last_change >= DEBOUNCE_SECONDS:
+                names, code_changed = self.affected(changed)
+                changed = set()
+                if code_changed:
+                    self._restart_pool()
+                for name in sorted(names):
+                    self.schedule(name)
+
+    # Building
+
+    def _restart_pool(self):
+        """Fresh worker processes, so edited generator modules are re-imported"""
+        if self.pool is not None:
+            self.pool.shutdown(wait=False)
+        self.pool = ProcessPoolExecutor(self.workers)
+
+    def schedule(self, name):
+        """Rebuild a deck now, or once its current build finishes"""
+        if name in self.building:
+            self.pending.add(name)
+            return
+        self.building.add(name)
+        asyncio.get_running_loop().create_task(self._build(name))
+
+    async def _build(self, name):
+        loop = asyncio.get_running_loop()
+        pool, start = self.pool, time.perf_counter()
+        try:
+            result = await loop.run_in_executor(pool, build_preview, self.jobs[name], self.out_dir)
+        except Exception:
+            # The pool itself failed (a worker died: BrokenProcessPool), and every later build would too
+            import traceback
+            result = PreviewResult(name, 0, 0, 0, 0, time.perf_counter() - start, sorted(self.deps[name]),
+                                   traceback.format_exc())
+            if self.pool is pool:
+                self._restart_pool()
+        finally:
+            self.building.discard(name)
+        self.deps[name] = set(result.deps)
+        self.results[name] = result
+        self.versions[name] += 1
+        if result.error:
+            print(f"✗ {name} failed after {result.seconds:.2f}s")
+            print(result.error.rstrip())
+        else:
+            print(f"✓ {name}: {result.rendered} slides rendered, {result.reused} reused, "
+                  f"{result.thumbnails} thumbnails in {result.seconds:.2f}s")
+        self._notify(name)
+        if name in self.pending:
+            self.pending.discard(name)
+            self.schedule(name)
+
+    def _notify(self, name):
+        for queue in list(self.listeners):
+            queue.put_nowait(name)
+
+    # Serving
+
+    def status(self):
+        return {
+            name: {"version": self.versions[name], "building": name in self.building,
+                   **({k: v for k, v in self.results[name]._asdict().items() if k != "deps"}
+                      if name in self.results else {})}
+            for name in self.jobs
+        }
+
+    def index_page(self):
+        sections = []
+        for name in self.jobs:
+            result, version = self.results.get(name), self.versions[name]
+            if result is None:
+                body = "<p>Building…</p>"
+            elif result.error:
+                body = f"<pre class=error>{html.escape(result.error)}</pre>"
+            else:
+                body = (f'<p><a href="/decks/{name}.pptx?v={version}">{name}.pptx</a> · {result.slides} slides · '
+                        f"built in {result.seconds:.2f}s</p><div class=thumbs>"
+                        + "".join(f'<img src="/decks/{name}/slide-{n:03d}.png?v={version}" loading=lazy>'
+                                  for n in range(1, result.slides + 1))
+                        + "</div>")
+            sections.append(f"<section><h2>{html.escape(name)}</h2>{body}</section>")
+        return ("<!doctype html><meta charset=utf-8><title>Deck previews</title><style>"
+                "body{font-family:sans-serif;margin:2em}img{width:320px;margin:4px;border:1px solid #ccc}"
+                ".error{color:#b00;white-space:pre-wrap}</style><h1>Deck previews</h1>"
+                + "".join(sections)
+                + "<script>new EventSource('/events').onmessage = () => location.reload()</script>")
+
+    def _file(self, path):
+        """Absolute path for a /decks/... request, or None if it names no served file"""
+        match = re.fullmatch(r"/decks/([^/]+)\.pptx", path) or re.fullmatch(r"/decks/([^/]+)/(slide-\d+\.png)", path)
+        if not match or match.group(1) not in self.jobs:
+            return None
+        return os.path.join(self.out_dir, f"{match.group(1)}.pptx" if match.lastindex == 1 else
+                            os.path.join(match.group(1), match.group(2)))
+
+    async def handle(self, reader, writer):
+        try:
+            request = await reader.readline()
+            while (await reader.readline()).strip():
+                pass  # headers are not needed
+            parts = request.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] not in ("GET", "HEAD"):
+                await self._respond(writer, 405, b"Method not allowed", "text/plain")
+                return
+            path = unquote(parts[1].split("?", 1)[0])
+            if path == "/events":
+                await self._events(writer)
+            elif path == "/":
+                await self._respond(writer, 200, self.index_page().encode("utf-8"), _CONTENT_TYPES[".html"])
+            elif path == "/status.json":
+                await self._respond(writer, 200, json.dumps(self.status()).encode("utf-8"), _CONTENT_TYPES[".json"])
+            else:
+                file_path = self._file(path)
+                if file_path is None or not os.path.isfile(file_path):
+                    await self._respond(writer, 404, b"Not found", "text/plain")
+                    return
+                with open(file_path, "rb") as f:
+                    body = f.read()
+                await self._respond(writer, 200, body, _CONTENT_TYPES[os.path.splitext(file_path)[1]])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, body, content_type):
+        reason = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nCache-Control: no-store\r\nConnection: close\r\n\r\n"
+                     .encode("latin-1") + body)
+        await writer.drain()
+
+    async def _events(self, writer):
+        """Server-sent events: one message per finished rebuild"""
+        queue = asyncio.Queue()
+        self.listeners.add(queue)
+        try:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-store\r\n\r\n")
+            await writer.drain()
+            while True:
+                name = await queue.get()
+                writer.write(f"data: {name}\n\n".encode("utf-8"))
+                await writer.drain()
+        finally:
+            self.listeners.discard(queue)
+
+    async def run(self, ready=None):
+        """Build every deck, then watch and serve until cancelled"""
+        os.makedirs(self.out_dir, exist_ok=True)
+        self._restart_pool()
+        server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        print(f"✓ Serving previews of {len(self.jobs)} decks at http://{self.host}:{self.port}/")
+        for name in self.jobs:
+            self.schedule(name)
+        if ready is not None:
+            ready.set()
+        # Stop like Ctrl-C on SIGTERM too, so the worker processes are shut down
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                await self.watch()
+        finally:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def serve(jobs, out_dir=None, host="127.0.0.1", port=DEFAULT_PORT, workers=None):
+    """Run a BuildServer for jobs until interrupted"""
+    if not jobs:
+        print("No decks found")
+        return 0
+    try:
+        asyncio.run(BuildServer(jobs, out_dir or DEFAULT_OUT_DIR, host, port, workers).run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    return 0
@@ -0,0 +1,260 @@
+"""
+Extract Chart.js charts from inline <script> text
+Parses the object literals passed to `new Chart(ctx, {...})` (plus any
+`const name = {...}` objects they reference, e.g. a color scheme) with a small
+JavaScript-literal reader, then maps each config onto a deck-spec chart dict.
+Functions such as tooltip callbacks are skipped.
+"""
+
+import re
+from collections import deque
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*"|`(?:\\.|[^`\\])*`)
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*)
+  | (?P<arrow>=>)
+  | (?P<punct>[{}\[\]():,])
+  | (?P<other>.)
+""", re.VERBOSE | re.DOTALL)
+
+_CLOSERS = {"{": "}", "[": "]", "(": ")"}
+
+_CONSTANTS = {"true": True, "false": False, "null": None, "undefined": None}
+
+_OBJECT_DECLARATION = re.compile(r"\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*(?=[{\[])")
+_CANVAS_LOOKUP = re.compile(
+    r"\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*document\.getElementById\(\s*['\"]([^'\"]+)['\"]\s*\)")
+_NEW_CHART = re.compile(r"\bnew\s+Chart\s*\(\s*([A-Za-z_$][\w$.]*)\s*,\s*")
+_LINE_COMMENT = re.compile(r"^\s*//\s*(.+?)\s*$")
+
+_UNESCAPE = re.compile(r"\\(.)", re.DOTALL)
+
+
+class _Reader:
+    """Recursive-descent reader for JavaScript object/array literals"""
+
+    def __init__(self, text, pos, env):
+        self.env = env
+        # Tokenize lazily: a literal is usually a small part of a long script
+        self._matches = _TOKEN.finditer(text, pos)
+        self._buffer = deque()
+
+    def _peek(self, offset=0):
+        while len(self._buffer) <= offset:
+            match = next(self._matches, None)
+            if match is None:
+                self._buffer.append((None, None))
+            elif match.lastgroup != "space":
+                self._buffer.append((match.lastgroup, match.group()))
+        return self._buffer[offset]
+
+    def _next(self):
+        token = self._peek()
+        self._buffer.popleft()
+        return token
+
+    def value(self):
+        kind, text = self._peek()
+        if text == "{":
+            return self._object()
+        if text == "[":
+            return self._array()
+        if kind == "string":
+            self._next()
+            if self._peek()[1] in (",", "}", "]", None):
+                return _UNESCAPE.sub(r"\1", text[1:-1])
+        elif kind == "number":
+            self._next()
+            if self._peek()[1] in (",", "}", "]", None):
+                return float(text) if any(c in text for c in ".eE") else int(text)
+        elif kind == "name" and self._lookahead_is_value_end():
+            self._next()
+            if text in _CONSTANTS:
+                return _CONSTANTS[text]
+            return self._resolve(text)
+        # Anything else (functions, arithmetic, calls) is skipped
+        self._skip_expression()
+        return None
+
+    def _lookahead_is_value_end(self):
+        return self._peek(1)[1] in (",", "}", "]", None)
+
+    def _resolve(self, dotted):
+        value = self.env
+        for part in dotted.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return None
+            value = value[part]
+        return value
+
+    def _skip_expression(self):
+        """Consume tokens up to the next top-level ',' or closing bracket"""
+        depth = 0
+        while True:
+            kind, text = self._peek()
+            if text is None:
+                return
+            if depth == 0 and text in (",", "}", "]", ")"):
+                return
+            if text in _CLOSERS:
+                depth += 1
+            elif text in ("}", "]", ")"):
+                depth -= 1
+            self._next()
+
+    def _object(self):
+        self._next()  # {
+        result = {}
+        while True:
+            kind, text = self._next()
+            if text in ("}", None):
+                return result
+            if text == ",":
+                continue
+            key = _UNESCAPE.sub(r"\1", text[1:-1]) if kind == "string" else text
+            if self._peek()[1] == ":":
+                self._next()
+                result[key] = self.value()
+            elif self._peek()[1] == "(":
+                # method shorthand: name(args) { ... }
+                self._skip_expression()
+            else:
+                result[key] = self._resolve(key)  # {name} shorthand
+
+    def _array(self):
+        self._next()  # [
+        result = []
+        while True:
+            text = self._peek()[1]
+            if text in ("]", None):
+                self._next()
+                return result
+            if text == ",":
+                self._next()
+                continue
+            result.append(self.value())
+
+
+def parse_literal(text, pos=0, env=None):
+    """Parse the JavaScript object/array literal starting at text[pos]"""
+    return _Reader(text, pos, env or {}).value()
+
+
+def _comment_before(script, pos):
+    """The // comment on the line just above pos, if any"""
+    for line in reversed(script[:pos].rstrip().splitlines()):
+        match = _LINE_COMMENT.match(line)
+        if match:
+            return match.group(1)
+        if line.strip():
+            return None
+    return None
+
+
+def extract_chart_configs(script):
+    """Yield (canvas id, comment title, config dict) for every `new Chart(...)` call"""
+    env = {}
+    for match in _OBJECT_DECLARATION.finditer(script):
+        value = parse_literal(script, match.end(), env)
+        if value is not None:
+            env[match.group(1)] = value
+    canvases = {m.group(1): (m.group(2), m.start()) for m in _CANVAS_LOOKUP.finditer(script)}
+
+    for match in _NEW_CHART.finditer(script):
+        config = parse_literal(script, match.end(), env)
+        if not isinstance(config, dict):
+            continue
+        canvas_id, declared_at = canvases.get(match.group(1), (match.group(1), match.start()))
+        yield canvas_id, _comment_before(script, declared_at), config
+
+
+_HEX = re.compile(r"#([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$")
+_RGB = re.compile(r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)")
+
+
+def css_color(value):
+    """#RGB, #RRGGBB or rgb()/rgba() as a #RRGGBB string (None if unsupported)"""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    match = _HEX.match(value)
+    if match:
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = "".join(c * 2 for c in digits)
+        return "#" + digits.upper()
+    match = _RGB.match(value)
+    if match:
+        return "#" + "".join(f"{int(c):02X}" for c in match.groups())
+    return None
+
+
+def _get(config, *path):
+    for key in path:
+        if not isinstance(config, dict):
+            return None
+        config = config.get(key)
+    return config
+
+
+def _axis_title(config, axis):
+    title = _get(config, "options", "scales", axis, "title")
+    if isinstance(title, dict) and title.get("display", True) and title.get("text"):
+        return title["text"]
+    return None
+
+
+def chart_spec(config):
+    """Map a Chart.js config onto a deck-spec chart dict (None if unsupported)"""
+    kind = config.get("type")
+    horizontal = _get(config, "options", "indexAxis") == "y"
+    if kind == "bar":
+        chart_type = "bar" if horizontal else "column"
+    elif kind in ("line", "pie", "doughnut"):
+        chart_type = kind
+    else:
+        return None
+
+    series = []
+    for dataset in _get(config, "data", "datasets") or []:
+        values = [v if isinstance(v, (int, float)) else None for v in dataset.get("data") or []]
+        entry = {"name": dataset.get("label") or f"Series {len(series) + 1}", "values": values}
+        fill = dataset.get("backgroundColor")
+        if isinstance(fill, list):
+            colors = [css_color(c) for c in fill]
+            if all(colors):
+                entry["colors"] = colors
+        elif css_color(fill):
+            entry["color"] = css_color(fill)
+        if css_color(dataset.get("borderColor")):
+            entry["line_color"] = css_color(dataset.get("borderColor"))
+        series.append(entry)
+    if not series:
+        return None
+
+    spec = {
+        "type": chart_type,
+        "categories": [str(label) for label in _get(config, "data", "labels") or []],
+        "series": series,
+        "legend": _get(config, "options", "plugins", "legend", "display") is not False,
+    }
+    value_title = _axis_title(config, "x" if horizontal else "y")
+    if value_title and chart_type in ("bar", "column", "line"):
+        spec["value_axis_title"] = value_title
+    return spec
+
+
+def chart_slide_specs(script):
+    """Deck-spec slides (one chart each) for every supported chart in script"""
+    slides = []
+    for canvas_id, comment, config in extract_chart_configs(script):
+        spec = chart_spec(config)
+        if spec is None:
+            continue
+        title = comment or spec["series"][0]["name"]
+        if title.lower().endswith(" chart"):
+            title = title[:-len(" chart")]
+        slides.append({"id": canvas_id, "layout": "title_only", "title": title, "charts": [spec]})
+    return slides
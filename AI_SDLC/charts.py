@@ -0,0 +1,231 @@
+"""
+Native PPTX charts for deck-spec slides
+Each chart (chart XML plus its embedded workbook) is built once in a scratch
+presentation, keyed by a hash of its resolved spec and stored in a
+content-addressed cache. Decks prerender all their charts across a process
+pool; slides then attach the ready-made parts instead of building charts inline.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import zipfile
+import weakref
+from collections import namedtuple
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import PackURI
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+from pptx.util import Pt
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Bump when build_chart_parts() output changes
+CHART_VERSION = "2"
+
+# xlsxwriter stamps each workbook with the time it was written; charts use this
+# instead so their parts depend only on the spec (reproducible builds)
+WORKBOOK_DATE = b"1980-01-01T00:00:00Z"
+WORKBOOK_DATES = re.compile(rb"(<dcterms:(created|modified)[^>]*>)[^<]*(</dcterms:\2>)")
+
+DEFAULT_CACHE_DIR = os.path.join(HERE, "build", ".cache", "charts")
+
+CHART_TYPES = {
+    "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "line": XL_CHART_TYPE.LINE_MARKERS,
+    "pie": XL_CHART_TYPE.PIE,
+    "doughnut": XL_CHART_TYPE.DOUGHNUT,
+}
+
+# Chart types with category/value axes
+AXIS_TYPES = {"bar", "column", "line"}
+
+# package -> {partname template: next number}; chart and workbook parts are numbered from here
+_package_partnames = weakref.WeakKeyDictionary()
+
+# Chart parts ready to attach: chart XML and embedded xlsx workbook bytes
+ChartParts = namedtuple("ChartParts", ["chart_xml", "xlsx_blob"])
+
+
+def chart_key(spec):
+    """Content hash of a resolved chart spec (colors as #RRGGBB)"""
+    canonical = json.dumps(spec, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"{CHART_VERSION}\0{canonical}".encode("utf-8")).hexdigest()
+
+
+def _rgb(value):
+    return RGBColor.from_string(value.lstrip("#"))
+
+
+def build_chart_parts(spec):
+    """Build one chart in a scratch presentation and capture its parts"""
+    chart_type = spec["type"]
+    data = CategoryChartData()
+    data.categories = spec["categories"]
+    for series in spec["series"]:
+        data.add_series(series["name"], series["values"])
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    chart = slide.shapes.add_chart(CHART_TYPES[chart_type], 0, 0, 0, 0, data).chart
+
+    chart.has_legend = bool(spec.get("legend", len(spec["series"]) > 1))
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    plot = chart.plots[0]
+    if spec.get("data_labels"):
+        plot.has_data_labels = True
+        plot.data_labels.font.size = Pt(12)
+    for series_spec, series in zip(spec["series"], plot.series):
+        if series_spec.get("color"):
+            series.format.fill.solid()
+            series.format.fill.fore_color.rgb = _rgb(series_spec["color"])
+        for index, color in enumerate(series_spec.get("colors") or ()):
+            fill = series.points[index].format.fill
+            fill.solid()
+            fill.fore_color.rgb = _rgb(color)
+        if series_spec.get("line_color"):
+            series.format.line.color.rgb = _rgb(series_spec["line_color"])
+
+    if chart_type in AXIS_TYPES:
+        chart.category_axis.tick_labels.font.size = Pt(12)
+        value_axis = chart.value_axis
+        value_axis.has_major_gridlines = True
+        if spec.get("value_axis_title"):
+            value_axis.has_title = True
+            title_tf = value_axis.axis_title.text_frame
+            title_tf.text = spec["value_axis_title"]
+            title_tf.paragraphs[0].font.size = Pt(14)
+            title_tf.paragraphs[0].font.bold = True
+
+    parts = capture_chart_parts(chart.part)
+    return parts._replace(xlsx_blob=_fixed_workbook_dates(parts.xlsx_blob))
+
+
+def _fixed_workbook_dates(xlsx_blob):
+    """The workbook with its created/modified dates set to WORKBOOK_DATE"""
+    output = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(xlsx_blob)) as source, zipfile.ZipFile(output, "w") as target:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == "docProps/core.xml":
+                data = WORKBOOK_DATES.sub(lambda m: m.group(1) + WORKBOOK_DATE + m.group(3), data)
+            target.writestr(info, data)
+    return output.getvalue()
+
+
+def capture_chart_parts(chart_part):
+    """ChartParts for an existing chart part (its XML is left untouched)"""
+    xlsx_blob = chart_part.chart_workbook.xlsx_part.blob
+    # The workbook relationship is recreated when the parts are attached
+    chart_space = deepcopy(chart_part._element)
+    chart_space.remove(chart_space.externalData)
+    return ChartParts(serialize_part_xml(chart_space), xlsx_blob)
+
+
+class ChartCache:
+    """Content-addressed on-disk store of built chart parts"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".xml", base + ".xlsx"
+
+    def get(self, key):
+        xml_path, xlsx_path = self._paths(key)
+        try:
+            with open(xml_path, "rb") as f:
+                chart_xml = f.read()
+            with open(xlsx_path, "rb") as f:
+                return ChartParts(chart_xml, f.read())
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, parts):
+        xml_path, xlsx_path = self._paths(key)
+        os.makedirs(os.path.dirname(xml_path), exist_ok=True)
+        # xlsx first: get() treats a present .xml as a complete entry
+        for path, blob in ((xlsx_path, parts.xlsx_blob), (xml_path, parts.chart_xml)):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+
+
+# Parts already built or loaded by this process, by chart key
+_parts = {}
+
+
+def prerender_charts(charts, workers=None, cache=None):
+    """Make sure every (key, spec) in charts has parts, building misses in parallel"""
+    cache = cache or ChartCache()
+    missing = {}
+    for key, spec in charts:
+        if key in _parts or key in missing:
+            continue
+        parts = cache.get(key)
+        if parts is None:
+            missing[key] = spec
+        else:
+            _parts[key] = parts
+    if not missing:
+        return
+
+    workers = min(workers or os.cpu_count() or 1, len(missing))
+    if workers <= 1:
+        built = map(build_chart_parts, missing.values())
+        for key, parts in zip(missing, built):
+            cache.put(key, parts)
+            _parts[key] = parts
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for key, parts in zip(missing, pool.map(build_chart_parts, missing.values())):
+            cache.put(key, parts)
+            _parts[key] = parts
+
+
+def _next_partname(package, tmpl):
+    """package.next_partname(tmpl) without walking every part of the package each time"""
+    counters = _package_partnames.setdefault(package, {})
+    n = counters.get(tmpl)
+    if n is None:
+        n = int(re.search(r"(\d+)\.\w+$", package.next_partname(tmpl)).group(1))
+    counters[tmpl] = n + 1
+    return PackURI(tmpl % n)
+
+
+def new_chart_part(package, parts):
+    """A chart part (with its embedded workbook) in package, from ChartParts"""
+    chart_part = ChartPart.load(_next_partname(package, ChartPart.partname_template),
+                                CT.DML_CHART, package, parts.chart_xml)
+    chart_part.chart_workbook.xlsx_part = EmbeddedXlsxPart(
+        _next_partname(package, EmbeddedXlsxPart.partname_template), EmbeddedXlsxPart.content_type,
+        package, parts.xlsx_blob)
+    return chart_part
+
+
+def add_chart(slide, left, top, width, height, key, spec):
+    """Attach a chart (built on demand if it was not prerendered) to a slide"""
+    parts = _parts.get(key)
+    if parts is None:
+        prerender_charts([(key, spec)], workers=1)
+        parts = _parts[key]
+    rId = slide.part.relate_to(new_chart_part(slide.part.package, parts), RT.CHART)
+    graphic_frame = slide.shapes._add_chart_graphicFrame(rId, left, top, width, height)
+    slide.shapes._recalculate_extents()
+    return graphic_frame
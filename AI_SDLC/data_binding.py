@@ -0,0 +1,329 @@
+"""
+Bind deck specs to live metric data from local CSV, JSON and SQLite sources
+A spec's "data" section names its sources; any spec string can then use
+{{name.key.field}} placeholders (with an optional :format spec) and tables or
+charts can take "data": name instead of a file. SQLite is read through a pool
+of read-only connections and every query result is cached per database
+version. A source with a "partition" column is loaded once for all values of
+that parameter, so per-team variants come from a single bulk query pass.
+
+    "data": {
+      "delivery": {"source": "assets/data/delivery.json"},
+      "kpis": {"source": "assets/data/kpis.csv", "key": "metric"},
+      "teams": {"source": "assets/data/metrics.db", "key": "metric", "partition": "team",
+                "query": "SELECT team, metric, value FROM kpi"}
+    }
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from spec_source import asset_path
+
+PLACEHOLDER = re.compile(r"\{\{\s*([^{}:]+?)\s*(?::([^{}]*))?\}\}")
+
+# Stands in for placeholder n in a template (U+2063 INVISIBLE SEPARATOR never occurs in spec text)
+MARKER = "\u2063{}\u2063"
+MARKER_PATTERN = re.compile("\u2063(\\d+)\u2063")
+
+# Idle connections kept per database file
+POOL_SIZE = 4
+
+# Spec keys whose values stay numbers when given as a lone placeholder; every other field is text
+NATIVE_FIELDS = frozenset({"percent", "rows", "values", "left", "top", "width", "height", "row_height",
+                           "font_size"})
+
+
+class DataBindingError(ValueError):
+    """Raised when a data source or placeholder cannot be resolved"""
+
+
+class ConnectionPool:
+    """Read-only SQLite connections, reused per database file"""
+
+    def __init__(self, size=POOL_SIZE):
+        self.size = size
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, path):
+        with self._lock:
+            idle = self._idle.setdefault(path, [])
+            conn = idle.pop() if idle else None
+        if conn is None:
+            if not os.path.isfile(path):
+                raise DataBindingError(f"No such database: {path}")
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                idle = self._idle.setdefault(path, [])
+                if len(idle) < self.size:
+                    idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_pool = None
+_results = {}
+
+
+def default_pool():
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool()
+    return _pool
+
+
+def _version(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def query(path, sql, params=None, pool=None):
+    """DataTable for a SQLite query with named :params; cached until the file changes"""
+    from metrics import DataTable
+
+    params = params or {}
+    key = (path, _version(path), sql, tuple(sorted(params.items())))
+    table = _results.get(key)
+    if table is None:
+        with (pool or default_pool()).connection(path) as conn:
+            cursor = conn.execute(sql, params)
+            columns = tuple(d[0] for d in cursor.description or ())
+            table = _results[key] = DataTable(columns, tuple(cursor.fetchall()))
+    return table
+
+
+def clear_cache():
+    """Forget cached query results (files are re-read when they change anyway)"""
+    _results.clear()
+
+
+def _as_records(table, key=None):
+    """Rows as dicts: {key value: row} when key is given, else a list"""
+    rows = [dict(zip(table.columns, row)) for row in table.rows]
+    if key is None:
+        return rows
+    if key not in table.columns:
+        raise DataBindingError(f"Unknown key column: {key}")
+    return {str(row[key]): row for row in rows}
+
+
+class DataContext:
+    """A spec's data sources, each loaded at most once (lazily) for any number of bindings"""
+
+    def __init__(self, sources, base_dir=None, pool=None):
+        self.sources = sources
+        self.base_dir = base_dir
+        self.pool = pool
+        self._loaded = {}
+        self._values = {}
+
+    def paths(self):
+        """Files behind every source (they belong in a build's cache key)"""
+        return [asset_path(self.base_dir, source["source"]) for source in self.sources.values()]
+
+    def table(self, name, params):
+        """DataTable of a source for the given parameters (its partition, if it has one)"""
+        from metrics import DataTable
+
+        partition = self._source(name).get("partition")
+        loaded, columns = self._load(name, params)
+        if partition is None:
+            return loaded
+        if partition not in params:
+            raise DataBindingError(f"Data source {name} needs parameter {partition}")
+        return loaded.get(str(params[partition]), DataTable(columns, ()))
+
+    def value(self, name, params):
+        """What {{name...}} placeholders look up: a mapping, list or scalar"""
+        key = (name, tuple(sorted((k, str(v)) for k, v in params.items())))
+        if key in self._values:
+            return self._values[key]
+        source = self._source(name)
+        path = asset_path(self.base_dir, source["source"])
+        data = None
+        if path.endswith(".json") and "query" not in source:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        if data is None or _is_table_json(data):
+            data = _as_records(self.table(name, params), source.get("key"))
+        self._values[key] = data
+        return data
+
+    def partitions(self, name, params=None):
+        """The partition values present in a partitioned source"""
+        return sorted(self._load(name, params or {})[0])
+
+    def _source(self, name):
+        try:
+            return self.sources[name]
+        except KeyError:
+            raise DataBindingError(f"Unknown data source: {name}") from None
+
+    def _load(self, name, params):
+        """(table or {partition value: table}, columns), loaded once per set of query parameters"""
+        from metrics import DataTable, load_table
+
+        source = self._source(name)
+        sql = source.get("query")
+        # Only parameters the query names are bound, so a partitioned query runs once for all values
+        wanted = {k: v for k, v in params.items() if sql and re.search(rf":{re.escape(k)}\b", sql)}
+        cache_key = (name, tuple(sorted(wanted.items())))
+        loaded = self._loaded.get(cache_key)
+        if loaded is not None:
+            return loaded
+
+        path = asset_path(self.base_dir, source["source"])
+        table = query(path, sql, wanted, self.pool) if sql else load_table(path)
+        partition = source.get("partition")
+        if partition is None:
+            loaded = (table, table.columns)
+        elif partition not in table.columns:
+            raise DataBindingError(f"Data source {name} has no partition column {partition}")
+        else:
+            index = table.columns.index(partition)
+            groups = {}
+            for row in table.rows:
+                groups.setdefault(str(row[index]), []).append(row)
+            loaded = ({k: DataTable(table.columns, tuple(v)) for k, v in groups.items()}, table.columns)
+        self._loaded[cache_key] = loaded
+        return loaded
+
+
+def _is_table_json(data):
+    return isinstance(data, list) or (isinstance(data, dict) and "columns" in data and "rows" in data)
+
+
+def _lookup(context, path, params):
+    name, *keys = [part.strip() for part in path.split(".")]
+    value = params[name] if name in params and name not in context.sources else context.value(name, params)
+    for key in keys:
+        try:
+            value = value[int(key)] if isinstance(value, list) else value[key]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise DataBindingError(f"No value for {{{{{path}}}}}") from None
+    return value
+
+
+def _render(text, context, params, native=False):
+    """text with placeholders filled; with native, a lone placeholder keeps its value's type"""
+    match = PLACEHOLDER.fullmatch(text.strip())
+    if match and not match.group(2):
+        value = _lookup(context, match.group(1), params)
+        return value if native else str(value)
+
+    def replace(m):
+        value = _lookup(context, m.group(1), params)
+        return format(value, m.group(2)) if m.group(2) else str(value)
+    return PLACEHOLDER.sub(replace, text)
+
+
+def _bind_table(item, context, params):
+    """A table/chart item with "data": name replaced by inline columns and rows"""
+    from metrics import select_columns
+
+    table = context.table(item["data"], params)
+    if item.get("columns"):
+        table = select_columns(table, item["columns"])
+    bound = {k: v for k, v in item.items() if k != "data"}
+    bound["columns"], bound["rows"] = list(table.columns), [list(row) for row in table.rows]
+    return bound
+
+
+def _bind(value, context, params, native=False):
+    """value with placeholders filled; native is set below NATIVE_FIELDS keys"""
+    if isinstance(value, str):
+        return _render(value, context, params, native) if "{{" in value else value
+    if isinstance(value, list):
+        return [_bind(v, context, params, native) for v in value]
+    if isinstance(value, dict):
+        if "data" in value and isinstance(value["data"], str):
+            value = _bind_table(value, context, params)
+        return {k: _bind(v, context, params, k in NATIVE_FIELDS) for k, v in value.items()}
+    return value
+
+
+def bind_spec(spec, params=None, context=None):
+    """A copy of spec with its data placeholders and data tables resolved
+
+    params override the spec's own "params" (e.g. {"team": "NXOP"}). Pass
+    the same DataContext to bind many variants from one load of each source.
+    """
+    context = context or DataContext(spec.get("data", {}), spec.get("base_dir"))
+    params = dict(spec.get("params", {}), **(params or {}))
+    bound = {k: v for k, v in spec.items() if k not in ("data", "slides")}
+    bound["params"] = params
+    try:
+        bound["slides"] = _bind(spec.get("slides", []), context, params)
+    except (OSError, sqlite3.Error) as exc:
+        raise DataBindingError(str(exc)) from None
+    return bound
+
+
+def variant_values(context, name, params=None):
+    """Every value of parameter name found in the context's partitioned sources"""
+    found = set()
+    for source_name, source in context.sources.items():
+        if source.get("partition") == name:
+            found.update(context.partitions(source_name, params))
+    return sorted(found)
+
+
+def bind_template(spec):
+    """(template spec, fields): spec with every placeholder replaced by a numbered marker
+
+    fields[n] is the placeholder text marker n stands for, so one rendering of
+    the template can be patched with field_values() for any parameters. Slides
+    that take a data table are None in the template: their rows, not just
+    their text, depend on the data.
+    """
+    fields = []
+
+    def mark(match):
+        fields.append(match.group(0))
+        return MARKER.format(len(fields) - 1)
+
+    def template(value):
+        if isinstance(value, str):
+            return PLACEHOLDER.sub(mark, value) if "{{" in value else value
+        if isinstance(value, list):
+            return [template(v) for v in value]
+        if isinstance(value, dict):
+            return {k: template(v) for k, v in value.items()}
+        return value
+
+    bound = {k: v for k, v in spec.items() if k not in ("data", "slides")}
+    bound["slides"] = [None if _has_data_table(slide) else template(slide) for slide in spec.get("slides", [])]
+    return bound, fields
+
+
+def _has_data_table(value):
+    if isinstance(value, list):
+        return any(_has_data_table(v) for v in value)
+    if isinstance(value, dict):
+        return isinstance(value.get("data"), str) or any(_has_data_table(v) for v in value.values())
+    return False
+
+
+def field_values(fields, context, params):
+    """The text each bind_template() field stands for under params"""
+    try:
+        return [str(_render(field, context, params)) for field in fields]
+    except (OSError, sqlite3.Error) as exc:
+        raise DataBindingError(str(exc)) from None
@@ -0,0 +1,394 @@
+"""
+Command line for every deck: build, export, list, validate and diff
+DECK arguments are deck names (as shown by `list`) or paths to a deck spec or
+Reveal.js index.html; with none, a command covers every deck batch_build finds.
+diff also takes built .pptx files (see pptx_diff).
+
+    python deck_cli.py build [DECK ...] [--out DIR] [--workers N] [--no-cache] [--compression MODE] [--reproducible]
+    python deck_cli.py export [DECK ...] [--formats pptx,pdf,png] [--out DIR] [--changed-only]
+    python deck_cli.py fan-out DECK --param NAME [--values A,B] [--out DIR] [--workers N] [--compression MODE]
+    python deck_cli.py recompress FILE.pptx ... [--compression MODE] [--out DIR]
+    python deck_cli.py serve [DECK ...] [--port 8000] [--out DIR] [--workers N]
+    python deck_cli.py microsite [SITE ...] [--out DIR] [--force] [--no-minify]
+    python deck_cli.py list [DECK ...]
+    python deck_cli.py validate [DECK ...] [--strict]
+    python deck_cli.py diff OLD NEW   (decks, or .pptx files: a deck is built to compare it with one)
+
+python-pptx is only imported by commands that compile, render or write packages
+(build, export, fan-out, recompress, serve and validate, and diff given a deck and a
+.pptx); list and diff of two specs read specs alone and start in a few tens of ms.
+"""
+
+import argparse
+import os
+import sys
+
+from batch_build import COMPRESSION_CHOICES, HERE, DeckJob, discover_jobs
+from spec_source import HTML_EXTENSIONS, load_source, slide_id, slide_layout
+
+# Spec keys that describe where a deck came from rather than what it contains
+LOCATION_KEYS = ("base_dir",)
+
+
+class DeckNotFound(LookupError):
+    """Raised when a DECK argument is neither a known deck nor a file"""
+
+
+def resolve_decks(names, out_dir=None):
+    """DeckJobs for names (deck names or source paths); all decks when empty"""
+    jobs = discover_jobs(HERE, out_dir)
+    if not names:
+        return jobs
+    out_dir = out_dir or os.path.join(HERE, "build")
+    by_name = {job.name: job for job in jobs}
+    selected = []
+    for name in names:
+        if name in by_name:
+            selected.append(by_name[name])
+        elif os.path.isfile(name):
+            source = os.path.abspath(name)
+            if source.endswith(HTML_EXTENSIONS):
+                kind, deck_name = "html", os.path.basename(os.path.dirname(source))
+            else:
+                kind, deck_name = "spec", os.path.splitext(os.path.basename(source))[0]
+            selected.append(DeckJob(deck_name, source, kind, os.path.join(out_dir, f"{deck_name}.pptx")))
+        else:
+            raise DeckNotFound(f"Unknown deck: {name}")
+    return selected
+
+
+def cmd_build(args):
+    from batch_build import build_all, reproducible_epoch
+
+    if args.reproducible:
+        os.environ["SOURCE_DATE_EPOCH"] = str(reproducible_epoch())
+    return build_all(resolve_decks(args.decks, args.out), args.workers, not args.no_cache, args.report,
+                     args.compression)
+
+
+def cmd_export(args):
+    from deck_spec import compile_deck
+    from exporters import export_deck
+
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    out_dir = args.out or os.path.join(HERE, "build", "export")
+    failures = 0
+    for job in resolve_decks(args.decks):
+        deck = compile_deck(load_source(job.source, job.name))
+        done = _export_if_changed(deck, out_dir, formats, job.name) if args.changed_only else None
+        if done is not None and set(done) >= set(formats):
+            print(f"✓ {job.name}: PPTX unchanged, skipped {', '.join(f for f in formats if f != 'pptx') or 'nothing'}")
+            continue
+        for result in export_deck(deck, out_dir, formats, job.name, done).values():
+            if result.error:
+                failures += 1
+                print(f"✗ {job.name} [{result.format}]: {result.error}")
+            else:
+                where = result.paths[0] if len(result.paths) == 1 else os.path.dirname(result.paths[0])
+                print(f"✓ {job.name} [{result.format}]: {len(result.paths)} file(s) in "
+                      f"{result.seconds:.2f}s -> {where}")
+    return 1 if failures else 0
+
+
+def _export_if_changed(deck, out_dir, formats, name):
+    """Export the PPTX alone and compare it with the previous export
+
+    Returns {format: ExportResult} of what export_deck need not redo: only the
+    PPTX when it changed or is new, every format when it is unchanged.
+    """
+    from exporters import export_deck
+    from pptx_diff import same_content, summarize
+
+    path = os.path.join(out_dir, f"{name}.pptx")
+    previous = summarize(path) if os.path.isfile(path) else None
+    done = export_deck(deck, out_dir, ["pptx"], name)
+    if previous is None or done["pptx"].error or not same_content(previous, summarize(path)):
+        return done
+    return dict.fromkeys(formats, done["pptx"])
+
+
+def cmd_fan_out(args):
+    import time
+
+    from fan_out import fan_out
+
+    start = time.perf_counter()
+    job, = resolve_decks([args.deck])
+    values = [v.strip() for v in args.values.split(",")] if args.values else None
+    out_dir = args.out or os.path.join(HERE, "build", "fan_out")
+    results = fan_out(load_source(job.source, job.name), args.param, values, out_dir, args.workers,
+                      compression=args.compression)
+    if not results:
+        print(f"✗ {job.name}: no values for {args.param}")
+        return 1
+    for result in results:
+        print(f"✓ {result.value}: {result.rendered} rendered, {result.patched} patched, "
+              f"{result.reused} shared in {result.seconds:.2f}s -> {result.path}")
+    print(f"✓ {job.name}: {len(results)} decks in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+def cmd_recompress(args):
+    from streaming_writer import recompress
+
+    total_in = total_out = 0
+    for path in args.files:
+        output_path = os.path.join(args.out, os.path.basename(path)) if args.out else None
+        if output_path:
+            os.makedirs(args.out, exist_ok=True)
+        result = recompress(path, output_path, args.compression)
+        total_in, total_out = total_in + result.input_bytes, total_out + result.output_bytes
+        print(f"✓ {result.path}: {result.input_bytes / 1024:,.0f} KB -> {result.output_bytes / 1024:,.0f} KB "
+              f"({_saving(result.input_bytes, result.output_bytes)}) in {result.seconds:.2f}s")
+    if len(args.files) > 1:
+        print(f"✓ {len(args.files)} files: {total_in / 1024:,.0f} KB -> {total_out / 1024:,.0f} KB "
+              f"({_saving(total_in, total_out)})")
+    return 0
+
+
+def _saving(before, after):
+    return f"{(before - after) / before:+.1%} saved" if before else "empty"
+
+
+def resolve_sites(names, out_dir=None):
+    """SiteJobs for names (site names, data files or folders holding one); all sites when empty"""
+    from microsite import DEFAULT_OUT_DIR, SiteJob, discover_sites, site_data_file
+
+    out_dir = out_dir or DEFAULT_OUT_DIR
+    jobs = discover_sites(HERE, out_dir)
+    if not names:
+        return jobs
+    by_name = {job.name: job for job in jobs}
+    selected = []
+    for name in names:
+        if name in by_name:
+            selected.append(by_name[name])
+            continue
+        data = site_data_file(name) if os.path.isdir(name) else name if os.path.isfile(name) else None
+        if data is None:
+            raise DeckNotFound(f"Unknown microsite: {name}")
+        data = os.path.abspath(data)
+        site_name = os.path.basename(os.path.dirname(data))
+        selected.append(SiteJob(site_name, data, os.path.join(out_dir, site_name)))
+    return selected
+
+
+def cmd_microsite(args):
+    import time
+
+    from microsite import build_sites
+
+    start = time.perf_counter()
+    jobs = resolve_sites(args.sites, args.out)
+    if not jobs:
+        print("No microsites found (add a site.json to a presentations/ folder)")
+        return 0
+    failures = 0
+    for result in build_sites(jobs, minify=not args.no_minify, force=args.force):
+        if result.error:
+            failures += 1
+            print(f"✗ {result.name} failed after {result.seconds:.2f}s")
+            print(result.error.rstrip())
+            continue
+        print(f"✓ {result.name}: {result.files} files, {result.bytes / 1024:,.0f} KB in {result.seconds:.3f}s "
+              f"[{result.cache}] -> {result.output}")
+        for warning in result.warnings:
+            print(f"  ⚠ {warning}")
+    print(f"✓ {len(jobs) - failures}/{len(jobs)} microsites built in {time.perf_counter() - start:.2f}s")
+    return 1 if failures else 0
+
+
+def cmd_serve(args):
+    from build_server import serve
+    return serve(resolve_decks(args.decks), args.out, args.host, args.port, args.workers)
+
+
+def cmd_list(args):
+    for job in resolve_decks(args.decks):
+        slides = load_source(job.source, job.name).get("slides", [])
+        print(f"{job.name} ({len(slides)} slides) {os.path.relpath(job.source)}")
+        for index, slide_spec in enumerate(slides):
+            print(f"  {index + 1:>3}  {slide_id(slide_spec, index):<24} "
+                  f"{slide_layout(slide_spec):<14} {slide_spec.get('title') or ''}")
+    return 0
+
+
+def cmd_validate(args):
+    from deck_spec import compile_deck
+
+    failures = 0
+    for job in resolve_decks(args.decks):
+        try:
+            deck = compile_deck(load_source(job.source, job.name))
+        except Exception as exc:
+            print(f"✗ {job.name}: {exc}")
+            failures += 1
+            continue
+        problems = [f"{slide.id}: missing image {image.path}"
+                    for slide in deck.slides for image in slide.images if not os.path.isfile(image.path)]
+        warnings = deck.fit_log
+        if problems or (args.strict and warnings):
+            failures += 1
+            print(f"✗ {job.name}: {len(deck.slides)} slides")
+        else:
+            print(f"✓ {job.name}: {len(deck.slides)} slides")
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        for warning in warnings:
+            print(f"  ⚠ {warning}")
+    return 1 if failures else 0
+
+
+def diff_specs(old, new):
+    """Describe how deck spec new differs from old; one line per change"""
+    lines = []
+    settings = sorted(key for key in set(old) | set(new)
+                      if key != "slides" and key not in LOCATION_KEYS and old.get(key) != new.get(key))
+    if settings:
+        lines.append(f"~ deck: {', '.join(settings)}")
+
+    old_slides = {slide_id(s, i): s for i, s in enumerate(old.get("slides", []))}
+    new_slides = {slide_id(s, i): s for i, s in enumerate(new.get("slides", []))}
+    for key, slide_spec in old_slides.items():
+        if key not in new_slides:
+            lines.append(f"- {key}  {slide_spec.get('title') or ''}".rstrip())
+    for key, slide_spec in new_slides.items():
+        if key not in old_slides:
+            lines.append(f"+ {key}  {slide_spec.get('title') or ''}".rstrip())
+        elif slide_spec != old_slides[key]:
+            before = old_slides[key]
+            fields = sorted(f for f in set(before) | set(slide_spec) if before.get(f) != slide_spec.get(f))
+            lines.append(f"~ {key}: {', '.join(fields)}")
+
+    kept_old = [key for key in old_slides if key in new_slides]
+    kept_new = [key for key in new_slides if key in old_slides]
+    if kept_old != kept_new:
+        lines.append("~ slide order changed")
+    return lines
+
+
+def _built_pptx(name, folder):
+    """Path of a .pptx to compare for name: the file itself, or the deck built into folder"""
+    if name.lower().endswith(".pptx"):
+        if not os.path.isfile(name):
+            raise DeckNotFound(f"No such file: {name}")
+        return name
+    from build_cache import SPEC_GENERATOR_MODULES, generator_digest
+    from deck_spec import compile_deck
+    from slide_graph import build_graph, deck_graph
+
+    job, = resolve_decks([name])
+    path = os.path.join(folder, f"{len(os.listdir(folder))}-{job.name}.pptx")
+    graph = deck_graph(compile_deck(load_source(job.source, job.name)), generator_digest(SPEC_GENERATOR_MODULES))
+    build_graph(graph, path)
+    return path
+
+
+def cmd_diff_pptx(args):
+    import tempfile
+
+    from pptx_diff import diff_packages, format_diff
+
+    with tempfile.TemporaryDirectory(prefix="diff-") as folder:
+        diff = diff_packages(_built_pptx(args.old, folder), _built_pptx(args.new, folder))
+    for line in format_diff(diff):
+        print(line)
+    if diff.identical:
+        print("✓ No differences")
+    return 0 if diff.identical else 1
+
+
+def cmd_diff(args):
+    if args.old.lower().endswith(".pptx") or args.new.lower().endswith(".pptx"):
+        return cmd_diff_pptx(args)
+    old_job, new_job = resolve_decks([args.old, args.new])
+    lines = diff_specs(load_source(old_job.source, old_job.name), load_source(new_job.source, new_job.name))
+    for line in lines:
+        print(line)
+    if not lines:
+        print("✓ No differences")
+    return 1 if lines else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Build, export, list, validate and diff presentation decks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="render decks to PPTX (through the build cache)")
+    build.add_argument("decks", nargs="*", metavar="DECK")
+    build.add_argument("--out", help="output folder (default: build/)")
+    build.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    build.add_argument("--report", help="write a JSON timing/failure report here")
+    build.add_argument("--no-cache", action="store_true", help="always render every deck from scratch")
+    build.add_argument("--compression", choices=COMPRESSION_CHOICES, default="default",
+                       help="fast (CI previews), default, or max (published artifacts)")
+    build.add_argument("--reproducible", action="store_true",
+                       help="byte-identical output for identical input (sets SOURCE_DATE_EPOCH)")
+    build.set_defaults(run=cmd_build)
+
+    export = commands.add_parser("export", help="write PPTX, PDF and/or PNG thumbnails from one compile")
+    export.add_argument("decks", nargs="*", metavar="DECK")
+    export.add_argument("--formats", default="pptx,png", help="comma-separated: pptx, pdf, png (default: pptx,png)")
+    export.add_argument("--out", help="output folder (default: build/export/)")
+    export.add_argument("--changed-only", action="store_true",
+                        help="always write the PPTX, but skip the other formats when it has not changed")
+    export.set_defaults(run=cmd_export)
+
+    fan = commands.add_parser("fan-out", help="write one personalized deck per parameter value")
+    fan.add_argument("deck", metavar="DECK")
+    fan.add_argument("--param", required=True, help="spec parameter to vary, e.g. team")
+    fan.add_argument("--values", help="comma-separated values (default: every value in the deck's data)")
+    fan.add_argument("--out", help="output folder (default: build/fan_out/)")
+    fan.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    fan.add_argument("--compression", choices=COMPRESSION_CHOICES, default="default",
+                     help="fast (CI previews), default, or max (published artifacts)")
+    fan.set_defaults(run=cmd_fan_out)
+
+    recompress = commands.add_parser("recompress", help="rewrite finished .pptx files in another compression mode")
+    recompress.add_argument("files", nargs="+", metavar="FILE")
+    recompress.add_argument("--compression", choices=COMPRESSION_CHOICES, default="max")
+    recompress.add_argument("--out", help="write copies here instead of rewriting the files in place")
+    recompress.set_defaults(run=cmd_recompress)
+
+    server = commands.add_parser("serve", help="rebuild decks as their sources change and serve previews")
+    server.add_argument("decks", nargs="*", metavar="DECK")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8000, help="0 picks a free port (default: 8000)")
+    server.add_argument("--out", help="preview folder (default: build/preview/)")
+    server.add_argument("--workers", type=int, help="worker processes (default: one per deck, up to all cores)")
+    server.set_defaults(run=cmd_serve)
+
+    site = commands.add_parser("microsite", help="render microsites from the base template and their site.json")
+    site.add_argument("sites", nargs="*", metavar="SITE")
+    site.add_argument("--out", help="output folder (default: build/microsites/)")
+    site.add_argument("--force", action="store_true", help="render sites even when nothing changed")
+    site.add_argument("--no-minify", action="store_true", help="keep the HTML, CSS and JS readable")
+    site.set_defaults(run=cmd_microsite)
+
+    listing = commands.add_parser("list", help="show each deck's slides")
+    listing.add_argument("decks", nargs="*", metavar="DECK")
+    listing.set_defaults(run=cmd_list)
+
+    validate = commands.add_parser("validate", help="compile decks and report errors and text overflow")
+    validate.add_argument("decks", nargs="*", metavar="DECK")
+    validate.add_argument("--strict", action="store_true", help="treat text fitting notes as failures")
+    validate.set_defaults(run=cmd_validate)
+
+    diff = commands.add_parser("diff", help="compare two decks or .pptx files slide by slide (exit 1 if they differ)")
+    diff.add_argument("old", metavar="OLD")
+    diff.add_argument("new", metavar="NEW")
+    diff.set_defaults(run=cmd_diff)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.run(args)
+    except DeckNotFound as exc:
+        parser.error(str(exc))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
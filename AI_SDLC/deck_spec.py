@@ -0,0 +1,689 @@
+"""
+Declarative deck specs: render a JSON/YAML slide description to PowerPoint
+One compiled code path replaces the hand-written add_*_slide functions
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+from pptx import Presentation
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN
+from pptx.dml.color import RGBColor
+
+from brand_styles import BRAND_COLORS, ParagraphStyle, apply_style
+from profiling import phase
+from profiling import slide as profile_slide
+from spec_source import asset_path, load_deck_spec, slide_layout
+from spec_source import slide_id as spec_slide_id
+
+# Palette names specs may reference (see brand_styles)
+DEFAULT_PALETTE = BRAND_COLORS
+
+LAYOUTS = {"title": 0, "title_content": 1, "title_only": 5, "blank": 6}
+
+ALIGNMENTS = {
+    "left": PP_ALIGN.LEFT,
+    "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT,
+    "justify": PP_ALIGN.JUSTIFY,
+}
+
+# set_slide_title() styling, used when a spec names no "slide_title" style
+DEFAULT_TITLE_STYLE = {"size": 40, "bold": True, "color": "AA_RED"}
+
+STYLE_KEYS = ("size", "bold", "color", "level", "space_before", "space_after", "align")
+
+# paragraphs are (text, ParagraphStyle) pairs, one per paragraph of the box.
+# Every added shape (text box, card, bar, table, image, chart) carries a z:
+# shapes are stacked by z, then by kind in SHAPE_KINDS order, then spec order
+TextBox = namedtuple("TextBox", ["left", "top", "width", "height", "paragraphs", "z"], defaults=(0,))
+
+# gradient is a (top, bottom) RGBColor pair drawn over background; cards and
+# bars are the dashboard shapes of the enhanced decks
+CompiledSlide = namedtuple(
+    "CompiledSlide",
+    ["id", "layout", "title", "title_style", "background", "textboxes", "paragraphs", "charts", "images",
+     "gradient", "cards", "bars", "tables"],
+    defaults=(None, (), (), ()),
+)
+
+# Outlined card with centered icon/title/content text; icon may be None
+CompiledCard = namedtuple(
+    "CompiledCard", ["left", "top", "width", "height", "icon", "title", "content", "accent", "fill", "body", "z"],
+    defaults=(0,))
+
+# Progress bar: a track, a fill percent of its width and a label just past its end
+CompiledBar = namedtuple(
+    "CompiledBar", ["left", "top", "width", "height", "percent", "label", "color", "track", "z"], defaults=(0,))
+
+# Native table: widths in EMU per column, colors as RRGGBB strings, align "l"/"r"
+# per column; pages are the (start, stop) row ranges that fit on one slide
+CompiledTable = namedtuple(
+    "CompiledTable",
+    ["left", "top", "row_height", "widths", "header", "rows", "font_size", "header_fill", "header_color",
+     "text_color", "align", "pages", "z"],
+    defaults=(0,),
+)
+
+# width/height may be None (keep aspect ratio); left None centers the image
+CompiledImage = namedtuple("CompiledImage", ["path", "left", "top", "width", "height", "z"], defaults=(0,))
+
+# spec is the chart dict with colors resolved to #RRGGBB; key is its content hash
+CompiledChart = namedtuple("CompiledChart", ["left", "top", "width", "height", "key", "spec", "z"], defaults=(0,))
+
+SHAPE_KINDS = ("textboxes", "cards", "bars", "tables", "images", "charts")
+
+CHART_TYPES = ("bar", "column", "line", "pie", "doughnut")
+
+CHART_KEYS = ("type", "categories", "series", "legend", "data_labels", "value_axis_title")
+
+# Default chart area (inches) below a slide title
+DEFAULT_CHART_BOX = {"left": 0.5, "top": 1.5, "width": 9, "height": 5.5}
+
+# Card and progress bar colors when a spec gives none
+CARD_FILL = "#F8F9FA"
+CARD_TEXT_COLOR = "AA_DARK_GRAY"
+PROGRESS_TRACK = "AA_SILVER"
+PROGRESS_LABEL_WIDTH = Inches(1.2)
+
+# Table defaults (inches / points) and the space kept free below a table
+TABLE_DEFAULTS = {"left": 0.5, "top": 1.5, "width": 9, "row_height": 0.4, "font_size": 14}
+TABLE_BOTTOM_MARGIN = Inches(0.3)
+
+
+class DeckSpecError(ValueError):
+    """Raised when a deck spec is malformed"""
+
+
+class CompiledDeck:
+    """A deck spec with every style and color resolved, ready to render"""
+
+    def __init__(self, name, width, height, slides, fit_log=()):
+        self.name = name
+        self.width = width
+        self.height = height
+        self.slides = slides
+        self.fit_log = list(fit_log)  # text shrink/split/overflow notes
+        self._by_id = {}
+        for slide in slides:
+            self._by_id.setdefault(slide.id, []).append(slide)
+
+    def pages(self, slide_id):
+        """A spec slide's compiled slides (more than one when its text was split)"""
+        try:
+            return self._by_id[slide_id]
+        except KeyError:
+            raise DeckSpecError(f"Unknown slide id: {slide_id}") from None
+
+    def slide(self, slide_id):
+        """Look up a compiled slide by its spec id (the first page if split)"""
+        return self.pages(slide_id)[0]
+
+
+class _StyleCompiler:
+    """Resolve named/inline style specs once and intern the results"""
+
+    def __init__(self, named_styles, palette):
+        self.named_styles = named_styles
+        self.palette = palette
+        self._colors = {}
+        self._styles = {}
+
+    def color(self, value):
+        """Turn a palette name, #RRGGBB string or [r, g, b] list into an RGBColor"""
+        if value is None:
+            return None
+        key = value if isinstance(value, str) else tuple(value)
+        rgb = self._colors.get(key)
+        if rgb is None:
+            if isinstance(value, str) and value.startswith("#"):
+                rgb = RGBColor.from_string(value[1:].upper())
+            elif isinstance(value, str):
+                if value not in self.palette:
+                    raise DeckSpecError(f"Unknown color: {value}")
+                rgb = RGBColor(*self.palette[value])
+            else:
+                rgb = RGBColor(*value)
+            self._colors[key] = rgb
+        return rgb
+
+    def _merge(self, spec, seen=()):
+        """Flatten a style spec (name, dict or dict with a base "style") to a dict"""
+        if spec is None:
+            return {}
+        if isinstance(spec, str):
+            if spec in seen:
+                raise DeckSpecError(f"Circular style reference: {spec}")
+            if spec not in self.named_styles:
+                raise DeckSpecError(f"Unknown style: {spec}")
+            return self._merge(self.named_styles[spec], seen + (spec,))
+        merged = self._merge(spec.get("style"), seen)
+        merged.update((k, v) for k, v in spec.items() if k in STYLE_KEYS)
+        return merged
+
+    def style(self, spec):
+        """Resolve a style spec into an interned ParagraphStyle"""
+        values = self._merge(spec)
+        key = tuple(values.get(k) for k in STYLE_KEYS)
+        compiled = self._styles.get(key)
+        if compiled is None:
+            size, bold, color, level, space_before, space_after, align = key
+            if align is not None and align not in ALIGNMENTS:
+                raise DeckSpecError(f"Unknown alignment: {align}")
+            compiled = ParagraphStyle(
+                size=Pt(size) if size is not None else None,
+                bold=bold,
+                color=self.color(color),
+                level=level or 0,
+                space_before=Pt(space_before) if space_before is not None else None,
+                space_after=Pt(space_after) if space_after is not None else None,
+                alignment=ALIGNMENTS[align] if align is not None else None,
+            )
+            self._styles[key] = compiled
+        return compiled
+
+
+def _compile_sections(slide_spec, styles):
+    """Flatten heading/bullet sections into (text, ParagraphStyle) pairs"""
+    defaults = slide_spec.get("defaults", {})
+    default_heading = defaults.get("heading_style")
+    default_bullet = defaults.get("bullet_style")
+    paragraphs = []
+    for section in slide_spec.get("sections", []):
+        if "heading" in section:
+            style = styles.style(section.get("heading_style", default_heading))
+            paragraphs.append((section["heading"], style))
+        bullet_style = styles.style(section.get("bullet_style", default_bullet))
+        for bullet in section.get("bullets", []):
+            paragraphs.append((bullet, bullet_style))
+    return tuple(paragraphs)
+
+
+def _compile_box_text(box, styles):
+    """A text box's (text, ParagraphStyle) pairs
+
+    "text" is one paragraph, or a list of them: strings take the box's
+    "style", {"text": ..., "style": ...} items their own.
+    """
+    text = box["text"]
+    if isinstance(text, str):
+        return ((text, styles.style(box.get("style"))),)
+    return tuple(
+        (item, styles.style(box.get("style"))) if isinstance(item, str) else
+        (item["text"], styles.style(item.get("style")))
+        for item in text
+    )
+
+
+class DeckCompiler:
+    """Resolve a spec's palette and styles once, then compile slides one at a time"""
+
+    def __init__(self, spec, palette=None):
+        colors = dict(DEFAULT_PALETTE)
+        colors.update(spec.get("palette", {}))
+        if palette:
+            colors.update(palette)
+        named_styles = spec.get("styles", {})
+        self.name = spec.get("name", "deck")
+        self.base_dir = spec.get("base_dir")
+        self.width = Inches(spec.get("slide_width", 10))
+        self.height = Inches(spec.get("slide_height", 7.5))
+        self.styles = _StyleCompiler(named_styles, colors)
+        self.title_style = self.styles.style(spec.get(
+            "title_style", "slide_title" if "slide_title" in named_styles else DEFAULT_TITLE_STYLE))
+        self.fit = spec.get("fit", True)
+        self.fit_log = []
+
+    def compile_slides(self, slide_spec, index=0):
+        """Compile one slide spec, shrinking or splitting body text that would overflow"""
+        slide = self.compile_slide(slide_spec, index)
+        pages = _split_tables(slide, self.fit_log)
+        if not self.fit:
+            return pages
+        _check_textboxes(slide, self.height, self.fit_log)
+        if not slide.paragraphs or slide.layout != LAYOUTS["title_content"]:
+            return pages
+        return _fit_body(pages[0], self.fit_log) + pages[1:]
+
+    def compile_slide(self, slide_spec, index=0):
+        """Compile one slide spec into a CompiledSlide"""
+        styles = self.styles
+        slide_id = spec_slide_id(slide_spec, index)
+        title = slide_spec.get("title")
+        layout = slide_layout(slide_spec)
+        layout = LAYOUTS.get(layout, layout)
+        if not isinstance(layout, int):
+            raise DeckSpecError(f"Slide {slide_id}: unknown layout {layout!r}")
+        textboxes = tuple(
+            TextBox(
+                Inches(box["left"]), Inches(box["top"]),
+                Inches(box["width"]), Inches(box["height"]),
+                _compile_box_text(box, styles), box.get("z", 0),
+            )
+            for box in slide_spec.get("textboxes", [])
+        )
+        try:
+            charts = _compile_charts(slide_spec, styles, slide_id, self.base_dir)
+            tables = tuple(self._compile_table(table, slide_id) for table in slide_spec.get("tables", []))
+        except (OSError, ValueError) as exc:
+            if isinstance(exc, DeckSpecError):
+                raise
+            raise DeckSpecError(f"Slide {slide_id}: {exc}") from None
+        return CompiledSlide(
+            id=slide_id,
+            layout=layout,
+            title=title,
+            title_style=styles.style(slide_spec["title_style"]) if "title_style" in slide_spec else self.title_style,
+            background=styles.color(slide_spec.get("background")),
+            textboxes=textboxes,
+            paragraphs=_compile_sections(slide_spec, styles),
+            charts=charts,
+            images=tuple(
+                CompiledImage(
+                    asset_path(self.base_dir, image["src"]),
+                    *(Inches(image[k]) if image.get(k) is not None else None
+                      for k in ("left", "top", "width", "height")),
+                    image.get("z", 0),
+                )
+                for image in slide_spec.get("images", [])
+            ),
+            gradient=self._gradient(slide_spec, slide_id),
+            cards=tuple(
+                CompiledCard(
+                    *(Inches(card[k]) for k in ("left", "top", "width", "height")),
+                    card.get("icon"), card["title"], card["content"], styles.color(card["color"]),
+                    styles.color(card.get("fill", CARD_FILL)), styles.color(card.get("text_color", CARD_TEXT_COLOR)),
+                    card.get("z", 0),
+                )
+                for card in slide_spec.get("cards", [])
+            ),
+            bars=tuple(
+                CompiledBar(
+                    *(Inches(bar[k]) for k in ("left", "top", "width", "height")),
+                    bar["percent"], f"{int(bar['percent'] * 100)}% {bar['label']}",
+                    styles.color(bar["color"]), styles.color(bar.get("track", PROGRESS_TRACK)), bar.get("z", 0),
+                )
+                for bar in slide_spec.get("progress", [])
+            ),
+            tables=tables,
+        )
+
+    def _compile_table(self, table_spec, slide_id):
+        """Resolve a table's data, colors and layout (all rows at once)"""
+        from metrics import DataTable, is_numeric, load_table, select_columns, table_layout
+
+        if "source" in table_spec:
+            data = load_table(asset_path(self.base_dir, table_spec["source"]))
+            if "columns" in table_spec:
+                data = select_columns(data, table_spec["columns"])
+        else:
+            data = DataTable(tuple(table_spec.get("columns", ())), tuple(tuple(r) for r in table_spec.get("rows", ())))
+        header = tuple(table_spec.get("headers", data.columns))
+        if len(header) != len(data.columns) or any(len(row) != len(header) for row in data.rows):
+            raise DeckSpecError(f"Slide {slide_id}: table rows and headers need {len(header)} columns")
+
+        box = dict(TABLE_DEFAULTS, **{k: table_spec[k] for k in TABLE_DEFAULTS if k in table_spec})
+        top, row_height = Inches(box["top"]), Inches(box["row_height"])
+        layout = table_layout(header, data.rows, Inches(box["width"]), row_height,
+                              self.height - top - TABLE_BOTTOM_MARGIN, box["font_size"])
+
+        def hex_color(key):
+            color = self.styles.color(table_spec.get(key))
+            return str(color) if color is not None else None
+
+        return CompiledTable(
+            left=Inches(box["left"]), top=top, row_height=row_height, widths=tuple(layout.widths),
+            header=header, rows=data.rows, font_size=box["font_size"],
+            header_fill=hex_color("header_fill"), header_color=hex_color("header_color"),
+            text_color=hex_color("color"),
+            align=tuple("r" if is_numeric(values) else None
+                        for values in (zip(*data.rows) if data.rows else [()] * len(header))),
+            pages=tuple((page.start, page.stop) for page in layout.pages),
+            z=table_spec.get("z", 0),
+        )
+
+    def _gradient(self, slide_spec, slide_id):
+        stops = slide_spec.get("gradient")
+        if stops is None:
+            return None
+        if len(stops) != 2:
+            raise DeckSpecError(f"Slide {slide_id}: gradient needs exactly two colors")
+        return tuple(self.styles.color(stop) for stop in stops)
+
+
+def _chart_from_data(chart, base_dir):
+    """chart with categories and series values read from its "source" file or inline rows"""
+    from metrics import DataTable, column, load_table
+
+    if "source" in chart:
+        data = load_table(asset_path(base_dir, chart["source"]))
+    else:
+        data = DataTable(tuple(chart.get("columns", ())), tuple(tuple(row) for row in chart["rows"]))
+    chart = dict(chart, categories=[str(v) for v in column(data, chart["category"])])
+    series = []
+    for entry in chart.get("series", []):
+        values = column(data, entry["column"])
+        if any(v is not None and not isinstance(v, (int, float)) for v in values):
+            raise DeckSpecError(f"Chart column {entry['column']} is not numeric")
+        series.append(dict({k: v for k, v in entry.items() if k != "column"}, name=entry.get("name", entry["column"]),
+                           values=values))
+    chart["series"] = series
+    return chart
+
+
+def _compile_charts(slide_spec, styles, slide_id, base_dir=None):
+    """Resolve chart colors and placement; charts are keyed by content for caching"""
+    chart_specs = slide_spec.get("charts", [])
+    if not chart_specs:
+        return ()
+    from charts import chart_key
+
+    def hex_color(value):
+        return f"#{styles.color(value)}" if value is not None else None
+
+    compiled = []
+    for chart in chart_specs:
+        if "category" in chart:
+            chart = _chart_from_data(chart, base_dir)
+        if chart.get("type") not in CHART_TYPES:
+            raise DeckSpecError(f"Slide {slide_id}: unknown chart type {chart.get('type')!r}")
+        resolved = {k: chart[k] for k in CHART_KEYS if k in chart}
+        resolved["series"] = []
+        for series in chart.get("series", []):
+            series = dict(series)
+            for key in ("color", "line_color"):
+                if key in series:
+                    series[key] = hex_color(series[key])
+            if "colors" in series:
+                series["colors"] = [hex_color(c) for c in series["colors"]]
+            resolved["series"].append(series)
+        if not resolved["series"]:
+            raise DeckSpecError(f"Slide {slide_id}: chart has no series")
+        box = dict(DEFAULT_CHART_BOX, **{k: chart[k] for k in DEFAULT_CHART_BOX if k in chart})
+        compiled.append(CompiledChart(
+            Inches(box["left"]), Inches(box["top"]), Inches(box["width"]), Inches(box["height"]),
+            chart_key(resolved), resolved, chart.get("z", 0),
+        ))
+    return tuple(compiled)
+
+
+def _measure(text, style):
+    from text_fit import Measure
+    return Measure(
+        text,
+        style.size.pt if style.size is not None else None,
+        bool(style.bold),
+        style.level,
+        style.space_before.pt if style.space_before is not None else None,
+        style.space_after.pt if style.space_after is not None else None,
+    )
+
+
+def _scaled(slide, scale):
+    """slide with body text sizes and spacing multiplied by scale (0.5pt steps)"""
+    from text_fit import DEFAULT_SPACE_BEFORE, LEVEL_SIZES
+
+    def points(value):
+        return Pt(round(value * scale * 2) / 2)
+
+    paragraphs = []
+    for text, style in slide.paragraphs:
+        size = style.size.pt if style.size is not None else LEVEL_SIZES[min(style.level, len(LEVEL_SIZES) - 1)]
+        before = style.space_before.pt if style.space_before is not None else DEFAULT_SPACE_BEFORE * size
+        paragraphs.append((text, style._replace(
+            size=points(size),
+            space_before=points(before),
+            space_after=points(style.space_after.pt) if style.space_after is not None else None,
+        )))
+    return slide._replace(paragraphs=tuple(paragraphs))
+
+
+def _fit_body(slide, log):
+    """Shrink the body text to fit, or split it over continuation slides"""
+    from text_fit import FONT_SCALES, fit_scale, split_pages
+
+    measures = [_measure(text, style) for text, style in slide.paragraphs]
+    scale = fit_scale(measures)
+    if scale == 1.0:
+        return [slide]
+    if scale is not None:
+        log.append(f"{slide.id}: body text shrunk to {scale:.0%}")
+        return [_scaled(slide, scale)]
+
+    pages = []
+    for number, indexes in enumerate(split_pages(measures)):
+        paragraphs = [slide.paragraphs[i] for i in indexes]
+        page = slide._replace(paragraphs=tuple(paragraphs))
+        if number:
+            # Blank lines used as spacing are pointless at the top of a page
+            text, style = paragraphs[0]
+            paragraphs[0] = (text.lstrip("\n"), style)
+            page = page._replace(title=f"{slide.title} (cont.)" if slide.title else None,
+                                 paragraphs=tuple(paragraphs))
+        page_scale = fit_scale([measures[i] for i in indexes]) or FONT_SCALES[-1]
+        pages.append(_scaled(page, page_scale) if page_scale < 1.0 else page)
+    log.append(f"{slide.id}: body text split over {len(pages)} slides")
+    return pages
+
+
+def _split_tables(slide, log):
+    """slide, plus "(cont.)" pages for table rows that do not fit below its first page"""
+    if not any(len(table.pages) > 1 for table in slide.tables):
+        return [slide]
+    count = max(len(table.pages) for table in slide.tables)
+    pages = []
+    for number in range(count):
+        tables = tuple(
+            table._replace(rows=table.rows[start:stop], pages=((0, stop - start),))
+            for table in slide.tables if number < len(table.pages)
+            for start, stop in (table.pages[number],)
+        )
+        if number:
+            # Continuation pages carry just the title and the remaining rows
+            pages.append(CompiledSlide(
+                slide.id, slide.layout, f"{slide.title} (cont.)" if slide.title else None, slide.title_style,
+                slide.background, (), (), (), (), slide.gradient, (), (), tables))
+        else:
+            pages.append(slide._replace(tables=tables))
+    log.append(f"{slide.id}: table rows split over {count} slides")
+    return pages
+
+
+def _check_textboxes(slide, slide_height, log):
+    """Note text boxes that overflow: they never wrap and grow downwards to fit"""
+    from text_fit import EMU_PER_PT, INSET_X, INSET_Y, LINE_HEIGHT, line_width
+
+    for box in slide.textboxes:
+        width = height = 0
+        for number, (text, style) in enumerate(box.paragraphs):
+            size = style.size.pt if style.size is not None else 18
+            width = max(width, line_width(text, size, bool(style.bold)))
+            height += (text.count("\n") + 1) * size * LINE_HEIGHT
+            if number and style.space_before is not None:  # PowerPoint ignores space before the first paragraph
+                height += style.space_before.pt
+        if (width + 2 * INSET_X / EMU_PER_PT > box.width / EMU_PER_PT or
+                height + 2 * INSET_Y / EMU_PER_PT > (slide_height - box.top) / EMU_PER_PT):
+            text = "\n".join(text for text, _ in box.paragraphs)
+            log.append(f"{slide.id}: text box overflows ({text.lstrip()[:40]!r})")
+
+
+def compile_deck(spec, palette=None, params=None):
+    """Compile a loaded deck spec into a CompiledDeck
+
+    Specs with a "data" section or "params" are bound first (see
+    data_binding); params override the spec's own parameters.
+    """
+    with phase("compile"):
+        if spec.get("data") or spec.get("params") or params:
+            from data_binding import bind_spec
+            spec = bind_spec(spec, params)
+        compiler = DeckCompiler(spec, palette)
+        slides = [page for index, slide_spec in enumerate(spec.get("slides", []))
+                  for page in compiler.compile_slides(slide_spec, index)]
+    return CompiledDeck(compiler.name, compiler.width, compiler.height, slides, compiler.fit_log)
+
+
+def fill_text_frame(tf, paragraphs):
+    """Replace the text frame contents with (text, style) pairs in one pass"""
+    tf.clear()
+    # clear() leaves one empty paragraph; add the remaining <a:p> elements up front
+    txBody = tf._txBody
+    for _ in range(len(paragraphs) - 1):
+        txBody.add_p()
+    for p, (text, style) in zip(tf.paragraphs, paragraphs):
+        p.text = text
+        apply_style(p, style)
+
+
+def render_slide(prs, slide):
+    """Add one CompiledSlide to the presentation"""
+    with phase("layout"):
+        pptx_slide = prs.slides.add_slide(prs.slide_layouts[slide.layout])
+
+        if slide.background is not None:
+            from slide_templates import background_template
+            background_template().apply(pptx_slide, slide.background)
+
+        if slide.gradient is not None:
+            fill = pptx_slide.background.fill
+            fill.gradient()
+            fill.gradient_angle = 90.0
+            fill.gradient_stops[0].color.rgb, fill.gradient_stops[1].color.rgb = slide.gradient
+
+    if slide.title is not None:
+        with phase("text"):
+            fill_text_frame(pptx_slide.shapes.title.text_frame, ((slide.title, slide.title_style),))
+
+    if slide.paragraphs:
+        with phase("text"):
+            fill_text_frame(pptx_slide.placeholders[1].text_frame, slide.paragraphs)
+
+    for kind, shape in slide_shapes(slide):
+        if kind == "textboxes":
+            with phase("shapes"):
+                box = pptx_slide.shapes.add_textbox(shape.left, shape.top, shape.width, shape.height)
+            with phase("text"):
+                fill_text_frame(box.text_frame, shape.paragraphs)
+        else:
+            with phase("shapes"):
+                _render_shape(pptx_slide, kind, shape)
+
+    return pptx_slide
+
+
+def slide_shapes(slide):
+    """A CompiledSlide's added shapes as (kind, shape) pairs, bottom to top"""
+    shapes = [(kind, shape) for kind in SHAPE_KINDS for shape in getattr(slide, kind)]
+    return sorted(shapes, key=lambda item: item[1].z)
+
+
+def _render_shape(pptx_slide, kind, shape):
+    """Add one card, progress bar, table, image or chart"""
+    if kind == "cards":
+        render_card(pptx_slide.shapes, shape)
+    elif kind == "bars":
+        render_bar(pptx_slide.shapes, shape)
+    elif kind == "tables":
+        from metrics import add_table
+        add_table(pptx_slide, shape)
+    elif kind == "images":
+        from assets import add_image
+        add_image(pptx_slide, shape.path, shape.left, shape.top or 0, shape.width, shape.height)
+    else:
+        from charts import add_chart
+        add_chart(pptx_slide, shape.left, shape.top, shape.width, shape.height, shape.key, shape.spec)
+
+
+def render_card(shapes, card):
+    """Add a dashboard card from the precompiled slide_templates fragment"""
+    from slide_templates import card_template
+
+    texts = {"title": card.title, "content": card.content}
+    if card.icon:
+        texts["icon"] = card.icon
+    card_template(bool(card.icon)).instantiate(
+        shapes, card.left, card.top, card.width, card.height, texts,
+        {"accent": card.accent, "fill": card.fill, "body": card.body})
+
+
+def render_bar(shapes, bar):
+    """Add a progress bar (track, fill and label) from the precompiled slide_templates fragments"""
+    from slide_templates import bar_template, text_box_template
+
+    track = bar_template()
+    track.instantiate(shapes, bar.left, bar.top, bar.width, bar.height, colors={"fill": bar.track})
+    track.instantiate(shapes, bar.left, bar.top, int(bar.width * bar.percent), bar.height,
+                      colors={"fill": bar.color})
+    text_box_template(14, bold=True, alignment=PP_ALIGN.LEFT).instantiate(
+        shapes, bar.left + bar.width + bar.width // 20, bar.top, PROGRESS_LABEL_WIDTH, bar.height,
+        {"text": bar.label}, {"color": bar.color})
+
+
+def new_presentation(width, height):
+    """Create an empty Presentation with the given slide size"""
+    prs = Presentation()
+    prs.slide_width = width
+    prs.slide_height = height
+    return prs
+
+
+def prerender_deck_charts(slides, workers=None):
+    """Build every chart of the given CompiledSlides up front, across a process pool"""
+    charts = [(chart.key, chart.spec) for slide in slides for chart in slide.charts]
+    if charts:
+        from charts import prerender_charts
+        prerender_charts(charts, workers)
+
+
+def render_deck(deck):
+    """Render a CompiledDeck into a new Presentation"""
+    prerender_deck_charts(deck.slides)
+    prs = new_presentation(deck.width, deck.height)
+    for slide in deck.slides:
+        with profile_slide(slide.id):
+            render_slide(prs, slide)
+    return prs
+
+
+def write_deck(deck, output_path, compression="default"):
+    """Render a CompiledDeck straight to output_path, flushing each slide as it is built
+
+    compression is a streaming_writer.COMPRESSION_MODES name. Returns the
+    Presentation, which is only good for counting slides.
+    """
+    from streaming_writer import StreamingPackageWriter
+
+    prerender_deck_charts(deck.slides)
+    prs = new_presentation(deck.width, deck.height)
+    with StreamingPackageWriter(prs, output_path, compression) as writer:
+        for slide in deck.slides:
+            with profile_slide(slide.id):
+                render_slide(prs, slide)
+                writer.flush()
+    return prs
+
+
+def build_deck(spec_path, output_path, palette=None, compression="default"):
+    """Load, compile, render and save one spec; returns the slide count"""
+    deck = compile_deck(load_deck_spec(spec_path), palette)
+    write_deck(deck, output_path, compression)
+    return len(deck.slides)
+
+
+if __name__ == "__main__":
+    # Usage: python deck_spec.py OUTPUT_DIR SPEC [SPEC ...]
+    if len(sys.argv) < 3:
+        print("Usage: python deck_spec.py OUTPUT_DIR SPEC [SPEC ...]")
+        sys.exit(2)
+    output_dir = sys.argv[1]
+    os.makedirs(output_dir, exist_ok=True)
+    for spec_path in sys.argv[2:]:
+        name = os.path.splitext(os.path.basename(spec_path))[0]
+        output_path = os.path.join(output_dir, f"{name}.pptx")
+        deck = compile_deck(load_deck_spec(spec_path))
+        write_deck(deck, output_path)
+        print(f"✓ {spec_path} -> {output_path} ({len(deck.slides)} slides)")
+        for note in deck.fit_log:
+            print(f"  ⚠ {note}")
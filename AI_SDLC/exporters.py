@@ -0,0 +1,123 @@
+"""
+Export one compiled deck to PPTX, PDF and PNG thumbnails in a single run
+The deck spec is compiled once and every requested exporter works from that
+model concurrently: the PPTX is streamed by deck_spec and the thumbnails are
+drawn by thumbnails.py at the same time, and the PDF is converted from the
+finished PPTX by a headless LibreOffice as soon as the PPTX is written.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# run(deck, out_dir, name, inputs) -> [paths]; inputs maps each format in needs to its paths
+Exporter = namedtuple("Exporter", ["run", "needs"])
+
+# paths written by one exporter, how long it took and the error message if it failed
+ExportResult = namedtuple("ExportResult", ["format", "paths", "seconds", "error"])
+
+# Seconds to wait for LibreOffice to convert one deck
+PDF_TIMEOUT = 300
+
+
+class ExportError(RuntimeError):
+    """Raised when an export format cannot be produced"""
+
+
+def export_pptx(deck, out_dir, name, inputs):
+    from deck_spec import write_deck
+
+    path = os.path.join(out_dir, f"{name}.pptx")
+    write_deck(deck, path)
+    return [path]
+
+
+def find_soffice():
+    """Path of the LibreOffice binary ($SOFFICE, soffice or libreoffice), or None"""
+    return os.environ.get("SOFFICE") or shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def export_pdf(deck, out_dir, name, inputs):
+    soffice = find_soffice()
+    if soffice is None:
+        raise ExportError("PDF export needs LibreOffice (soffice) on PATH or in $SOFFICE")
+    pptx_path = inputs["pptx"][0]
+    # A private profile lets several conversions run at once
+    with tempfile.TemporaryDirectory(prefix="soffice-") as profile:
+        subprocess.run(
+            [soffice, f"-env:UserInstallation=file://{profile}", "--headless", "--convert-to", "pdf",
+             "--outdir", out_dir, pptx_path],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=PDF_TIMEOUT,
+        )
+    path = os.path.join(out_dir, os.path.splitext(os.path.basename(pptx_path))[0] + ".pdf")
+    if not os.path.isfile(path):
+        raise ExportError(f"LibreOffice did not write {path}")
+    return [path]
+
+
+def export_png(deck, out_dir, name, inputs):
+    from thumbnails import write_thumbnails
+
+    return write_thumbnails(deck, os.path.join(out_dir, f"{name}-thumbnails"))
+
+
+EXPORTERS = {
+    "pptx": Exporter(export_pptx, ()),
+    "pdf": Exporter(export_pdf, ("pptx",)),
+    "png": Exporter(export_png, ()),
+}
+
+
+def export_deck(deck, out_dir, formats=("pptx",), name=None, done=None):
+    """Run the exporters for formats concurrently on one CompiledDeck
+
+    Returns {format: ExportResult}; one format failing does not stop the
+    others. Formats another one needs but that were not requested (the PPTX
+    behind a PDF) are written to a scratch folder. done maps formats already
+    exported to their ExportResults, which are reused instead of run again.
+    """
+    done = done or {}
+    unknown = [f for f in formats if f not in EXPORTERS]
+    if unknown:
+        raise ExportError(f"Unknown export format: {', '.join(unknown)}")
+    name = name or deck.name
+    os.makedirs(out_dir, exist_ok=True)
+
+    order = []
+    for fmt in formats:
+        for needed in EXPORTERS[fmt].needs + (fmt,):
+            if needed not in order and needed not in done:
+                order.append(needed)
+
+    with tempfile.TemporaryDirectory(prefix="export-") as scratch, \
+            ThreadPoolExecutor(max_workers=max(1, len(order))) as pool:
+        futures = {}
+        for fmt, result in done.items():
+            futures[fmt] = Future()
+            futures[fmt].set_result(result)
+
+        def run(fmt):
+            exporter = EXPORTERS[fmt]
+            start = time.perf_counter()
+            try:
+                inputs = {}
+                for needed in exporter.needs:
+                    # Dependencies were submitted first, so waiting here cannot deadlock
+                    result = futures[needed].result()
+                    if result.error:
+                        raise ExportError(f"no {needed} to convert ({result.error})")
+                    inputs[needed] = result.paths
+                paths = exporter.run(deck, out_dir if fmt in formats else scratch, name, inputs)
+                return ExportResult(fmt, paths, time.perf_counter() - start, None)
+            except ExportError as exc:
+                return ExportResult(fmt, [], time.perf_counter() - start, str(exc))
+            except Exception as exc:
+                return ExportResult(fmt, [], time.perf_counter() - start, f"{type(exc).__name__}: {exc}")
+
+        for fmt in order:
+            futures[fmt] = pool.submit(run, fmt)
+        return {fmt: futures[fmt].result() for fmt in formats}
@@ -0,0 +1,190 @@
+"""
+Render one deck spec as N personalized decks (e.g. one per team) in one pass
+Every variant is bound from a single load of the spec's data sources. Slides
+whose content is the same for all variants are rendered once and shared
+through the slide store. Slides that differ only in placeholder text are
+rendered once as a template, with markers in place of the values, and each
+variant's copy is made by patching its values into the template's XML; a
+patch is only used when it gives exactly what rendering would. Anything else
+(e.g. a progress bar whose width follows the data) is rendered per variant.
+The decks are written across a bounded pool of worker processes.
+
+    python deck_cli.py fan-out nxop_ai_native --param team --out build/teams --workers 4
+"""
+
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Runs of characters replaced by "_" in output file names
+UNSAFE_NAME = re.compile(r"[^\w.-]+")
+
+# One written variant: node counts by how each slide was produced
+FanOutResult = namedtuple("FanOutResult", ["value", "path", "rendered", "patched", "reused", "seconds"])
+
+# A template slide: its compiled pages (with markers) and their captured XML
+SlideTemplate = namedtuple("SlideTemplate", ["pages", "stored"])
+
+# Set in each worker by _init_worker: {slide id: SlideTemplate}, generator digest, slide store folder
+# (compiled slides hold RGBColors, which do not pickle, so each worker compiles its own templates)
+_templates = {}
+_generator = ""
+_store_dir = None
+
+
+def output_name(name, value):
+    """File name for one variant, e.g. nxop_ai_native-Crew_Ops.pptx"""
+    return f"{name}-{UNSAFE_NAME.sub('_', str(value)).strip('_')}.pptx"
+
+
+def compile_templates(spec, palette=None):
+    """({slide id: SlideTemplate}, fields) for the slides of spec that use placeholders"""
+    from data_binding import bind_template
+    from deck_spec import DeckCompiler, DeckSpecError, new_presentation, render_slide
+    from slide_graph import capture_pages
+
+    template_spec, fields = bind_template(spec)
+    compiler = DeckCompiler(template_spec, palette)
+    prs = new_presentation(compiler.width, compiler.height)
+    templates = {}
+    for index, slide_spec in enumerate(template_spec["slides"]):
+        if slide_spec is None:
+            continue
+        try:
+            pages = tuple(compiler.compile_slides(slide_spec, index))
+        except (DeckSpecError, TypeError, ValueError):
+            continue  # a placeholder feeds a number (size, percent, ...): render per variant
+        # Markers may only reach slide text; chart parts and image paths are not patched
+        if not _has_marker(pages) or any(page.charts or _has_marker(page.images) for page in pages):
+            continue
+        start = len(prs.slides._sldIdLst)
+        for page in pages:
+            render_slide(prs, page)
+        stored = capture_pages(prs, start)
+        if stored is not None:
+            templates[pages[0].id] = SlideTemplate(pages, stored)
+    return templates, fields
+
+
+def _has_marker(value):
+    from data_binding import MARKER_PATTERN
+
+    if isinstance(value, str):
+        return MARKER_PATTERN.search(value) is not None
+    if isinstance(value, tuple):
+        return any(_has_marker(v) for v in value)
+    return False
+
+
+def _fill(value, values):
+    """A compiled value with every marker replaced by its field's text"""
+    from data_binding import MARKER_PATTERN
+
+    if isinstance(value, str):
+        return MARKER_PATTERN.sub(lambda m: values[int(m.group(1))], value)
+    if hasattr(value, "_fields"):
+        return type(value)(*(_fill(v, values) for v in value))
+    if type(value) is tuple:
+        return tuple(_fill(v, values) for v in value)
+    return value
+
+
+def patch_pages(template, content, values):
+    """StoredPages for content made from template, or None if only rendering gives the same slide"""
+    from data_binding import MARKER_PATTERN
+    from slide_graph import StoredPage
+
+    if any(c < " " for v in values for c in v):
+        return None  # line breaks become <a:br/> elements, not text
+    if _fill(template.pages, values) != content:
+        return None  # e.g. longer text shrank or split differently
+    return [StoredPage(MARKER_PATTERN.sub(lambda m: escape(values[int(m.group(1))]), page.xml.decode("utf-8"))
+                       .encode("utf-8"), page.rels, page.blobs)
+            for page in template.stored]
+
+
+class _FanOutStore:
+    """Patched pages for one variant in front of the shared slide store"""
+
+    def __init__(self, base, patched):
+        self.base = base
+        self.patched = patched
+
+    def get(self, key):
+        return self.patched.get(key) or self.base.get(key)
+
+    def put(self, key, pages):
+        self.base.put(key, pages)
+
+
+def _init_worker(spec, palette, generator, store_dir, templates=None):
+    global _templates, _generator, _store_dir
+    _templates = templates if templates is not None else compile_templates(spec, palette)[0]
+    _generator, _store_dir = generator, store_dir
+
+
+def _build_variant(task):
+    """Write one bound variant; returns its FanOutResult"""
+    from deck_spec import compile_deck
+    from slide_graph import SlideStore, build_graph, deck_graph
+
+    value, spec, values, output_path, palette, compression = task
+    start = time.perf_counter()
+    graph = deck_graph(compile_deck(spec, palette), _generator)
+    patched = {}
+    for node in graph.nodes:
+        template = _templates.get(node.id)
+        pages = template and patch_pages(template, node.inputs["content"], values)
+        if pages:
+            patched[graph.key(node)] = pages
+    store = SlideStore(_store_dir) if _store_dir else SlideStore()
+    rendered, reused = build_graph(graph, output_path, _FanOutStore(store, patched), compression=compression)
+    return FanOutResult(value, output_path, rendered, len(patched), reused - len(patched),
+                        time.perf_counter() - start)
+
+
+def fan_out(spec, param, values=None, out_dir=None, workers=None, palette=None, store_dir=None,
+            compression="default"):
+    """Write one deck per value of param; returns a FanOutResult per variant, in order
+
+    values defaults to every value of param in the spec's partitioned data
+    sources (see data_binding.variant_values). The first variant is built
+    here, so the slides all variants share are rendered exactly once; the
+    rest are written by up to workers processes.
+    """
+    from build_cache import SPEC_GENERATOR_MODULES, generator_digest
+    from data_binding import DataContext, bind_spec, field_values, variant_values
+
+    out_dir = out_dir or os.path.join(HERE, "build", "fan_out")
+    os.makedirs(out_dir, exist_ok=True)
+    context = DataContext(spec.get("data", {}), spec.get("base_dir"))
+    if values is None:
+        values = variant_values(context, param, spec.get("params"))
+    templates, fields = compile_templates(spec, palette)
+
+    name = spec.get("name", "deck")
+    tasks = []
+    for value in values:
+        params = dict(spec.get("params", {}), **{param: value})
+        tasks.append((value, bind_spec(spec, {param: value}, context), field_values(fields, context, params),
+                      os.path.join(out_dir, output_name(name, value)), palette, compression))
+    if not tasks:
+        return []
+
+    generator = generator_digest(SPEC_GENERATOR_MODULES)
+    _init_worker(spec, palette, generator, store_dir, templates)
+    results = [_build_variant(tasks[0])]
+    workers = min(workers or os.cpu_count() or 1, len(tasks) - 1)
+    if workers <= 1:
+        results += [_build_variant(task) for task in tasks[1:]]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(spec, palette, generator, store_dir)) as pool:
+            results += pool.map(_build_variant, tasks[1:], chunksize=max(1, len(tasks) // (4 * workers)))
+    return results
+
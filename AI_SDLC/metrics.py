@@ -0,0 +1,188 @@
+"""
+Native PPTX tables for metric data
+KPI tables come from CSV/JSON files (a presentation's assets/data/ folder) or
+from rows inline in a deck spec. Column widths and page breaks for all rows are
+computed in one pass, column by column, and each table is written as a single
+<a:tbl> fragment built from per-column cell templates instead of filling cells
+through python-pptx one setter at a time, so dashboards with hundreds of KPIs
+stay fast to build and small on disk.
+"""
+
+import csv
+import itertools
+import json
+import os
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+# columns: header names; rows: tuples of values (numbers where the text reads as one)
+DataTable = namedtuple("DataTable", ["columns", "rows"])
+
+# widths: EMU per column, summing exactly to the table width; pages: row ranges
+TableLayout = namedtuple("TableLayout", ["widths", "pages"])
+
+# python-pptx's default table style (Medium Style 2 - Accent 1): header row and banded rows
+TABLE_STYLE_ID = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
+
+# Default left + right cell margins (EMU)
+CELL_MARGINS = 2 * 91440
+
+_NS = ('xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+       'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"')
+
+_tables = {}
+
+
+class DataError(ValueError):
+    """Raised when a data file cannot be read as a table"""
+
+
+def _number(value):
+    """value as an int or float when the text reads as one, else unchanged"""
+    if not isinstance(value, str):
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def load_table(path):
+    """DataTable from a .csv file (header row first) or a .json file
+
+    JSON may be a list of objects or {"columns": [...], "rows": [[...], ...]}.
+    Tables are cached per file version, so several slides can share one file.
+    """
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    table = _tables.get(key)
+    if table is not None:
+        return table
+
+    if path.endswith(".csv"):
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            columns = tuple(next(reader, ()))
+            rows = tuple(tuple(_number(v) for v in row) for row in reader if row)
+    elif path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            columns = tuple(data.get("columns", ()))
+            rows = tuple(tuple(row) for row in data.get("rows", ()))
+        else:
+            columns = tuple(dict.fromkeys(k for record in data for k in record))
+            rows = tuple(tuple(record.get(c) for c in columns) for record in data)
+    else:
+        raise DataError(f"Unsupported data file: {path}")
+
+    if not columns:
+        raise DataError(f"{path}: no columns")
+    if any(len(row) != len(columns) for row in rows):
+        raise DataError(f"{path}: every row needs {len(columns)} values")
+    table = _tables[key] = DataTable(columns, rows)
+    return table
+
+
+def select_columns(table, columns):
+    """table narrowed (and reordered) to the named columns"""
+    missing = [c for c in columns if c not in table.columns]
+    if missing:
+        raise DataError(f"Unknown column: {', '.join(missing)}")
+    indexes = [table.columns.index(c) for c in columns]
+    return DataTable(tuple(columns), tuple(tuple(row[i] for i in indexes) for row in table.rows))
+
+
+def column(table, name):
+    """All values of one column"""
+    if name not in table.columns:
+        raise DataError(f"Unknown column: {name}")
+    index = table.columns.index(name)
+    return [row[index] for row in table.rows]
+
+
+def cell_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def is_numeric(values):
+    """True if every non-empty value is a number (such columns are right-aligned)"""
+    present = [v for v in values if v not in (None, "")]
+    return bool(present) and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present)
+
+
+def table_layout(header, rows, width, row_height, max_height, font_size):
+    """Column widths and row pages for a whole table at once
+
+    Widths follow the widest text of each column (header in bold); pages hold
+    as many rows as fit in max_height below a repeated header row.
+    """
+    from text_fit import EMU_PER_PT, line_width
+
+    weights = []
+    for title, values in zip(header, zip(*rows) if rows else [()] * len(header)):
+        widest = max([line_width(cell_text(v), font_size) for v in values] +
+                     [line_width(cell_text(title), font_size, bold=True)])
+        weights.append(widest * EMU_PER_PT + CELL_MARGINS)
+    total = sum(weights)
+    edges = [round(width * edge / total) for edge in itertools.accumulate(weights)]
+    widths = [right - left for left, right in zip([0] + edges, edges)]
+
+    per_page = max(1, int(max_height // row_height) - 1)
+    pages = [range(start, min(start + per_page, len(rows))) for start in range(0, len(rows), per_page)]
+    return TableLayout(widths, pages or [range(0)])
+
+
+def _cell_template(size, bold, color, fill, align):
+    """(prefix, suffix) of an <a:tc> around its escaped text"""
+    b = ' b="1"' if bold else ""
+    color_xml = f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>' if color else ""
+    fill_xml = f'<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>' if fill else ""
+    algn = f'<a:pPr algn="{align}"/>' if align else ""
+    prefix = (f'<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p>{algn}'
+              f'<a:r><a:rPr lang="en-US" sz="{size}"{b} dirty="0">{color_xml}</a:rPr><a:t>')
+    return prefix, f"</a:t></a:r></a:p></a:txBody><a:tcPr>{fill_xml}</a:tcPr></a:tc>"
+
+
+def table_xml(shape_id, table):
+    """<p:graphicFrame> XML for a CompiledTable (see deck_spec)"""
+    size = int(table.font_size * 100)
+    header_cells = [_cell_template(size, True, table.header_color, table.header_fill, align)
+                    for align in table.align]
+    body_cells = [_cell_template(size, False, table.text_color, None, align) for align in table.align]
+    height = table.row_height * (len(table.rows) + 1)
+
+    def row(cells, values):
+        return (f'<a:tr h="{table.row_height}">'
+                + "".join(f"{prefix}{escape(cell_text(v))}{suffix}" for (prefix, suffix), v in zip(cells, values))
+                + "</a:tr>")
+
+    return "".join([
+        f'<p:graphicFrame {_NS}><p:nvGraphicFramePr><p:cNvPr id="{shape_id}" name="Table {shape_id - 1}"/>'
+        '<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/></p:nvGraphicFramePr>'
+        f'<p:xfrm><a:off x="{table.left}" y="{table.top}"/><a:ext cx="{sum(table.widths)}" cy="{height}"/></p:xfrm>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/table"><a:tbl>'
+        f'<a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{TABLE_STYLE_ID}</a:tableStyleId></a:tblPr>',
+        "<a:tblGrid>", *(f'<a:gridCol w="{w}"/>' for w in table.widths), "</a:tblGrid>",
+        row(header_cells, table.header),
+        *(row(body_cells, values) for values in table.rows),
+        "</a:tbl></a:graphicData></a:graphic></p:graphicFrame>",
+    ])
+
+
+def add_table(slide, table):
+    """Append a CompiledTable to a slide as a native PPTX table"""
+    from pptx.oxml import parse_xml
+
+    shapes = slide.shapes
+    element = parse_xml(table_xml(shapes._next_shape_id, table).encode("utf-8"))
+    shapes._spTree.insert_element_before(element, "p:extLst")
+    return element
@@ -0,0 +1,404 @@
+"""
+Build microsites from templates/microsite-base-template and a data file per site
+A site is a presentations/<name>/site.json (or .yaml) whose values are merged
+over the template's own site.json, which holds the content the template
+ships with; only what differs needs to be given. The template's index.html,
+styles.css and script.js are rendered with template_engine, minified, and
+written with content-hashed names (styles.1a2b3c4d5e.css), as are the images
+the page links through asset(). Everything but index.html can therefore be
+cached for a year; the _headers file written beside it says so to hosts that
+read one (Netlify, Cloudflare Pages). A site whose data, template, assets and
+generator are unchanged is not rendered again.
+
+    python deck_cli.py microsite [SITE ...] [--out DIR]
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from collections import namedtuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+TEMPLATE_DIR = os.path.join(HERE, "templates", "microsite-base-template")
+DEFAULT_OUT_DIR = os.path.join(HERE, "build", "microsites")
+
+SITE_NAMES = ("site.json", "site.yaml", "site.yml")
+
+# The page; every other .css/.js file in the template folder is rendered as an asset of it
+PAGE = "index.html"
+TEXT_ASSETS = (".css", ".js")
+
+# Hex digits of the content hash in fingerprinted names
+FINGERPRINT_LENGTH = 10
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+MANIFEST = ".microsite.json"
+
+# Modules whose source is part of every site's cache key
+GENERATOR_MODULES = ("microsite.py", "template_engine.py")
+
+SiteJob = namedtuple("SiteJob", ["name", "data", "output"])
+
+# cache is "hit" (nothing rendered) or "built"; warnings are non-fatal notes (missing images)
+SiteResult = namedtuple("SiteResult", ["name", "output", "files", "bytes", "seconds", "cache", "warnings",
+                                       "error"])
+
+_minified = {}
+
+
+class SiteError(ValueError):
+    """Raised when a site's data or template cannot be built"""
+
+
+def discover_sites(root=HERE, out_dir=None):
+    """A SiteJob for every presentations/<name>/ with a site data file; outputs go to out_dir/<name>/"""
+    out_dir = out_dir or os.path.join(root, "build", "microsites")
+    jobs = []
+    presentations = os.path.join(root, "presentations")
+    if os.path.isdir(presentations):
+        for name in sorted(os.listdir(presentations)):
+            data = site_data_file(os.path.join(presentations, name))
+            if data:
+                jobs.append(SiteJob(name, data, os.path.join(out_dir, name)))
+    return jobs
+
+
+def site_data_file(folder):
+    """Path of the site data file in folder, or None"""
+    return next((os.path.join(folder, n) for n in SITE_NAMES if os.path.isfile(os.path.join(folder, n))), None)
+
+
+def load_data(path):
+    """A site data file (.json, .yaml or .yml) as a dict"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml  # PyYAML is only needed for YAML data
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise SiteError(f"{path}: site data must be a mapping")
+    return data
+
+
+def merge(defaults, overrides):
+    """defaults with overrides applied: mappings merge key by key, anything else is replaced"""
+    merged = dict(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = merge(merged[key], value)
+        merged[key] = value
+    return merged
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return _sha256(f.read())
+
+
+def fingerprint(path, content):
+    """path with a hash of content before its extension: styles.css -> styles.1a2b3c4d5e.css"""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{_sha256(content)[:FINGERPRINT_LENGTH]}{ext}"
+
+
+def rgba(color, alpha):
+    """A #RRGGBB color as a CSS rgba() with the given alpha"""
+    value = color.lstrip("#")
+    if not re.fullmatch(r"[0-9A-Fa-f]{6}", value):
+        raise SiteError(f"Expected a #RRGGBB color, not {color!r}")
+    red, green, blue = (int(value[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({red}, {green}, {blue}, {alpha})"
+
+
+def delay(index, step):
+    """The style attribute staggering the index'th animated card (none for the first)"""
+    from template_engine import Markup
+
+    return Markup(f' style="animation-delay: {index * step:.1f}s;"' if index else "")
+
+
+CSS_STRING = r""""(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'"""
+CSS_COMMENT = re.compile(rf"({CSS_STRING})|/\*.*?\*/", re.S)
+CSS_SPACE = re.compile(r"\s*([{};,>])\s*|:\s+|\s+")
+
+JS_TOKEN = re.compile(r"""
+    ("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)          # strings and template literals
+  | ((?<=[(,=:\[!&|?{};])\s*/(?![*/])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n])+/[a-z]*)  # regex literals
+  | (/\*.*?\*/)                                                          # block comments
+  | (//[^\n]*)                                                          # line comments
+  | (\s*\n\s*)                                                           # line breaks
+  | [ \t]+
+""", re.S | re.X)
+# No space is needed next to these
+JS_TIGHT = "{}()[];,:="
+# A line break after these, or before a closing bracket, cannot end a statement
+JS_OPEN = "{([;,:"
+JS_CLOSE = "})]"
+
+# Single spaces between words are left alone; every other whitespace run is a token
+HTML_TOKEN = re.compile(r"(<(pre|textarea|script|style)\b.*?</\2\s*>)|(<!--(?!\[if).*?-->)"
+                        r"|(?<=>)\s+|\s+(?=<)|\s{2,}|[^\S ]", re.S | re.I)
+HTML_TAG_NAME = re.compile(r"<(?:/?([a-zA-Z][\w-]*)|(!doctype))", re.I)
+# Whitespace next to these tags never renders
+HTML_BLOCKS = frozenset((
+    "html", "head", "body", "title", "meta", "link", "script", "style", "nav", "header", "footer", "main",
+    "section", "article", "aside", "div", "p", "ul", "ol", "li", "blockquote", "h1", "h2", "h3", "h4", "h5",
+    "h6", "table", "thead", "tbody", "tr", "td", "th", "form", "hr", "br",
+))
+
+
+def minify_css(text):
+    """CSS without comments or insignificant whitespace"""
+    text = CSS_COMMENT.sub(lambda m: m.group(1) or "", text)
+    out, pos = [], 0
+    for match in re.finditer(CSS_STRING, text):
+        out += [CSS_SPACE.sub(_css_space, text[pos:match.start()]), match.group(0)]
+        pos = match.end()
+    out.append(CSS_SPACE.sub(_css_space, text[pos:]))
+    return "".join(out).replace(";}", "}").strip()
+
+
+def _css_space(match):
+    if match.group(1):
+        return match.group(1)
+    return ":" if match.group(0).startswith(":") else " "
+
+
+def minify_js(text):
+    """JavaScript without comments, indentation or blank lines
+
+    Conservative: line breaks are kept wherever one could end a statement, so
+    automatic semicolon insertion still sees them, and names are kept.
+    """
+    out, prev, pos = [], "", 0
+    for match in JS_TOKEN.finditer(text):
+        code = text[pos:match.start()]
+        pos = match.end()
+        literal, regex, block, line, newline = match.groups()
+        following = text[pos:pos + 1]
+        if literal or regex:
+            piece = code + match.group(0)
+        elif block and "\n" in block:
+            piece = code + ("" if not (prev or code) or (code or prev)[-1] in JS_OPEN + "\n" else "\n")
+        elif block or line:
+            piece = code
+        elif newline is not None:
+            last = (code or prev)[-1:]
+            piece = code + ("" if not last or last in JS_OPEN + "\n" or following in JS_CLOSE else "\n")
+        else:
+            last = (code or prev)[-1:]
+            piece = code + ("" if not last or last in JS_TIGHT + "\n" or following in JS_TIGHT else " ")
+        if piece:
+            out.append(piece)
+            prev = piece
+    out.append(text[pos:])
+    return "".join(out).strip()
+
+
+def minify_html(text):
+    """HTML without comments or whitespace that cannot render
+
+    Whitespace runs become one space, and are dropped next to block-level
+    tags; pre, textarea, script and style elements are kept as they are.
+    """
+    out, pos = [], 0
+    for match in HTML_TOKEN.finditer(text):
+        out.append(text[pos:match.start()])
+        pos = match.end()
+        raw, _, comment = match.groups()
+        if raw:
+            out.append(raw)
+        elif not comment:
+            after_block = text[match.start() - 1:match.start()] == ">" and _block_tag(text, text.rfind("<", 0, match.start()))
+            out.append("" if after_block or _block_tag(text, pos) else " ")
+    out.append(text[pos:])
+    return "".join(out).strip()
+
+
+def _block_tag(text, start):
+    """True if a block-level tag starts at start"""
+    match = HTML_TAG_NAME.match(text, start) if start >= 0 else None
+    return bool(match) and (bool(match.group(2)) or match.group(1).lower() in HTML_BLOCKS)
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js, ".html": minify_html}
+
+
+def _minify(path, text):
+    """text minified for path's file type, memoized by content across sites"""
+    minify = MINIFIERS.get(os.path.splitext(path)[1].lower())
+    if minify is None:
+        return text
+    key = (minify.__name__, _sha256(text.encode("utf-8")))
+    if key not in _minified:
+        _minified[key] = minify(text)
+    return _minified[key]
+
+
+
+def _is_url(ref):
+    return ref.startswith(("#", "/", "data:", "mailto:")) or "://" in ref
+
+
+class _Site:
+    """The files of one site being rendered, and the asset files it read"""
+
+    def __init__(self, base_dir, template_dir):
+        self.base_dir = base_dir
+        self.template_dir = template_dir
+        self.files = {}
+        self.assets = {}
+        self.links = {}
+        self.warnings = []
+
+    def add(self, ref, content):
+        """Record content under ref's fingerprinted name; returns that name"""
+        target = os.path.normpath(ref).replace(os.sep, "/")
+        if target.startswith("../"):
+            target = f"assets/{os.path.basename(target)}"
+        name = fingerprint(target, content)
+        self.files[name] = content
+        return name
+
+    def asset(self, ref):
+        """The URL a page uses for ref: a rendered .css/.js, or a file beside the site data or in the template"""
+        if ref in self.links:
+            return self.links[ref]
+        if _is_url(ref):
+            return ref
+        path = next((p for p in (os.path.join(self.base_dir, ref), os.path.join(self.template_dir, ref))
+                     if os.path.isfile(p)), None)
+        if path is None:
+            self.warnings.append(f"{ref} not found; linked as is")
+            self.links[ref] = ref
+            return ref
+        with open(path, "rb") as f:
+            content = f.read()
+        self.assets[path] = _sha256(content)
+        self.links[ref] = self.add(ref, content)
+        return self.links[ref]
+
+
+def render_site(data, base_dir, template_dir=TEMPLATE_DIR, minify=True):
+    """{output path: bytes} for a site's merged data, plus the asset digests and warnings of the rendering
+
+    The stylesheets and scripts are rendered first so the page can link them
+    by their fingerprinted names.
+    """
+    from template_engine import load_template
+
+    site = _Site(base_dir, template_dir)
+    helpers = {"asset": site.asset, "delay": delay, "rgba": rgba}
+    names = sorted(n for n in os.listdir(template_dir) if n.endswith(TEXT_ASSETS)) + [PAGE]
+    for name in names:
+        text = load_template(os.path.join(template_dir, name)).render(data, **helpers)
+        if minify:
+            text = _minify(name, text)
+        if name == PAGE:
+            site.files[PAGE] = text.encode("utf-8")
+        else:
+            site.links[name] = site.add(name, text.encode("utf-8"))
+    return site.files, site.assets, site.warnings
+
+
+def headers(files):
+    """A _headers file: fingerprinted files are cached for good, the page is revalidated"""
+    lines = []
+    for name in sorted(files):
+        lines += [f"/{name}", f"  Cache-Control: {REVALIDATE if name == PAGE else IMMUTABLE}"]
+    lines += ["/", f"  Cache-Control: {REVALIDATE}"]
+    return "\n".join(lines) + "\n"
+
+
+def _site_key(data, base_dir, template_dir, minify):
+    h = hashlib.sha256()
+    for module in GENERATOR_MODULES:
+        h.update(_file_digest(os.path.join(HERE, module)).encode("ascii"))
+    for name in sorted(os.listdir(template_dir)):
+        path = os.path.join(template_dir, name)
+        if os.path.isfile(path):
+            h.update(f"{name}\0{_file_digest(path)}\0".encode("utf-8"))
+    h.update(json.dumps([data, base_dir, minify], sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _up_to_date(manifest, out_dir):
+    """True if every file a manifest lists is in out_dir and every asset it read is unchanged"""
+    for path, digest in manifest.get("assets", {}).items():
+        if not os.path.isfile(path) or _file_digest(path) != digest:
+            return False
+    return all(os.path.isfile(os.path.join(out_dir, name)) for name in manifest.get("files", ()))
+
+
+def _write_site(out_dir, files, manifest):
+    """Write files (fingerprinted ones only if missing), drop the previous build's leftovers, write _headers"""
+    for name, content in files.items():
+        path = os.path.join(out_dir, name)
+        if name == PAGE or not os.path.isfile(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(content)
+    for name in set(manifest.get("files", ())) - set(files):
+        path = os.path.join(out_dir, name)
+        if os.path.isfile(path):
+            os.remove(path)
+    with open(os.path.join(out_dir, "_headers"), "w", encoding="utf-8") as f:
+        f.write(headers(files))
+
+
+def build_site(job, template_dir=TEMPLATE_DIR, minify=True, force=False):
+    """Render one site into job.output unless it is up to date; returns a SiteResult"""
+    start = time.perf_counter()
+    try:
+        data = load_data(os.path.join(template_dir, "site.json"))
+        if os.path.abspath(job.data) != os.path.abspath(os.path.join(template_dir, "site.json")):
+            data = merge(data, load_data(job.data))
+        base_dir = os.path.dirname(os.path.abspath(job.data))
+        key = _site_key(data, base_dir, template_dir, minify)
+        manifest = _load_manifest(job.output)
+        if not force and manifest.get("key") == key and _up_to_date(manifest, job.output):
+            return SiteResult(job.name, job.output, len(manifest["files"]), manifest["bytes"],
+                              time.perf_counter() - start, "hit", manifest["warnings"], None)
+
+        files, assets, warnings = render_site(data, base_dir, template_dir, minify)
+        os.makedirs(job.output, exist_ok=True)
+        _write_site(job.output, files, manifest)
+        size = sum(len(content) for content in files.values())
+        with open(os.path.join(job.output, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump({"key": key, "files": sorted(files), "assets": assets, "bytes": size,
+                       "warnings": warnings}, f, indent=2)
+        return SiteResult(job.name, job.output, len(files), size, time.perf_counter() - start, "built",
+                          warnings, None)
+    except Exception:
+        import traceback
+        return SiteResult(job.name, job.output, 0, 0, time.perf_counter() - start, None, [],
+                          traceback.format_exc())
+
+
+def build_sites(jobs, template_dir=TEMPLATE_DIR, minify=True, force=False):
+    """build_site() for each job, yielding SiteResults
+
+    Sites are built in one process on purpose: compiled templates and
+    minified stylesheets and scripts are shared by every site that renders
+    the same text, so each further site costs a few milliseconds.
+    """
+    for job in jobs:
+        yield build_site(job, template_dir, minify, force)
@@ -0,0 +1,338 @@
+"""
+Structural diff of two PPTX files: which slides, shapes and text runs changed
+Every part of both files is hashed first; when all digests match the decks
+are the same and no XML is parsed. Otherwise each slide gets a fingerprint
+(its XML plus the content of the images and charts it uses, so renumbered
+media parts do not count as changes), slides are matched up in order by
+fingerprint, and only the slides that changed are parsed to find the shapes
+and runs that differ. Parts that record when or by what a file was written
+(docProps/) are ignored, so two builds of the same deck compare equal.
+
+    python deck_cli.py diff build/old.pptx build/new.pptx
+"""
+
+import difflib
+import hashlib
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+# Parts that describe the file rather than the deck
+METADATA_PARTS = re.compile(r"docProps/")
+
+# Parts covered by the slide fingerprints (or derived from the slide list)
+SLIDE_PARTS = re.compile(r"ppt/(slides|media|charts|embeddings|notesSlides)/|\[Content_Types\]\.xml$"
+                         r"|ppt/_rels/presentation\.xml\.rels$")
+
+# Related parts whose content (rather than their name) belongs to a slide's fingerprint
+OWNED_PARTS = re.compile(r"ppt/(media|charts|embeddings|notesSlides)/")
+
+SLIDE_ID_LIST = re.compile(rb"<p:sldIdLst>.*?</p:sldIdLst>", re.S)
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+# One slide: its fingerprint covers everything the slide shows
+SlideInfo = namedtuple("SlideInfo", ["partname", "fingerprint"])
+
+# The digests a diff needs from one file: every part's, one per slide in presentation
+# order, and settings (ppt/presentation.xml without its slide list: size, defaults, ...)
+PackageSummary = namedtuple("PackageSummary", ["path", "digests", "slides", "settings"])
+
+# kind is "+" (added), "-" (removed) or "~" (changed); old/new are 1-based slide
+# numbers (None on the side a slide is missing from); title is None when not read;
+# details describe shape changes
+SlideChange = namedtuple("SlideChange", ["kind", "old", "new", "title", "details"])
+
+# identical: same deck content; parts: changed parts outside the slides (layouts, theme, ...)
+PackageDiff = namedtuple("PackageDiff", ["identical", "slides", "parts"])
+
+
+class _Package:
+    """Read access to one .pptx: part bytes, digests and relationships"""
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._rels = {}
+
+    def close(self):
+        self._zip.close()
+
+    def read(self, partname):
+        return self._zip.read(partname)
+
+    def digests(self):
+        return {info.filename: hashlib.sha256(self._zip.read(info)).hexdigest()
+                for info in self._zip.infolist() if not info.is_dir()}
+
+    def rels(self, partname):
+        """{rId: (reltype, target)}; target is a partname, or the URL of an external target"""
+        if partname not in self._rels:
+            folder, name = posixpath.split(partname)
+            rels_name = posixpath.join(folder, "_rels", f"{name}.rels")
+            rels = {}
+            if rels_name in self._zip.NameToInfo:
+                for rel in ET.fromstring(self._zip.read(rels_name)).iter(f"{{{NS['rel']}}}Relationship"):
+                    target = rel.get("Target")
+                    if rel.get("TargetMode") != "External":
+                        target = posixpath.normpath(posixpath.join(folder, target)).lstrip("/")
+                    rels[rel.get("Id")] = (rel.get("Type").rsplit("/", 1)[-1], target)
+            self._rels[partname] = rels
+        return self._rels[partname]
+
+    def slide_partnames(self):
+        """Slide partnames in presentation order"""
+        presentation = ET.fromstring(self.read("ppt/presentation.xml"))
+        rels = self.rels("ppt/presentation.xml")
+        return [rels[sld_id.get(f"{{{NS['r']}}}id")][1]
+                for sld_id in presentation.iterfind("p:sldIdLst/p:sldId", NS)]
+
+
+def _fingerprint(package, digests, partname, seen=()):
+    """Digest of a part's bytes plus what its relationships point to"""
+    h = hashlib.sha256(digests[partname].encode("ascii"))
+    seen = seen + (partname,)
+    for rId, (reltype, target) in sorted(package.rels(partname).items()):
+        if reltype == "slide":
+            continue  # a notes slide's link back to its slide, whose number may have changed
+        h.update(f"\0{rId}\0{reltype}\0".encode("utf-8"))
+        if OWNED_PARTS.match(target) and target in digests and target not in seen:
+            h.update(_fingerprint(package, digests, target, seen).encode("ascii"))
+        else:
+            h.update(target.encode("utf-8"))  # layouts by name; their content is compared as a part
+    return h.hexdigest()
+
+
+def _text(element):
+    return "".join(t.text or "" for t in element.iterfind(".//a:t", NS))
+
+
+def _slide_title(xml):
+    tree = ET.fromstring(xml)
+    shapes = list(tree.iterfind(".//p:sp", NS))
+    for shape in shapes:
+        ph = shape.find("p:nvSpPr/p:nvPr/p:ph", NS)
+        if ph is not None and ph.get("type") in ("title", "ctrTitle"):
+            return _text(shape).strip()
+    return next((_text(shape).strip() for shape in shapes if _text(shape).strip()), "")
+
+
+def summarize(path):
+    """PackageSummary of a .pptx: part digests and a SlideInfo per slide"""
+    package = _Package(path)
+    try:
+        digests = package.digests()
+        slides = [SlideInfo(name, _fingerprint(package, digests, name)) for name in package.slide_partnames()]
+        settings = hashlib.sha256(SLIDE_ID_LIST.sub(b"", package.read("ppt/presentation.xml"))).hexdigest()
+        return PackageSummary(path, digests, slides, settings)
+    finally:
+        package.close()
+
+
+def same_content(old, new):
+    """True if two PackageSummaries have the same parts, apart from metadata"""
+    return _content_digests(old) == _content_digests(new)
+
+
+def _content_digests(summary):
+    return {name: digest for name, digest in summary.digests.items() if not METADATA_PARTS.match(name)}
+
+
+def changed_parts(old, new):
+    """Changed parts other than slides and their media, e.g. layouts, masters and the theme"""
+    names = sorted(set(old.digests) | set(new.digests))
+    changed = [name for name in names
+               if old.digests.get(name) != new.digests.get(name)
+               and not METADATA_PARTS.match(name) and not SLIDE_PARTS.match(name)]
+    if "ppt/presentation.xml" in changed and old.settings == new.settings:
+        changed.remove("ppt/presentation.xml")  # only the slide list changed; reported per slide
+    return changed
+
+
+def slide_changes(old, new, titles=True):
+    """SlideChanges (without details) between two PackageSummaries
+
+    titles reads each changed slide's title from the summarized files, which
+    must not have been overwritten since.
+    """
+    changes = []
+    matcher = difflib.SequenceMatcher(None, [s.fingerprint for s in old.slides],
+                                      [s.fingerprint for s in new.slides], autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if op == "replace" else 0
+        for k in range(paired):
+            changes.append(SlideChange("~", i1 + k + 1, j1 + k + 1, None, None))
+        changes += [SlideChange("-", i + 1, None, None, None) for i in range(i1 + paired, i2)]
+        changes += [SlideChange("+", None, j + 1, None, None) for j in range(j1 + paired, j2)]
+    if titles and changes:
+        changes = _with_titles(changes, old, new)
+    return changes
+
+
+def _with_titles(changes, old, new):
+    a, b = _Package(old.path), _Package(new.path)
+    try:
+        return [change._replace(title=_slide_title(a.read(old.slides[change.old - 1].partname)
+                                                   if change.kind == "-" else
+                                                   b.read(new.slides[change.new - 1].partname)))
+                for change in changes]
+    finally:
+        a.close()
+        b.close()
+
+
+def summary_changes(old, new):
+    """format_diff() lines between two PackageSummaries, without titles or details; [] if unchanged
+
+    Cheap enough to run on every build; the new file may overwrite the old one
+    once old has been summarized.
+    """
+    if same_content(old, new):
+        return []
+    diff = PackageDiff(False, slide_changes(old, new, titles=False), changed_parts(old, new))
+    return format_diff(diff) or ["~ package content"]
+
+
+def diff_packages(old_path, new_path, details=True):
+    """PackageDiff of two .pptx files; details adds shape/run-level lines to changed slides"""
+    old, new = summarize(old_path), summarize(new_path)
+    if same_content(old, new):
+        return PackageDiff(True, [], [])
+    changes = slide_changes(old, new)
+    if details and any(change.kind == "~" for change in changes):
+        a, b = _Package(old_path), _Package(new_path)
+        try:
+            changes = [change._replace(details=_slide_details(
+                a, old.slides[change.old - 1].partname, b, new.slides[change.new - 1].partname))
+                if change.kind == "~" else change for change in changes]
+        finally:
+            a.close()
+            b.close()
+    parts = changed_parts(old, new)
+    return PackageDiff(not changes and not parts, changes, parts)
+
+
+def _shapes(package, partname):
+    """[(label, element)] for the top-level shapes of a slide"""
+    tree = ET.fromstring(package.read(partname))
+    shapes = []
+    for element in tree.find("p:cSld/p:spTree", NS):
+        c_nv_pr = element.find("*/p:cNvPr", NS)
+        if c_nv_pr is not None:
+            shapes.append((c_nv_pr.get("name") or element.tag.rsplit("}", 1)[-1], element))
+    return shapes
+
+
+def _runs(element):
+    """[[(run text, run properties XML)] per paragraph] of a shape's text"""
+    return [[(run.findtext("a:t", "", NS), _xml(run.find("a:rPr", NS))) for run in p.iterfind("a:r", NS)]
+            for p in element.iterfind(".//a:p", NS)]
+
+
+def _xml(element):
+    return b"" if element is None else ET.tostring(element)
+
+
+def _quote(text, limit=60):
+    return repr(text if len(text) <= limit else text[:limit - 1] + "…")
+
+
+def _shape_details(label, old, new, old_package, old_slide, new_package, new_slide):
+    """Lines describing how one shape changed"""
+    lines = []
+    if _geometry(old) != _geometry(new):
+        lines.append(f"~ {label}: moved or resized")
+    old_runs, new_runs = _runs(old), _runs(new)
+    if old_runs != new_runs:
+        old_paragraphs = ["".join(text for text, _ in p) for p in old_runs]
+        new_paragraphs = ["".join(text for text, _ in p) for p in new_runs]
+        matcher = difflib.SequenceMatcher(None, old_paragraphs, new_paragraphs, autojunk=False)
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    if old_runs[i] != new_runs[j]:
+                        lines.append(f"~ {label}: paragraph {j + 1} formatting")
+                continue
+            for i in range(i1, i2) if op != "replace" or i2 - i1 != j2 - j1 else ():
+                lines.append(f"- {label}: paragraph {i + 1} {_quote(old_paragraphs[i])}")
+            for j in range(j1, j2) if op != "replace" or i2 - i1 != j2 - j1 else ():
+                lines.append(f"+ {label}: paragraph {j + 1} {_quote(new_paragraphs[j])}")
+            if op == "replace" and i2 - i1 == j2 - j1:
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    lines += _run_details(label, j + 1, old_runs[i], new_runs[j])
+    if _targets(old_package, old_slide, old) != _targets(new_package, new_slide, new):
+        lines.append(f"~ {label}: image or chart changed")
+    if not lines and _xml(old) != _xml(new):
+        lines.append(f"~ {label}: formatting")
+    return lines
+
+
+def _run_details(label, number, old_runs, new_runs):
+    if len(old_runs) != len(new_runs):
+        return [f"~ {label}: paragraph {number} {_quote(''.join(t for t, _ in old_runs))} -> "
+                f"{_quote(''.join(t for t, _ in new_runs))}"]
+    lines = []
+    for index, ((old_text, old_props), (new_text, new_props)) in enumerate(zip(old_runs, new_runs), 1):
+        if old_text != new_text:
+            lines.append(f"~ {label}: paragraph {number} run {index} {_quote(old_text)} -> {_quote(new_text)}")
+        elif old_props != new_props:
+            lines.append(f"~ {label}: paragraph {number} run {index} formatting")
+    return lines
+
+
+def _geometry(element):
+    xfrm = next((x for x in (element.find("p:spPr/a:xfrm", NS), element.find("p:xfrm", NS),
+                             element.find("p:grpSpPr/a:xfrm", NS)) if x is not None), None)
+    return _xml(xfrm)
+
+
+def _targets(package, slide, element):
+    """Digests of the parts a shape refers to (picture, chart), in reference order"""
+    rels = package.rels(slide)
+    refs = [value for node in element.iter() for key, value in node.attrib.items()
+            if key.startswith(f"{{{NS['r']}}}") and value in rels]
+    return tuple(hashlib.sha256(package.read(rels[ref][1])).hexdigest()
+                 if rels[ref][1] in package._zip.NameToInfo else rels[ref][1] for ref in refs)
+
+
+def _slide_details(old_package, old_slide, new_package, new_slide):
+    """Lines describing the shape and run changes between two versions of a slide"""
+    old_shapes, new_shapes = _shapes(old_package, old_slide), _shapes(new_package, new_slide)
+    lines = []
+    matcher = difflib.SequenceMatcher(None, [label for label, _ in old_shapes],
+                                      [label for label, _ in new_shapes], autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == "equal":
+            for (label, old), (_, new) in zip(old_shapes[i1:i2], new_shapes[j1:j2]):
+                lines += _shape_details(label, old, new, old_package, old_slide, new_package, new_slide)
+            continue
+        lines += [f"- {label}" for label, _ in old_shapes[i1:i2]]
+        lines += [f"+ {label}" for label, _ in new_shapes[j1:j2]]
+    if not lines:
+        # Same shapes and text: the difference is in slide-level XML (background, transitions, ...)
+        lines.append("~ slide properties")
+    return lines
+
+
+def format_diff(diff):
+    """Lines describing a PackageDiff, in the style of deck_cli diff for specs"""
+    lines = []
+    for change in diff.slides:
+        number = change.new if change.kind != "-" else change.old
+        title = f"  {change.title}" if change.title else ""
+        if change.kind == "~" and change.old != change.new:
+            lines.append(f"~ slide {number} (was {change.old}){title}")
+        else:
+            lines.append(f"{change.kind} slide {number}{title}")
+        lines += [f"    {detail}" for detail in change.details or ()]
+    lines += [f"~ part {name}" for name in diff.parts]
+    return lines
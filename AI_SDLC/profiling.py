@@ -0,0 +1,204 @@
+"""
+Per-slide and per-phase timing for deck builds
+Rendering code marks its phases with phase(name) and its slides with
+slide(slide_id). With no hook registered these are shared no-op contexts, so
+an ordinary build pays next to nothing. A Profiler (or any callable passed to
+add_hook) receives one PhaseEvent per finished phase: its wall time, the net
+number of memory blocks it allocated and, with trace_memory, the net bytes
+traced by tracemalloc. Reports are written as a JSON summary or as a Chrome
+trace (chrome://tracing, Perfetto).
+
+Phases: compile (spec to slide model), layout (add_slide and background),
+shapes (text boxes, cards, tables, images, charts), text (filling text
+frames), attach (stored slides reused by a graph build), serialize (part XML
+to bytes) and zip (compressing into the output file).
+
+    python create_ppt_from_website.py --profile build/profile.json --profile-format chrome
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
+
+PHASES = ("compile", "layout", "shapes", "text", "attach", "serialize", "zip")
+
+PROFILE_FORMATS = ("json", "chrome")
+
+# start is seconds since the profile began; blocks and bytes are net allocations
+# (bytes is None unless tracemalloc is tracing); thread is threading.get_ident()
+PhaseEvent = namedtuple("PhaseEvent", ["name", "slide", "start", "seconds", "blocks", "bytes", "thread"])
+
+_hooks = []
+_local = threading.local()
+_origin = time.perf_counter()
+_NULL = nullcontext()
+
+
+def add_hook(hook):
+    """Call hook(PhaseEvent) for every phase and slide finished from now on"""
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    _hooks.remove(hook)
+
+
+def current_slide():
+    return getattr(_local, "slide", None)
+
+
+def _traced_bytes():
+    import tracemalloc
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+@contextmanager
+def _timed(name, slide):
+    blocks, traced = sys.getallocatedblocks(), _traced_bytes()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        after = _traced_bytes()
+        event = PhaseEvent(name, slide, start - _origin, seconds, sys.getallocatedblocks() - blocks,
+                           after - traced if after is not None and traced is not None else None,
+                           threading.get_ident())
+        for hook in list(_hooks):
+            hook(event)
+
+
+def phase(name):
+    """Context manager timing one phase of the current slide (a no-op without hooks)"""
+    if not _hooks:
+        return _NULL
+    return _timed(name, current_slide())
+
+
+@contextmanager
+def _slide_scope(slide_id):
+    outer, _local.slide = current_slide(), slide_id
+    try:
+        with _timed("slide", slide_id):
+            yield
+    finally:
+        _local.slide = outer
+
+
+def slide(slide_id):
+    """Context manager attributing the phases inside it to slide_id (a no-op without hooks)"""
+    if not _hooks:
+        return _NULL
+    return _slide_scope(slide_id)
+
+
+class Profiler:
+    """Collects PhaseEvents while active
+
+        with Profiler() as profiler:
+            write_deck(deck, path)
+        profiler.write("profile.json", "chrome")
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.events = []
+        self.start = self.seconds = None
+        self._started_tracing = False
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def __enter__(self):
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+        add_hook(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.perf_counter() - self.start
+        remove_hook(self)
+        if self._started_tracing:
+            import tracemalloc
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def summary(self):
+        """Totals per phase and per slide, as a JSON-ready dict"""
+        phases, slides = {}, {}
+        for event in self.events:
+            if event.name == "slide":
+                entry = slides.setdefault(event.slide, {"slide": event.slide, "seconds": 0.0, "phases": {}})
+                entry["seconds"] += event.seconds
+                continue
+            total = phases.setdefault(event.name, {"seconds": 0.0, "count": 0, "blocks": 0, "bytes": None})
+            total["seconds"] += event.seconds
+            total["count"] += 1
+            total["blocks"] += event.blocks
+            if event.bytes is not None:
+                total["bytes"] = (total["bytes"] or 0) + event.bytes
+            if event.slide is not None:
+                per_slide = slides.setdefault(event.slide, {"slide": event.slide, "seconds": 0.0, "phases": {}})
+                per_slide["phases"][event.name] = per_slide["phases"].get(event.name, 0.0) + event.seconds
+        return {"seconds": self.seconds, "phases": phases, "slides": list(slides.values())}
+
+    def chrome_trace(self):
+        """The events in Chrome's trace event format"""
+        pid = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {"name": event.name, "cat": "slide" if event.name == "slide" else "phase", "ph": "X",
+                 "ts": round(event.start * 1e6, 3), "dur": round(event.seconds * 1e6, 3),
+                 "pid": pid, "tid": event.thread,
+                 "args": {"slide": event.slide, "blocks": event.blocks, "bytes": event.bytes}}
+                for event in self.events
+            ],
+        }
+
+    def write(self, path, fmt="json"):
+        """Write the summary ("json") or a Chrome trace ("chrome") to path"""
+        if fmt not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format: {fmt}")
+        report = self.chrome_trace() if fmt == "chrome" else self.summary()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=None if fmt == "chrome" else 2)
+
+    def print_summary(self):
+        summary = self.summary()
+        print(f"✓ Profiled build: {summary['seconds']:.3f}s, {len(summary['slides'])} slides")
+        for name in sorted(summary["phases"], key=lambda n: -summary["phases"][n]["seconds"]):
+            total = summary["phases"][name]
+            print(f"  {name:<10} {total['seconds']:8.3f}s  {total['count']:>6} calls  "
+                  f"{total['blocks']:>+9} blocks")
+
+
+def profile_options(argv):
+    """(path, format, trace_memory) from --profile PATH [--profile-format F] [--profile-memory], or None"""
+    import argparse
+
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile")
+    parser.add_argument("--profile-format", choices=PROFILE_FORMATS, default="json")
+    parser.add_argument("--profile-memory", action="store_true")
+    args, _ = parser.parse_known_args(argv)
+    return (args.profile, args.profile_format, args.profile_memory) if args.profile else None
+
+
+def profile_build(build, path, fmt="json", trace_memory=False):
+    """Run build() under a Profiler, print per-phase totals and write the report to path"""
+    with Profiler(trace_memory) as profiler:
+        result = build()
+    profiler.print_summary()
+    profiler.write(path, fmt)
+    print(f"✓ Profile ({fmt}) saved to: {path}")
+    return result
@@ -0,0 +1,410 @@
+"""
+Extract a PowerPoint deck directly from a Reveal.js presentation
+Streams index.html through an incremental parser, one <section> at a time
+"""
+
+import json
+import os
+import re
+import sys
+from collections import deque
+from html.parser import HTMLParser
+
+from chartjs import chart_slide_specs
+
+CHUNK_SIZE = 64 * 1024
+
+# Tags whose contents never end up on a slide
+SKIP_TAGS = {"script", "style", "svg", "noscript", "template", "button", "canvas"}
+
+# Elements whose text becomes one paragraph
+TEXT_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6", "p", "li"}
+
+CALLOUT_CLASSES = {"callout", "problem-box", "solution-box"}
+
+# Named styles referenced by extracted slides (same vocabulary as decks/*.json)
+EXTRACTED_STYLES = {
+    "slide_title": {"size": 40, "bold": True, "color": "AA_RED"},
+    "heading": {"size": 20, "bold": True, "color": "AA_DARK_BLUE", "space_before": 12},
+    "callout": {"size": 20, "bold": True, "color": "AA_RED", "space_before": 20},
+    "metric": {"size": 24, "bold": True, "color": "AA_DARK_BLUE", "space_before": 12},
+    "bullet": {"size": 16, "level": 1},
+    "hero_title": {"size": 54, "bold": True, "color": "WHITE", "align": "center"},
+    "hero_subtitle": {"size": 32, "color": "AA_LIGHT_BLUE", "align": "center"},
+    "hero_meta": {"size": 14, "color": "AA_SILVER", "align": "center"},
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+# A stat counter the page's script animates: id and initial DOM text, resolved once the scripts are read
+COUNTER = "\x00{}\x01{}\x00"
+COUNTER_PATTERN = re.compile("\x00([^\x01]*)\x01([^\x00]*)\x00")
+
+# Script values for element ids: animateCounter('velocity-gain', 40) or getElementById('x').textContent = '3'
+COUNTER_CALL = re.compile(r"""\(\s*['"]([\w-]+)['"]\s*,\s*(-?\d+(?:\.\d+)?)\s*[,)]""")
+TEXT_ASSIGNMENT = re.compile(
+    r"""getElementById\(\s*['"]([\w-]+)['"]\s*\)\.(?:textContent|innerText)\s*=\s*(['"])([^'"]*)\2""")
+
+
+def _clean(text):
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class _SectionBuilder:
+    """Collects the text blocks of one <section> until it closes"""
+
+    def __init__(self, attrs):
+        self.id = attrs.get("id")
+        self.classes = set((attrs.get("class") or "").split())
+        self.blocks = []  # (kind, text, context) in document order
+        self.images = []  # local <img> srcs, relative to the HTML file
+
+    def add(self, kind, text, context):
+        if text:
+            self.blocks.append((kind, text, context))
+
+    def to_slide_spec(self, index):
+        """Map collected blocks onto a deck-spec slide dict (None if empty)"""
+        if not self.blocks:
+            return None
+        slide_id = self.id or f"section{index + 1}"
+        title_block = next((b for b in self.blocks if b[0] in ("h1", "h2")), None)
+        if "title-slide" in self.classes or (title_block and title_block[0] == "h1"):
+            return self._hero_spec(slide_id)
+
+        slide = {"id": slide_id, "sections": []}
+        if title_block:
+            slide["title"] = title_block[1]
+        sections = slide["sections"]
+        metric = None
+        for block in self.blocks:
+            kind, text, context = block
+            if block is title_block:
+                continue
+            if context == "stat-number":
+                metric = text
+            elif context == "stat-label":
+                heading = f"{metric} {text}" if metric else text
+                section = {"heading": heading, "heading_style": "metric"}
+                if metric and COUNTER_PATTERN.search(metric):
+                    section["_counter"] = (metric, text)
+                sections.append(section)
+                metric = None
+            elif kind in ("h1", "h2", "h3", "h4", "h5", "h6"):
+                style = "callout" if context == "callout" else "heading"
+                sections.append({"heading": text, "heading_style": style,
+                                 "bullets": [], "bullet_style": "bullet"})
+            else:
+                if not sections or "bullets" not in sections[-1]:
+                    sections.append({"bullets": [], "bullet_style": "bullet"})
+                sections[-1]["bullets"].append(text)
+        return slide
+
+    def _hero_spec(self, slide_id):
+        """Title-style section: big centered title, subtitle and meta line"""
+        lines = []
+        subtitle = None
+        meta = []
+        for kind, text, context in self.blocks:
+            if kind == "h1" and not lines:
+                lines = [line for line in (_clean(part) for part in text.split("\n")) if line]
+            elif context == "meta":
+                meta.append(text)
+            elif subtitle is None and kind == "p":
+                subtitle = text
+            elif kind in ("h3", "h4"):
+                meta.append(text)
+        title = lines[0] if lines else ""
+        subtitle_lines = lines[1:] + ([subtitle] if subtitle else [])
+        textboxes = [{"left": 0.5, "top": 2.5, "width": 9, "height": 1.5,
+                      "text": title, "style": "hero_title"}]
+        if subtitle_lines:
+            textboxes.append({"left": 1, "top": 4.2, "width": 8, "height": 0.8,
+                              "text": "\n".join(subtitle_lines), "style": "hero_subtitle"})
+        if meta:
+            textboxes.append({"left": 1, "top": 6.5, "width": 8, "height": 0.5,
+                              "text": " • ".join(meta), "style": "hero_meta"})
+        spec = {"id": slide_id, "layout": "blank", "background": "AA_DARK_BLUE",
+                "textboxes": textboxes}
+        if self.images:
+            # Logo centered above the title
+            spec["images"] = [{"src": self.images[0], "top": 0.6, "height": 1.5}]
+        return spec
+
+
+class RevealParser(HTMLParser):
+    """Incremental (SAX-style) parser that emits one slide spec per <section>
+
+    Only the sections still open and the text block being read are held in
+    memory, so input size does not affect peak memory. iter_slide_specs also
+    holds a slide whose stat counter a later script sets, but only until that
+    script has been read.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.slides = deque()  # completed slide specs, drained by the caller
+        self._sections = []
+        self._skip_depth = 0
+        self._text_tag = None
+        self._text_depth = 0
+        self._text = []
+        self._context_stack = []  # (tag, context) for divs that change meaning
+        self._count = 0
+        self.chart_scripts = []  # inline scripts that create Chart.js charts
+        self.counter_values = {}  # element id -> value a script gives it
+        self._script = None
+        self._replace_tag = None  # element whose text is replaced (data-target or counter)
+        self._replace_depth = 0
+        self._counter = None  # (id, initial text) of the counter being read
+
+    def _context(self):
+        return self._context_stack[-1][1] if self._context_stack else None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "script":
+            self._script = []
+        if tag == "section":
+            self._sections.append(_SectionBuilder(dict(attrs)))
+            return
+        if not self._sections:
+            return
+        if self._skip_depth or tag in SKIP_TAGS:
+            self._skip_depth += tag in SKIP_TAGS
+            return
+        if tag == "br":
+            if self._text_tag:
+                self._text.append("\n")
+            return
+        if tag == "img":
+            src = dict(attrs).get("src")
+            if src and not src.startswith(("http:", "https:", "data:", "//")):
+                self._sections[-1].images.append(src)
+            return
+        if self._replace_tag:
+            self._replace_depth += tag == self._replace_tag
+            return
+        if self._text_tag:
+            self._text_depth += tag == self._text_tag
+            self._replace_text(tag, dict(attrs))
+            return
+
+        classes = set((dict(attrs).get("class") or "").split())
+        if tag in TEXT_TAGS:
+            self._text_tag = tag
+            self._text_depth = 1
+            self._text = []
+            if "meta" in classes:
+                self._context_stack.append((tag, "meta"))
+            return
+        if "stat-number" in classes or "stat-label" in classes:
+            self._text_tag = tag
+            self._text_depth = 1
+            self._text = []
+            self._context_stack.append((tag, "stat-number" if "stat-number" in classes else "stat-label"))
+            self._replace_text(tag, dict(attrs))
+        elif classes & CALLOUT_CLASSES:
+            self._context_stack.append((tag, "callout"))
+        elif tag == "div" and self._context_stack:
+            self._context_stack.append((tag, self._context()))
+
+    def _replace_text(self, tag, attrs):
+        """Read an animated stat by its final value: data-target, or what a script sets its id to"""
+        if "data-target" in attrs:
+            self._text.append(attrs["data-target"] + attrs.get("data-suffix", ""))
+        elif attrs.get("id") and self._context() == "stat-number":
+            self._counter = (attrs["id"], [])
+        else:
+            return
+        self._replace_tag, self._replace_depth = tag, 1
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._script is not None:
+            script = "".join(self._script)
+            if "new Chart" in script:
+                self.chart_scripts.append(script)
+            self.counter_values.update(COUNTER_CALL.findall(script))
+            self.counter_values.update((m.group(1), m.group(3)) for m in TEXT_ASSIGNMENT.finditer(script))
+            self._script = None
+        if tag == "section":
+            if self._sections:
+                spec = self._sections.pop().to_slide_spec(self._count)
+                if spec is not None:
+                    self.slides.append(spec)
+                    self._count += 1
+            return
+        if not self._sections:
+            return
+        if self._skip_depth:
+            self._skip_depth -= tag in SKIP_TAGS
+            return
+        if self._replace_tag == tag:
+            self._replace_depth -= 1
+            if not self._replace_depth:
+                self._replace_tag = None
+                if self._counter:
+                    counter_id, initial = self._counter
+                    self._text.append(COUNTER.format(counter_id, _clean("".join(initial))))
+                    self._counter = None
+        if self._replace_tag:
+            return
+        if self._text_tag:
+            if tag != self._text_tag:
+                return
+            self._text_depth -= 1
+            if self._text_depth:
+                return
+            text = "".join(self._text)
+            text = text if tag == "h1" else text.replace("\n", " ")
+            context = self._context()
+            kind = tag if tag in TEXT_TAGS else "p"
+            self._sections[-1].add(kind, text.strip() if tag == "h1" else _clean(text), context)
+            self._text_tag = None
+            self._text = []
+        if self._context_stack and self._context_stack[-1][0] == tag:
+            self._context_stack.pop()
+
+    def handle_data(self, data):
+        if self._script is not None:
+            self._script.append(data)
+            return
+        if self._replace_tag:
+            if self._counter:
+                self._counter[1].append(data)
+            return
+        if self._text_tag and not self._skip_depth:
+            self._text.append(data)
+
+
+def resolve_counters(slide, values):
+    """slide with its counter stats filled in from values (id -> value)
+
+    A counter no script sets keeps its initial text, unless that is a zero
+    placeholder: then the stat is left without a number rather than read 0.
+    """
+    for section in slide.get("sections", []):
+        counter = section.pop("_counter", None)
+        if counter is None:
+            continue
+        metric, label = counter
+        known = all(m.group(1) in values or not _is_zero(m.group(2)) for m in COUNTER_PATTERN.finditer(metric))
+        metric = COUNTER_PATTERN.sub(lambda m: values.get(m.group(1), m.group(2)), metric)
+        section["heading"] = f"{metric} {label}" if known else label
+    return slide
+
+
+def _is_zero(text):
+    try:
+        return float(text) == 0
+    except ValueError:
+        return not text
+
+
+def iter_slide_specs(path, chunk_size=CHUNK_SIZE):
+    """Yield deck-spec slide dicts from a Reveal.js file as each section closes"""
+    parser = RevealParser()
+    held = deque()  # slides from the first one with an unset counter on, in order
+    waiting = set()  # ids of the held counters no script has set yet
+    with open(path, encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            while parser.slides:
+                slide = parser.slides.popleft()
+                if held or _has_counter(slide):
+                    held.append(slide)
+                    waiting.update(_counter_ids(slide))
+                else:
+                    yield slide
+            waiting.difference_update(parser.counter_values)
+            while held and not waiting:
+                yield resolve_counters(held.popleft(), parser.counter_values)
+    parser.close()
+    for slide in held + parser.slides:
+        yield resolve_counters(slide, parser.counter_values)
+    # Chart.js charts live in the page scripts; each becomes a slide at the end
+    for script in parser.chart_scripts:
+        yield from chart_slide_specs(script)
+
+
+def _has_counter(slide):
+    return any("_counter" in section for section in slide.get("sections", []))
+
+
+def _counter_ids(slide):
+    return {match.group(1) for section in slide.get("sections", []) if "_counter" in section
+            for match in COUNTER_PATTERN.finditer(section["_counter"][0])}
+
+
+def deck_header(name, base_dir=None):
+    """Spec fields shared by every extracted deck (everything but the slides)"""
+    header = {"name": name, "slide_width": 10, "slide_height": 7.5, "styles": EXTRACTED_STYLES}
+    if base_dir:
+        header["base_dir"] = base_dir
+    return header
+
+
+def extract_deck_spec(path, name=None):
+    """Extract a complete deck spec dict (for saving as decks/*.json)"""
+    spec = deck_header(name or _deck_name(path), os.path.dirname(os.path.abspath(path)))
+    spec["slides"] = list(iter_slide_specs(path))
+    return spec
+
+
+def convert(path, output_path, name=None, compression="default"):
+    """Stream a Reveal.js file straight into a PPTX; returns the slide count"""
+    # Rendering modules load python-pptx; extracting specs alone never needs it
+    from deck_spec import DeckCompiler, new_presentation, prerender_deck_charts, render_slide
+    from streaming_writer import StreamingPackageWriter
+
+    compiler = DeckCompiler(deck_header(name or _deck_name(path), os.path.dirname(os.path.abspath(path))))
+    prs = new_presentation(compiler.width, compiler.height)
+    count = 0
+    chart_slides = []
+    with StreamingPackageWriter(prs, output_path, compression) as writer:
+        for index, slide_spec in enumerate(iter_slide_specs(path)):
+            for slide in compiler.compile_slides(slide_spec, index):
+                if slide.charts or chart_slides:
+                    # Chart slides come last; hold them so their charts build in parallel
+                    chart_slides.append(slide)
+                    continue
+                render_slide(prs, slide)
+                writer.flush()
+                count += 1
+        prerender_deck_charts(chart_slides)
+        for slide in chart_slides:
+            render_slide(prs, slide)
+            writer.flush()
+            count += 1
+    return count
+
+
+def _deck_name(path):
+    return os.path.basename(os.path.dirname(os.path.abspath(path))) or "deck"
+
+
+if __name__ == "__main__":
+    # Usage: python reveal_extractor.py INDEX_HTML [OUTPUT_PPTX] [--spec SPEC_JSON]
+    args = sys.argv[1:]
+    spec_path = None
+    if "--spec" in args:
+        i = args.index("--spec")
+        spec_path = args[i + 1]
+        del args[i:i + 2]
+    if not args:
+        print("Usage: python reveal_extractor.py INDEX_HTML [OUTPUT_PPTX] [--spec SPEC_JSON]")
+        sys.exit(2)
+    html_path = args[0]
+    if spec_path:
+        spec = extract_deck_spec(html_path)
+        # load_deck_spec() resolves base_dir relative to the spec file
+        spec["base_dir"] = os.path.relpath(spec["base_dir"], os.path.dirname(os.path.abspath(spec_path)))
+        with open(spec_path, "w", encoding="utf-8") as f:
+            json.dump(spec, f, indent=2, ensure_ascii=False)
+        print(f"✓ Deck spec saved to: {spec_path}")
+    output_path = args[1] if len(args) > 1 else os.path.join(os.path.dirname(html_path), "Extracted_Presentation.pptx")
+    count = convert(html_path, output_path)
+    print(f"✓ Presentation saved to: {output_path}")
+    print(f"✓ Total slides: {count}")
@@ -0,0 +1,308 @@
+"""
+Slide-level dependency graph for incremental deck builds
+A deck is an ordered list of slide nodes. Each node declares its inputs
+(content with styles and palette colors resolved, image digests, layout) and
+how to render itself. The node key is a hash of those inputs. A build renders only
+the nodes whose key has no entry in the slide store. All other slides are
+attached from the XML (and media/chart parts) captured by an earlier build,
+with no rendering at all, so editing one slide re-renders just that slide.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+from collections import namedtuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_CACHE_DIR = os.path.join(HERE, "build", ".cache", "slides")
+
+# Bump when the stored page format changes
+STORE_VERSION = "1"
+
+# Fewer nodes to render than this per worker are rendered in-process
+PARALLEL_MIN_NODES = 4
+
+_graph = None  # the graph being built, inherited by forked render workers
+
+# inputs maps input name -> value; the node key hashes their repr()
+SlideNode = namedtuple("SlideNode", ["id", "inputs", "render"])
+
+# A rendered slide: its XML and relationships [rId, reltype, kind, *refs] where
+# kind is "part" (partname), "image" (digest, ext), "chart" (xml digest,
+# xlsx digest) or "external" (target URL); blobs maps digest -> bytes
+StoredPage = namedtuple("StoredPage", ["xml", "rels", "blobs"])
+
+
+def _digest(*chunks):
+    h = hashlib.sha256()
+    for chunk in chunks:
+        h.update(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class SlideGraph:
+    """Slide nodes of one deck, in slide order"""
+
+    def __init__(self, width, height, generator=""):
+        self.width = width
+        self.height = height
+        self.generator = generator  # hash of the rendering code
+        self.nodes = []
+        self.prepare = None  # called with the nodes about to be rendered
+
+    def add(self, node_id, render, **inputs):
+        """Register render(prs) (adds one or more slides) under its declared inputs"""
+        node = SlideNode(node_id, inputs, render)
+        self.nodes.append(node)
+        return node
+
+    def key(self, node):
+        return _digest(STORE_VERSION, self.generator, repr((self.width, self.height)),
+                       *(f"{name}={node.inputs[name]!r}" for name in sorted(node.inputs)))
+
+
+def deck_graph(deck, generator=""):
+    """SlideGraph for a CompiledDeck: one node per spec slide (with its continuation pages)"""
+    from deck_spec import prerender_deck_charts, render_slide
+
+    def render(pages):
+        return lambda prs: [render_slide(prs, page) for page in pages]
+
+    graph = SlideGraph(deck.width, deck.height, generator)
+    # Build the charts of every slide that needs rendering up front, in parallel
+    graph.prepare = lambda nodes: prerender_deck_charts(
+        [page for node in nodes for page in node.inputs["content"]])
+    for slide_id, pages in itertools.groupby(deck.slides, key=lambda slide: slide.id):
+        pages = tuple(pages)
+        graph.add(slide_id, render(pages), content=pages,
+                  layout=tuple(page.layout for page in pages), assets=_image_digests(pages))
+    return graph
+
+
+def _image_digests(pages):
+    paths = [image.path for page in pages for image in page.images]
+    if not paths:
+        return ()
+    from assets import default_store
+    return tuple(default_store().source(path).digest for path in paths)
+
+
+class SlideStore:
+    """Content-addressed on-disk store of rendered slides, keyed by node key"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, key, ext):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{ext}")
+
+    def _write(self, path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, key):
+        """The StoredPages for a node key, or None if any piece is missing"""
+        try:
+            with open(self._path(key, "json"), encoding="utf-8") as f:
+                entries = json.load(f)
+            pages = []
+            for entry in entries:
+                blobs = {}
+                for rel in entry["rels"]:
+                    if rel[2] in ("image", "chart"):
+                        for digest in rel[3:5] if rel[2] == "chart" else rel[3:4]:
+                            with open(self._path(digest, "bin"), "rb") as f:
+                                blobs[digest] = f.read()
+                pages.append(StoredPage(entry["xml"].encode("utf-8"), entry["rels"], blobs))
+            return pages
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, pages):
+        # Blobs first: get() treats a present .json as a complete entry
+        for page in pages:
+            for digest, blob in page.blobs.items():
+                if not os.path.isfile(self._path(digest, "bin")):
+                    self._write(self._path(digest, "bin"), blob)
+        entries = [{"xml": page.xml.decode("utf-8"), "rels": page.rels} for page in pages]
+        self._write(self._path(key, "json"), json.dumps(entries).encode("utf-8"))
+
+
+def capture_pages(prs, start):
+    """StoredPages for the slides from index start on, or None if one cannot be reattached"""
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    from charts import capture_chart_parts
+
+    pages = []
+    for sld_id in prs.slides._sldIdLst.sldId_lst[start:]:
+        slide_part = prs.part.related_part(sld_id.rId)
+        rels, blobs = [], {}
+        for index, rel in enumerate(sorted(slide_part.rels.values(), key=lambda r: int(r.rId[3:]))):
+            if rel.rId != f"rId{index + 1}":
+                return None  # rIds are reassigned in order when reattaching
+            if rel.is_external:
+                rels.append([rel.rId, rel.reltype, "external", rel.target_ref])
+            elif rel.reltype == RT.SLIDE_LAYOUT:
+                rels.append([rel.rId, rel.reltype, "part", str(rel.target_part.partname)])
+            elif rel.reltype == RT.IMAGE:
+                digest = hashlib.sha256(rel.target_part.blob).hexdigest()
+                blobs[digest] = rel.target_part.blob
+                rels.append([rel.rId, rel.reltype, "image", digest, rel.target_part.partname.ext])
+            elif rel.reltype == RT.CHART:
+                chart = capture_chart_parts(rel.target_part)
+                xml_digest = hashlib.sha256(chart.chart_xml).hexdigest()
+                xlsx_digest = hashlib.sha256(chart.xlsx_blob).hexdigest()
+                blobs[xml_digest], blobs[xlsx_digest] = chart.chart_xml, chart.xlsx_blob
+                rels.append([rel.rId, rel.reltype, "chart", xml_digest, xlsx_digest])
+            else:
+                return None  # e.g. notes slides; always re-rendered
+        pages.append(StoredPage(slide_part.blob, rels, blobs))
+    return pages
+
+
+def template_layouts(prs):
+    """{partname: slide layout part} for prs's template"""
+    return {str(layout.part.partname): layout.part for layout in prs.slide_layouts}
+
+
+def attach_pages(prs, pages, layouts=None):
+    """Append stored slides to prs; returns False (adding nothing) if they do not fit its template"""
+    from pptx.opc.constants import CONTENT_TYPE as CT
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.parts.slide import SlidePart
+
+    from assets import _image_part
+
+    layouts = layouts or template_layouts(prs)
+    if any(rel[2] == "part" and rel[3] not in layouts for page in pages for rel in page.rels):
+        return False
+
+    package = prs.part.package
+    for page in pages:
+        slide_part = SlidePart.load(prs.part._next_slide_partname, CT.PML_SLIDE, package, page.xml)
+        for rId, reltype, kind, *refs in page.rels:
+            if kind == "external":
+                slide_part.relate_to(refs[0], reltype, is_external=True)
+                continue
+            if kind == "part":
+                target = layouts[refs[0]]
+            elif kind == "image":
+                target = _image_part(package, page.blobs[refs[0]], f"image.{refs[1]}")
+            else:
+                from charts import ChartParts, new_chart_part
+                target = new_chart_part(package, ChartParts(page.blobs[refs[0]], page.blobs[refs[1]]))
+            slide_part.relate_to(target, reltype)
+        # A new part has no existing relationship to reuse; skip relate_to()'s scan of every slide
+        _add_slide_id(prs.slides._sldIdLst, prs.part.rels._add_relationship(RT.SLIDE, slide_part))
+    return True
+
+
+def _add_slide_id(sld_id_lst, rId):
+    """add_sldId() without rescanning every id: appended slides always take the last id + 1"""
+    last = sld_id_lst[-1] if len(sld_id_lst) else None
+    next_id = int(last.get("id")) + 1 if last is not None else 256
+    if next_id > 2147483647:
+        return sld_id_lst.add_sldId(rId)  # wraps around to the first free id
+    return sld_id_lst._add_sldId(id=next_id, rId=rId)
+
+
+def _render_chunk(indices):
+    """StoredPages (or None if not capturable) for each of _graph's nodes at indices"""
+    from deck_spec import new_presentation
+
+    prs = new_presentation(_graph.width, _graph.height)
+    results = []
+    for index in indices:
+        start = len(prs.slides._sldIdLst)
+        _graph.nodes[index].render(prs)
+        results.append(capture_pages(prs, start))
+    return results
+
+
+def _fork_pool(workers):
+    """A process pool whose workers inherit this process's memory, or None where fork is unavailable"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        return ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+    except ValueError:
+        return None
+
+
+def render_parallel(graph, indices, workers):
+    """Render graph's nodes at indices across forked workers; yields their StoredPages in order
+
+    Each worker builds a contiguous run of slides in its own Presentation and
+    returns them as standalone parts (XML, rels and media). Yields None for a
+    node whose slides cannot be captured; the caller renders it itself.
+    """
+    global _graph
+
+    workers = min(workers, len(indices) // PARALLEL_MIN_NODES)
+    pool = _fork_pool(workers) if workers > 1 else None
+    if pool is None:
+        yield from (None for _ in indices)
+        return
+    _graph = graph  # rendering closures do not pickle: workers read the graph from forked memory
+    size = -(-len(indices) // (4 * workers))
+    try:
+        with pool:
+            for chunk in pool.map(_render_chunk, [indices[i:i + size] for i in range(0, len(indices), size)]):
+                yield from chunk
+    finally:
+        _graph = None
+
+
+def build_graph(graph, output_path, store=None, rebuild=False, compression="default", workers=1):
+    """Stream graph to output_path, rendering only nodes missing from the store
+
+    rebuild renders (and re-stores) every node. With workers > 1, the nodes
+    to render are built in that many forked processes and merged in slide
+    order, so the package is the same as a single-process build. Returns
+    (rendered, reused) node counts.
+    """
+    from deck_spec import new_presentation
+    from profiling import phase
+    from profiling import slide as profile_slide
+    from streaming_writer import StreamingPackageWriter
+
+    store = store or SlideStore()
+    keyed = [(node, graph.key(node)) for node in graph.nodes]
+    stored = {key: None if rebuild else store.get(key) for _, key in keyed}
+    missing = [index for index, (node, key) in enumerate(keyed) if stored[key] is None]
+    if graph.prepare:
+        graph.prepare([keyed[index][0] for index in missing])
+    # Charts are prerendered above, so forked workers inherit them
+    built = render_parallel(graph, missing, workers) if workers > 1 else (None for _ in missing)
+
+    prs = new_presentation(graph.width, graph.height)
+    layouts = template_layouts(prs)
+    rendered = reused = 0
+    with StreamingPackageWriter(prs, output_path, compression) as writer:
+        for node, key in keyed:
+            pages = next(built) if stored[key] is None else None
+            with profile_slide(node.id):
+                with phase("attach"):
+                    attached = stored[key] is not None and attach_pages(prs, stored[key], layouts)
+                if attached:
+                    reused += 1
+                elif pages is not None and attach_pages(prs, pages, layouts):
+                    store.put(key, pages)
+                    rendered += 1
+                else:
+                    start = len(prs.slides._sldIdLst)
+                    node.render(prs)
+                    pages = capture_pages(prs, start)
+                    if pages is not None:
+                        store.put(key, pages)
+                    rendered += 1
+                writer.flush()
+    return rendered, reused
@@ -0,0 +1,234 @@
+"""
+Precompiled slide-part templates
+Cards, progress bars, text boxes and backgrounds are built once with python-pptx,
+captured as lxml fragments, then deep-copied and patched (ids, position, text,
+colors) for every new instance instead of replaying the property setters.
+"""
+
+import re
+from copy import deepcopy
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.shapes.autoshape import Shape
+from pptx.util import Pt
+
+# Placeholder text/colors used while compiling; each slot gets a unique marker
+_TEXT_MARKER = "⁣slot:{}⁣"
+_COLOR_MARKER = "F0{:04X}"
+
+_LINE_BREAK = re.compile("\n|\v")
+
+
+class ShapeTemplate:
+    """A compiled shape fragment plus the locations of its patchable nodes"""
+
+    def __init__(self, element, name, text_slots, color_slots):
+        self.element = element
+        self.name = name
+        self._paths = {}
+        self._find_slots(element, (), text_slots, color_slots)
+
+    def _find_slots(self, node, path, text_slots, color_slots):
+        tag = node.tag
+        if tag == qn("a:off"):
+            self._paths["off"] = path
+        elif tag == qn("a:ext"):
+            self._paths["ext"] = path
+        elif tag == qn("p:cNvPr"):
+            self._paths["cNvPr"] = path
+        elif tag == qn("a:t") and node.text in text_slots:
+            # Patch at the run level so multi-line text can add runs/breaks
+            self._paths[("text", text_slots[node.text])] = path[:-1]
+        elif tag == qn("a:srgbClr") and node.get("val") in color_slots:
+            self._paths.setdefault(("color", color_slots[node.get("val")]), []).append(path)
+        for index, child in enumerate(node):
+            self._find_slots(child, path + (index,), text_slots, color_slots)
+
+    def instantiate(self, shapes, left, top, width, height, texts=None, colors=None):
+        """Append a patched copy of the template to a slide's shape tree"""
+        sp = deepcopy(self.element)
+
+        def at(path):
+            node = sp
+            for index in path:
+                node = node[index]
+            return node
+
+        # Resolve every node before patching; text patches can shift siblings
+        runs = [(at(self._paths[("text", slot)]), text) for slot, text in (texts or {}).items()]
+        fills = [(at(path), str(rgb)) for slot, rgb in (colors or {}).items()
+                 for path in self._paths[("color", slot)]]
+
+        shape_id = shapes._next_shape_id
+        c_nv_pr = at(self._paths["cNvPr"])
+        c_nv_pr.set("id", str(shape_id))
+        c_nv_pr.set("name", f"{self.name} {shape_id - 1}")
+        off = at(self._paths["off"])
+        off.set("x", str(int(left)))
+        off.set("y", str(int(top)))
+        ext = at(self._paths["ext"])
+        ext.set("cx", str(int(width)))
+        ext.set("cy", str(int(height)))
+
+        for node, rgb in fills:
+            node.set("val", rgb)
+        for run, text in runs:
+            _set_run_text(run, text)
+
+        shapes._spTree.insert_element_before(sp, "p:extLst")
+        # Templates are never placeholders, so skip the generic shape factory
+        return Shape(sp, shapes)
+
+
+def _set_run_text(run, text):
+    """Replace a single <a:r> with runs/breaks for text (same rules as python-pptx)"""
+    if text and not _LINE_BREAK.search(text):
+        run.find(qn("a:t")).text = text
+        return
+    parent = run.getparent()
+    position = parent.index(run)
+    parent.remove(run)
+    for index, line in enumerate(_LINE_BREAK.split(text)):
+        if index:
+            parent.insert(position, parent.makeelement(qn("a:br"), {}))
+            position += 1
+        if line:
+            new_run = deepcopy(run)
+            new_run.find(qn("a:t")).text = line
+            parent.insert(position, new_run)
+            position += 1
+
+
+class BackgroundTemplate:
+    """A compiled solid <p:bg> fragment with a patchable color"""
+
+    def __init__(self, element):
+        self.element = element
+
+    def apply(self, slide, color):
+        bg = deepcopy(self.element)
+        bg.find(".//" + qn("a:srgbClr")).set("val", str(color))
+        cSld = slide._element.cSld
+        old = cSld.bg
+        if old is not None:
+            cSld.remove(old)
+        cSld.insert(0, bg)
+
+
+def _scratch_slide():
+    prs = Presentation()
+    return prs.slides.add_slide(prs.slide_layouts[6])
+
+
+def _compile(build, name, text_slots=(), color_slots=()):
+    """Run build(slide, text_markers, color_markers) once and capture the shape"""
+    text_markers = {slot: _TEXT_MARKER.format(slot) for slot in text_slots}
+    color_markers = {slot: RGBColor.from_string(_COLOR_MARKER.format(index))
+                     for index, slot in enumerate(color_slots)}
+    shape = build(_scratch_slide(), text_markers, color_markers)
+    element = shape._element
+    element.getparent().remove(element)
+    return ShapeTemplate(
+        element, name,
+        {marker: slot for slot, marker in text_markers.items()},
+        {str(rgb): slot for slot, rgb in color_markers.items()},
+    )
+
+
+def _build_card(with_icon):
+    def build(slide, text, color):
+        card = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, 0, 0)
+        card.fill.solid()
+        card.fill.fore_color.rgb = color["fill"]
+        card.line.color.rgb = color["accent"]
+        card.line.width = Pt(2)
+        card.shadow.inherit = False
+
+        tf = card.text_frame
+        tf.clear()
+        if with_icon:
+            p = tf.add_paragraph()
+            p.text = text["icon"]
+            p.font.size = Pt(32)
+            p.font.bold = True
+            p.font.color.rgb = color["accent"]
+            p.alignment = PP_ALIGN.CENTER
+        p = tf.add_paragraph()
+        p.text = text["title"]
+        p.font.size = Pt(18)
+        p.font.bold = True
+        p.font.color.rgb = color["accent"]
+        p.alignment = PP_ALIGN.CENTER
+        p = tf.add_paragraph()
+        p.text = text["content"]
+        p.font.size = Pt(14)
+        p.font.color.rgb = color["body"]
+        p.alignment = PP_ALIGN.CENTER
+        return card
+    return build
+
+
+def _build_bar(slide, text, color):
+    bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, 0, 0, 0, 0)
+    bar.fill.solid()
+    bar.fill.fore_color.rgb = color["fill"]
+    bar.line.fill.background()
+    return bar
+
+
+def _build_text_box(size, bold, alignment):
+    def build(slide, text, color):
+        box = slide.shapes.add_textbox(0, 0, 0, 0)
+        tf = box.text_frame
+        tf.text = text["text"]
+        p = tf.paragraphs[0]
+        p.font.size = Pt(size)
+        if bold:
+            p.font.bold = True
+        p.font.color.rgb = color["color"]
+        p.alignment = alignment
+        return box
+    return build
+
+
+_templates = {}
+
+
+def _template(key, factory):
+    template = _templates.get(key)
+    if template is None:
+        template = _templates[key] = factory()
+    return template
+
+
+def card_template(with_icon):
+    """Card: text slots icon/title/content, color slots accent/fill/body"""
+    text_slots = ("icon", "title", "content") if with_icon else ("title", "content")
+    return _template(("card", with_icon), lambda: _compile(
+        _build_card(with_icon), "Rectangle", text_slots, ("accent", "fill", "body")))
+
+
+def bar_template():
+    """Borderless filled rectangle (progress bar track or fill): color slot fill"""
+    return _template(("bar",), lambda: _compile(_build_bar, "Rectangle", (), ("fill",)))
+
+
+def text_box_template(size, bold=False, alignment=PP_ALIGN.CENTER):
+    """Single-paragraph text box: text slot text, color slot color"""
+    return _template(("text", size, bold, alignment), lambda: _compile(
+        _build_text_box(size, bold, alignment), "TextBox", ("text",), ("color",)))
+
+
+def background_template():
+    """Solid slide background"""
+    def factory():
+        slide = _scratch_slide()
+        fill = slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = RGBColor(0, 0, 0)
+        return BackgroundTemplate(deepcopy(slide._element.cSld.bg))
+    return _template(("background",), factory)
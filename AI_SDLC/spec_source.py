@@ -0,0 +1,50 @@
+"""
+Deck sources as plain spec dicts, without python-pptx
+Loads deck spec files (JSON/YAML) and Reveal.js pages into the dicts the deck
+compiler takes. Nothing here imports the renderer, so tools that only list,
+diff or hash decks start in a few milliseconds.
+"""
+
+import json
+import os
+
+SPEC_EXTENSIONS = (".json", ".yaml", ".yml")
+HTML_EXTENSIONS = (".html", ".htm")
+
+
+def load_deck_spec(path):
+    """Load a deck spec from a .json, .yaml or .yml file"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            import yaml  # PyYAML is only needed for YAML specs
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    # Image paths are relative to base_dir, itself relative to the spec file
+    spec["base_dir"] = os.path.abspath(os.path.join(os.path.dirname(path), spec.get("base_dir", ".")))
+    return spec
+
+
+def asset_path(base_dir, src):
+    """Resolve an image src against a spec's base_dir"""
+    return os.path.join(base_dir or "", src)
+
+
+def slide_id(slide_spec, index):
+    """A slide's spec id; unnamed slides are numbered from 1"""
+    return slide_spec.get("id", f"slide{index + 1}")
+
+
+def slide_layout(slide_spec):
+    """A slide's layout name (or raw layout index)"""
+    return slide_spec.get("layout", "title_content" if slide_spec.get("title") else "blank")
+
+
+def load_source(path, name=None):
+    """Spec dict for a deck spec file or a Reveal.js index.html"""
+    if path.endswith(HTML_EXTENSIONS):
+        from reveal_extractor import extract_deck_spec
+        return extract_deck_spec(path, name)
+    if path.endswith(SPEC_EXTENSIONS):
+        return load_deck_spec(path)
+    raise ValueError(f"Not a deck source: {path}")
@@ -0,0 +1,247 @@
+"""
+Streaming PPTX writer: flush slides to the zip as they are built
+Each finished slide part is serialized into the output zip and its XML tree is
+released, so peak memory stays roughly flat regardless of slide count. The
+presentation part, layouts, media, relationships and [Content_Types].xml are
+written when the writer is closed.
+
+Compression is chosen per part: XML is deflated at the mode's level, while
+media that is usually compressed already (PNG, JPEG, embedded workbooks, ...)
+is stored as is unless deflating it measurably helps. "fast" suits CI
+previews, "max" published artifacts; recompress() rewrites an existing .pptx
+in any mode and measures what it saved.
+
+With SOURCE_DATE_EPOCH set (see reproducible-builds.org), output is
+reproducible: every zip entry and the core properties' created/modified dates
+carry that time, and the parts written at close are ordered by partname, so
+identical input gives byte-identical files.
+"""
+
+import os
+import time
+import zipfile
+import zlib
+from collections import namedtuple
+
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from profiling import phase
+
+# xml_level: deflate level for XML and other uncompressed parts; media: "store"
+# it, "auto" to deflate it when a quick sample shrinks by MEDIA_MIN_SAVING, or
+# "best" to deflate it at level 9 whenever that is smaller and the sample
+# shrinks at all (by 1%), so photos are not compressed twice for nothing
+CompressionMode = namedtuple("CompressionMode", ["xml_level", "media"])
+
+COMPRESSION_MODES = {
+    "fast": CompressionMode(1, "store"),
+    "default": CompressionMode(6, "auto"),
+    "max": CompressionMode(9, "best"),
+}
+
+# "auto" media: bytes sampled and the fraction deflating them must save
+MEDIA_SAMPLE = 64 * 1024
+MEDIA_MIN_SAVING = 0.05
+
+DEFAULT_COMPRESSION = "default"
+
+# Part extensions whose content is compressed already
+COMPRESSED_EXTENSIONS = frozenset(("png", "jpg", "jpeg", "gif", "tif", "tiff", "wdp", "mp3", "mp4", "m4a",
+                                   "m4v", "mov", "wmv", "xlsx", "xlsm", "docx", "pptx", "zip"))
+
+# The earliest time a zip entry can record (1980-01-01)
+ZIP_EPOCH = 315532800
+
+# Per kind ("xml" or "media"): part count, bytes before and after compression
+PartStats = namedtuple("PartStats", ["parts", "raw_bytes", "written_bytes"])
+
+# One recompress() run; sizes are whole-file bytes
+RecompressResult = namedtuple("RecompressResult", ["path", "mode", "input_bytes", "output_bytes", "seconds"])
+
+
+def source_date_epoch():
+    """The SOURCE_DATE_EPOCH environment variable as an int, or None when builds are not reproducible"""
+    value = os.environ.get("SOURCE_DATE_EPOCH", "").strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"SOURCE_DATE_EPOCH must be a Unix timestamp, not {value!r}") from None
+
+
+class StreamingPackageWriter:
+    """Write a Presentation to a .pptx file while its slides are still being added
+
+    Call flush() after each finished slide (or batch of slides) and close() at
+    the end. Slides must not be modified after they have been flushed. epoch
+    (default: source_date_epoch()) makes the output reproducible. A path is
+    written through a temporary file and replaced on close(), so a failed
+    build leaves the previous output in place.
+    """
+
+    def __init__(self, prs, pkg_file, compression=DEFAULT_COMPRESSION, epoch=None):
+        self._prs = prs
+        self._pkg_file = pkg_file
+        self._tmp_path = f"{pkg_file}.{os.getpid()}.tmp" if isinstance(pkg_file, str) else None
+        self._epoch = source_date_epoch() if epoch is None else epoch
+        self._zip = _PartZip(self._tmp_path or pkg_file, compression, self._epoch)
+        self._written = set()
+        self._flushed_count = 0
+        if self._epoch is not None:
+            _set_core_dates(prs, self._epoch)
+
+    @property
+    def stats(self):
+        """{kind: PartStats} for the parts written so far"""
+        return self._zip.stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _write(self, partname, blob):
+        with phase("zip"):
+            self._zip.write(partname.membername, blob)
+
+    def _write_part(self, part):
+        with phase("serialize"):
+            blob = part.blob
+            rels_xml = part.rels.xml if part._rels else None
+        self._write(part.partname, blob)
+        if rels_xml is not None:
+            self._write(part.partname.rels_uri, rels_xml)
+        self._written.add(part.partname)
+
+    def flush(self):
+        """Serialize every slide added since the last flush and release its XML"""
+        prs_part = self._prs.part
+        sld_ids = self._prs.slides._sldIdLst.sldId_lst
+        for sld_id in sld_ids[self._flushed_count:]:
+            part = prs_part.related_part(sld_id.rId)
+            self._write_part(part)
+            # Drop the tree and the cached Slide proxy; the part keeps its
+            # partname, content type and rels for close()
+            part._element = None
+            part.__dict__.pop("slide", None)
+        self._flushed_count = len(sld_ids)
+
+    def close(self):
+        """Write the remaining parts, relationships and content types, then move the file into place"""
+        try:
+            self._close()
+        except BaseException:
+            self.abort()
+            raise
+        if self._tmp_path is not None:
+            os.replace(self._tmp_path, self._pkg_file)
+
+    def _close(self):
+        self.flush()
+        package = self._prs.part.package
+        parts = tuple(package.iter_parts())
+        remaining = [part for part in parts if part.partname not in self._written]
+        if self._epoch is not None:
+            # The walk order of iter_parts() follows how the deck was built; partnames do not
+            remaining.sort(key=lambda part: part.partname)
+        for part in remaining:
+            self._write_part(part)
+        with phase("serialize"):
+            package_rels = package._rels.xml
+            content_types = serialize_part_xml(_ContentTypesItem.xml_for(parts))
+        self._write(PACKAGE_URI.rels_uri, package_rels)
+        self._write(CONTENT_TYPES_URI, content_types)
+        with phase("zip"):
+            self._zip.close()
+
+    def abort(self):
+        """Close the zip and remove the partial output; an existing file at the path is kept"""
+        try:
+            self._zip.close()
+        finally:
+            if self._tmp_path is not None and os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)
+
+
+def _set_core_dates(prs, epoch):
+    from datetime import datetime, timezone
+
+    stamp = datetime.fromtimestamp(epoch, timezone.utc).replace(tzinfo=None)
+    prs.core_properties.created = prs.core_properties.modified = stamp
+
+
+class _PartZip:
+    """A zip being written with a CompressionMode applied part by part
+
+    With epoch, every entry is stamped with that time (clamped to ZIP_EPOCH)
+    and Unix attributes, so the bytes do not depend on when or where the zip
+    was written.
+    """
+
+    def __init__(self, file, compression=DEFAULT_COMPRESSION, epoch=None):
+        try:
+            self.mode = COMPRESSION_MODES[compression]
+        except KeyError:
+            raise ValueError(f"Unknown compression mode: {compression}") from None
+        self._zip = zipfile.ZipFile(file, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False)
+        self._date_time = None if epoch is None else time.gmtime(max(epoch, ZIP_EPOCH))[:6]
+        self.stats = {}
+
+    def write(self, name, blob):
+        kind = "media" if name.rsplit(".", 1)[-1].lower() in COMPRESSED_EXTENSIONS else "xml"
+        if kind == "xml":
+            compress_type, level = zipfile.ZIP_DEFLATED, self.mode.xml_level
+        elif (self.mode.media == "best" and _deflates(blob[:MEDIA_SAMPLE], 0.01)
+              and len(zlib.compress(blob, 9)) < len(blob)):
+            compress_type, level = zipfile.ZIP_DEFLATED, 9
+        elif self.mode.media == "auto" and _deflates(blob[:MEDIA_SAMPLE], MEDIA_MIN_SAVING):
+            compress_type, level = zipfile.ZIP_DEFLATED, self.mode.xml_level
+        else:
+            compress_type, level = zipfile.ZIP_STORED, None
+        if self._date_time is not None:
+            name = zipfile.ZipInfo(name, self._date_time)
+            name.create_system, name.external_attr = 3, 0o644 << 16
+        self._zip.writestr(name, blob, compress_type, level)
+        info = self._zip.filelist[-1]
+        parts, raw, written = self.stats.get(kind, (0, 0, 0))
+        self.stats[kind] = PartStats(parts + 1, raw + info.file_size, written + info.compress_size)
+
+    def close(self):
+        self._zip.close()
+
+
+def _deflates(sample, min_saving):
+    return len(zlib.compress(sample, 1)) < len(sample) * (1 - min_saving)
+
+
+def recompress(path, output_path=None, compression=DEFAULT_COMPRESSION):
+    """Rewrite a .pptx (in place without output_path) part by part in a compression mode
+
+    Part contents and order are unchanged; with SOURCE_DATE_EPOCH set, entries
+    get its timestamp. Returns a RecompressResult.
+    """
+    start = time.perf_counter()
+    input_bytes = os.path.getsize(path)
+    output_path = output_path or path
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with zipfile.ZipFile(path) as source:
+            target = _PartZip(tmp_path, compression, source_date_epoch())
+            try:
+                for info in source.infolist():
+                    target.write(info.filename, source.read(info))
+            finally:
+                target.close()
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return RecompressResult(output_path, compression, input_bytes, os.path.getsize(output_path),
+                            time.perf_counter() - start)
@@ -0,0 +1,328 @@
+"""
+Small compiled template engine for microsite pages, stylesheets and scripts
+Templates use a Jinja-style subset:
+
+    {{ expr }}  {{ expr | filter }}  {{ expr | filter(arg) }}
+    {% if expr %} ... {% elif expr %} ... {% else %} ... {% endif %}
+    {% for name in expr %} ... {% endfor %}   (loop.index, loop.index0, loop.first, loop.last, loop.length)
+    {# comment #}
+
+Expressions are Python expressions in which dict keys can also be read as
+attributes (hero.title); a missing key is false and empty in tests and loops,
+and an error only when it is output. Each template is translated to Python
+source and compiled once per distinct text, so rendering it for another site
+only runs the compiled code. A line holding nothing but block tags is dropped
+whole, so tags can sit on lines of their own.
+
+Templates are trusted input, like the rest of a site's sources. They still
+only see the data, the globals passed to render(), FILTERS and the plain
+builtins in BUILTINS (no open, __import__, eval, ...), and names starting
+with "__" or attributes starting with "_" are rejected when compiling.
+"""
+
+import ast
+import builtins
+import hashlib
+import json
+import os
+import re
+
+TAG = r"\{%(?:(?!%\}).)*%\}|\{#(?:(?!#\}).)*#\}"
+BLOCK_TAG = re.compile(TAG)
+BLOCK_LINE = re.compile(rf"^[ \t]*((?:(?:{TAG})[ \t]*)+)\n", re.M)
+
+TOKEN = re.compile(r"\{\{(.*?)\}\}|\{%(.*?)%\}|\{#.*?#\}", re.S)
+FOR_TAG = re.compile(r"for\s+(.+?)\s+in\s+(.+)", re.S)
+FILTER_CALL = re.compile(r"\s*([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*", re.S)
+
+# The only builtins visible to templates
+BUILTINS = {name: getattr(builtins, name) for name in (
+    "abs", "all", "any", "bool", "dict", "enumerate", "float", "format", "int", "len", "list", "max", "min",
+    "range", "reversed", "round", "sorted", "str", "sum", "tuple", "zip")}
+
+_compiled = {}
+
+
+class TemplateError(ValueError):
+    """Raised when a template cannot be compiled or rendered"""
+
+
+class Markup(str):
+    """Text that is safe to insert into HTML as it is"""
+
+
+class Undefined:
+    """A missing key: false and empty in tests and loops, an error when output"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __bool__(self):
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __getattr__(self, key):
+        return Undefined(f"{self.name}.{key}")
+
+    def __getitem__(self, key):
+        return Undefined(f"{self.name}[{key!r}]")
+
+
+class _Namespace(dict):
+    """A dict whose keys can be read as attributes"""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            return Undefined(key)
+
+
+class _Scope(dict):
+    """Template-level names: a name neither set, passed in nor built in is Undefined"""
+
+    def __init__(self, names):
+        super().__init__()
+        self.names = names
+
+    def __missing__(self, key):
+        if key in self.names or key in BUILTINS:
+            raise KeyError(key)  # found next in the globals or builtins
+        return Undefined(key)
+
+
+class Loop:
+    """loop inside {% for %}"""
+
+    def __init__(self, index0, length):
+        self.index0, self.length = index0, length
+        self.index = index0 + 1
+        self.first, self.last = index0 == 0, index0 == length - 1
+
+
+def _wrap(value):
+    if isinstance(value, dict):
+        return _Namespace((k, _wrap(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_wrap(v) for v in value]
+    return value
+
+
+def escape(value):
+    """value as HTML text; Markup is left alone"""
+    if isinstance(value, Markup):
+        return value
+    return Markup(_text(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+                  .replace('"', "&quot;"))
+
+
+def _text(value):
+    if isinstance(value, Undefined):
+        raise TemplateError(f"{value.name} is undefined")
+    return value if isinstance(value, str) else str(value)
+
+
+def tojson(value, indent=None):
+    """value as JSON that is also safe inside an HTML <script> or attribute"""
+    text = json.dumps(value, ensure_ascii=False, indent=indent, default=_text)
+    return Markup(text.replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+                  .replace("'", "\\u0027"))
+
+
+def _default(value, fallback=""):
+    return fallback if value is None or isinstance(value, Undefined) else value
+
+
+def _join(value, separator=""):
+    return separator.join(_text(item) for item in value)
+
+
+FILTERS = {
+    "default": _default,
+    "e": escape,
+    "escape": escape,
+    "join": _join,
+    "safe": lambda value: Markup(_text(value)),
+    "tojson": tojson,
+}
+
+
+def _split_filters(text):
+    """text split on the | characters outside brackets and strings"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote and text[i - 1] != "\\":
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    return parts + [text[start:]]
+
+
+class _Compiler:
+    """Translates one template to Python source, line by line"""
+
+    def __init__(self, name):
+        self.name = name
+        self.code = []
+        self.lines = []
+        self.blocks = []
+        self.loops = 0
+
+    def error(self, line, message):
+        return TemplateError(f"{self.name}:{line}: {message}")
+
+    def emit(self, line, statement):
+        self.code.append("    " * len(self.blocks) + statement)
+        self.lines.append(line)
+
+    def expression(self, line, text):
+        expr, *filters = _split_filters(text)
+        expr = expr.strip()
+        sources = [expr]
+        for call in filters:
+            match = FILTER_CALL.fullmatch(call)
+            if not match or match.group(1) not in FILTERS:
+                raise self.error(line, f"Unknown filter: {call.strip()}")
+            name, args = match.groups()
+            if args:
+                sources.append(f"f({args})")
+            expr = f"__filters[{name!r}](({expr}), {args})" if args else f"__filters[{name!r}](({expr}))"
+        try:
+            compile(expr, self.name, "eval")
+        except SyntaxError as exc:
+            raise self.error(line, f"{exc.msg}: {text.strip()}") from None
+        for source in sources:
+            self.check_names(line, source)
+        return expr
+
+    def check_names(self, line, source):
+        """Reject dunder names and private attributes, the way out of the template's namespace"""
+        for node in ast.walk(ast.parse(source, mode="eval")):
+            if isinstance(node, ast.Name) and node.id.startswith("__"):
+                raise self.error(line, f"Name not allowed in templates: {node.id}")
+            if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+                raise self.error(line, f"Attribute not allowed in templates: {node.attr}")
+
+    def tag(self, line, text):
+        keyword, _, rest = text.strip().partition(" ")
+        if keyword == "if":
+            self.emit(line, f"if {self.expression(line, rest)}:")
+            self.blocks.append(("if", line))
+        elif keyword in ("elif", "else"):
+            if not self.blocks or self.blocks[-1][0] != "if":
+                raise self.error(line, f"{keyword} outside if")
+            self.blocks.pop()
+            self.emit(line, f"elif {self.expression(line, rest)}:" if keyword == "elif" else "else:")
+            self.blocks.append(("if", line))
+        elif keyword == "for":
+            match = FOR_TAG.fullmatch(text.strip())
+            if not match:
+                raise self.error(line, f"Expected 'for NAME in EXPR': {text.strip()}")
+            target, items = match.group(1), self.expression(line, match.group(2))
+            try:
+                compile(f"for {target} in (): pass", self.name, "exec")
+            except SyntaxError:
+                raise self.error(line, f"Cannot assign to {target}") from None
+            n = self.loops = self.loops + 1
+            self.emit(line, f"__outer{n}, __items{n} = loop, list({items})")
+            self.emit(line, f"for __index{n}, ({target}) in enumerate(__items{n}):")
+            self.blocks.append(("for", line, n))
+            self.emit(line, f"loop = __Loop(__index{n}, len(__items{n}))")
+        elif keyword in ("endif", "endfor"):
+            if not self.blocks or self.blocks[-1][0] != keyword[3:]:
+                raise self.error(line, f"Unexpected {keyword}")
+            block = self.blocks.pop()
+            if keyword == "endfor":
+                self.emit(line, f"loop = __outer{block[2]}")
+        else:
+            raise self.error(line, f"Unknown tag: {keyword}")
+        if keyword in ("if", "elif", "else", "for"):
+            self.emit(line, "pass")
+
+    def compile(self, source):
+        source = BLOCK_LINE.sub(_keep_tags, source)
+        line, pos = 1, 0
+        for match in TOKEN.finditer(source):
+            if match.start() > pos:
+                self.emit(line, f"__write({source[pos:match.start()]!r})")
+                line += source.count("\n", pos, match.start())
+            if match.group(1) is not None:
+                self.emit(line, f"__write(__str({self.expression(line, match.group(1))}))")
+            elif match.group(2) is not None:
+                self.tag(line, match.group(2))
+            line += match.group(0).count("\n")
+            pos = match.end()
+        if pos < len(source):
+            self.emit(line, f"__write({source[pos:]!r})")
+        if self.blocks:
+            kind, opened = self.blocks[-1][:2]
+            raise self.error(opened, f"{kind} is never closed")
+        return "\n".join(self.code)
+
+
+def _keep_tags(match):
+    """A block-tag line reduced to its tags; the newline moves inside the last tag to keep line numbers"""
+    tags = "".join(BLOCK_TAG.findall(match.group(1)))
+    return f"{tags[:-2]}\n{tags[-2:]}"
+
+
+class Template:
+    """A compiled template; render() it with data"""
+
+    def __init__(self, source, name="<template>", autoescape=True):
+        self.name = name
+        self.autoescape = autoescape
+        self._filename = f"<template {name}>"
+        compiler = _Compiler(name)
+        self._code = compile(compiler.compile(source), self._filename, "exec")
+        self._lines = compiler.lines
+
+    def render(self, data=None, **globals):
+        """The template's output for data; globals (functions, constants) are visible to it too"""
+        out = []
+        scope = dict(globals, __builtins__=BUILTINS, __write=out.append, __str=escape if self.autoescape else _text,
+                     __filters=FILTERS, __Loop=Loop, loop=Undefined("loop"))
+        scope.update((key, _wrap(value)) for key, value in (data or {}).items())
+        try:
+            exec(self._code, scope, _Scope(scope))
+        except Exception as exc:
+            raise TemplateError(f"{self.name}:{self._line(exc)}: {exc}") from exc
+        return "".join(out)
+
+    def _line(self, exc):
+        line, tb = "?", exc.__traceback__
+        while tb is not None:
+            if tb.tb_frame.f_code.co_filename == self._filename:
+                line = self._lines[tb.tb_lineno - 1]
+            tb = tb.tb_next
+        return line
+
+
+def compile_template(source, name="<template>", autoescape=True):
+    """A Template for source, compiled once per distinct text"""
+    key = (hashlib.sha256(source.encode("utf-8")).hexdigest(), name, autoescape)
+    if key not in _compiled:
+        _compiled[key] = Template(source, name, autoescape)
+    return _compiled[key]
+
+
+def load_template(path, autoescape=None):
+    """compile_template() for a file; HTML files are autoescaped unless autoescape says otherwise"""
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    if autoescape is None:
+        autoescape = path.lower().endswith((".html", ".htm"))
+    return compile_template(source, os.path.basename(path), autoescape)
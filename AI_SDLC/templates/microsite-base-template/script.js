@@ -137,13 +137,13 @@ document.querySelectorAll('.hero-stats, .kpi-grid').forEach(section => {
 
 // Common chart colors matching brand
 const chartColors = {
-    primary: '#004B87',
-    secondary: '#0078D2',
-    accent: '#C80A28',
-    success: '#28A745',
-    warning: '#FF8C00',
-    danger: '#DC3545',
-    gray: '#A7AAAD'
+    primary: {{ brand.colors.dark_blue | tojson }},
+    secondary: {{ brand.colors.light_blue | tojson }},
+    accent: {{ brand.colors.red | tojson }},
+    success: {{ brand.colors.success | tojson }},
+    warning: {{ brand.colors.warning | tojson }},
+    danger: {{ brand.colors.danger | tojson }},
+    gray: {{ brand.colors.silver | tojson }}
 };
 
 // Default chart options
@@ -184,10 +184,10 @@ if (cycleTimeCtx) {
     new Chart(cycleTimeCtx, {
         type: 'bar',
         data: {
-            labels: ['Before AI', 'After AI'],
+            labels: {{ charts.cycle_time.labels | tojson }},
             datasets: [{
-                label: 'Development Cycle Time (Days)',
-                data: [18, 3],
+                label: {{ charts.cycle_time.label | tojson }},
+                data: {{ charts.cycle_time.data | tojson }},
                 backgroundColor: [chartColors.accent, chartColors.success],
                 borderColor: [chartColors.accent, chartColors.success],
                 borderWidth: 2,
@@ -201,7 +201,7 @@ if (cycleTimeCtx) {
                     beginAtZero: true,
                     title: {
                         display: true,
-                        text: 'Days',
+                        text: {{ charts.cycle_time.axis | tojson }},
                         font: { size: 14, weight: 'bold' }
                     },
                     grid: { color: 'rgba(0, 0, 0, 0.05)' }
@@ -216,11 +216,11 @@ if (cycleTimeCtx) {
                     ...defaultChartOptions.plugins.tooltip,
                     callbacks: {
                         label: function(context) {
-                            return `${context.parsed.y} days`;
+                            return `${context.parsed.y} ` + {{ charts.cycle_time.unit | tojson }};
                         },
                         afterLabel: function(context) {
-                            if (context.dataIndex === 1) {
-                                return '78% reduction';
+                            if (context.dataIndex === context.dataset.data.length - 1) {
+                                return {{ charts.cycle_time.note | default('') | tojson }} || undefined;
                             }
                         }
                     }
@@ -236,12 +236,12 @@ if (deploymentCtx) {
     new Chart(deploymentCtx, {
         type: 'line',
         data: {
-            labels: ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024', 'Q1 2025', 'Q2 2025'],
+            labels: {{ charts.deployment.labels | tojson }},
             datasets: [{
-                label: 'Deployments per Week',
-                data: [2, 3, 5, 8, 15, 24],
+                label: {{ charts.deployment.label | tojson }},
+                data: {{ charts.deployment.data | tojson }},
                 borderColor: chartColors.primary,
-                backgroundColor: 'rgba(0, 75, 135, 0.1)',
+                backgroundColor: {{ rgba(brand.colors.dark_blue, 0.1) | tojson }},
                 tension: 0.4,
                 fill: true,
                 pointRadius: 6,
@@ -257,7 +257,7 @@ if (deploymentCtx) {
                     beginAtZero: true,
                     title: {
                         display: true,
-                        text: 'Deployments/Week',
+                        text: {{ charts.deployment.axis | tojson }},
                         font: { size: 14, weight: 'bold' }
                     },
                     grid: { color: 'rgba(0, 0, 0, 0.05)' }
@@ -276,10 +276,10 @@ if (testCoverageCtx) {
     new Chart(testCoverageCtx, {
         type: 'doughnut',
         data: {
-            labels: ['Automated Tests', 'Manual Tests'],
+            labels: {{ charts.test_coverage.labels | tojson }},
             datasets: [{
-                label: 'Test Coverage',
-                data: [86, 14],
+                label: {{ charts.test_coverage.label | tojson }},
+                data: {{ charts.test_coverage.data | tojson }},
                 backgroundColor: [chartColors.success, chartColors.warning],
                 borderColor: ['#fff', '#fff'],
                 borderWidth: 3
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The deck tools are flat scripts in AI_SDLC/, imported by module name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
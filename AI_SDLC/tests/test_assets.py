@@ -0,0 +1,49 @@
+import io
+import zipfile
+
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from assets import AssetStore, add_image, file_digest
+
+
+def png(path, size=(600, 300), color=(200, 10, 40)):
+    Image.new("RGB", size, color).save(path, "PNG")
+    return str(path)
+
+
+def test_same_content_under_two_paths_is_one_digest(tmp_path):
+    store = AssetStore(str(tmp_path / "cache"))
+    a, b = png(tmp_path / "a.png"), png(tmp_path / "b.png")
+    other = png(tmp_path / "c.png", color=(0, 75, 135))
+    assert store.source(a).digest == store.source(b).digest == file_digest(a)
+    assert store.source(other).digest != store.source(a).digest
+    assert store.source(a).size == (600, 300) and store.source(a).format == "PNG"
+
+
+def test_images_are_downscaled_once_and_cached_on_disk(tmp_path):
+    cache = tmp_path / "cache"
+    path = png(tmp_path / "logo.png")
+    blob = AssetStore(str(cache)).fit(path, Inches(1), Inches(0.5))
+    assert Image.open(io.BytesIO(blob)).size == (150, 75)
+    cached, = cache.iterdir()
+    assert cached.read_bytes() == blob
+    assert AssetStore(str(cache)).fit(path, Inches(1), Inches(0.5)) == blob
+    with open(path, "rb") as f:
+        assert AssetStore(str(cache)).fit(path, Inches(10), Inches(5)) == f.read()  # never enlarged
+
+
+def test_each_distinct_image_is_embedded_once_per_package(tmp_path):
+    store = AssetStore(str(tmp_path / "cache"))
+    a, b = png(tmp_path / "a.png"), png(tmp_path / "b.png")
+    prs = Presentation()
+    for path in (a, b, a):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        add_image(slide, path, None, 0, height=Inches(1), store=store)
+    picture = slide.shapes[-1]
+    assert picture.width == Inches(2) and picture.left == (prs.slide_width - Inches(2)) // 2
+    output = tmp_path / "deck.pptx"
+    prs.save(str(output))
+    with zipfile.ZipFile(output) as package:
+        assert len([name for name in package.namelist() if name.startswith("ppt/media/")]) == 1
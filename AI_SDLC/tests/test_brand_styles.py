@@ -0,0 +1,24 @@
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.util import Pt
+
+from brand_styles import EMPTY_STYLE, ParagraphStyle, apply_style
+
+
+def paragraph():
+    prs = Presentation()
+    box = prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_textbox(0, 0, 100, 100)
+    return box.text_frame.paragraphs[0]
+
+
+def test_empty_style_leaves_the_paragraph_alone():
+    p = paragraph()
+    apply_style(p, EMPTY_STYLE)
+    assert p._p.pPr is None
+
+
+def test_style_sets_level_spacing_and_run_defaults():
+    p = paragraph()
+    apply_style(p, ParagraphStyle(Pt(20), True, RGBColor(0, 75, 135), 1, Pt(12), None, None))
+    assert p.level == 1 and p.space_before == Pt(12)
+    assert p.font.size == Pt(20) and p.font.bold and p.font.color.rgb == RGBColor(0, 75, 135)
@@ -0,0 +1,68 @@
+import pytest
+
+from build_cache import BuildCache, _spec_key, cached_build_spec
+
+
+@pytest.fixture
+def spec(tmp_path):
+    (tmp_path / "kpis.csv").write_text("metric,value\nVelocity,40\n")
+    return {"name": "cached", "base_dir": str(tmp_path), "slides": [
+        {"id": "intro", "title": "Intro", "sections": [{"bullets": ["One"]}]},
+        {"id": "kpis", "title": "KPIs", "layout": "title_only",
+         "tables": [{"source": "kpis.csv", "top": 1.6, "row_height": 0.45, "font_size": 18}]},
+    ]}
+
+
+def key(spec, palette=None, compression="default"):
+    return _spec_key(spec, palette, "generator", compression)[0]
+
+
+def test_key_is_stable_for_the_same_inputs(spec):
+    assert key(spec) == key(dict(spec))
+
+
+def test_key_changes_with_spec_palette_and_compression(spec):
+    edited = dict(spec, slides=[dict(spec["slides"][0], title="Changed"), spec["slides"][1]])
+    keys = {key(spec), key(edited), key(spec, {"AA_RED": [1, 2, 3]}), key(spec, compression="max")}
+    assert len(keys) == 4
+    assert _spec_key(spec, None, "other generator")[0] != key(spec)
+
+
+def test_key_follows_asset_content(spec, tmp_path):
+    before = key(spec)
+    (tmp_path / "kpis.csv").write_text("metric,value\nVelocity,41\n")
+    assert key(spec) != before
+
+
+def test_key_follows_source_date_epoch(spec, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    before = key(spec)
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    assert key(spec) != before
+
+
+def test_cached_build_reuses_unchanged_decks_and_slides(spec, tmp_path):
+    cache, output = BuildCache(str(tmp_path / "cache")), str(tmp_path / "out" / "cached.pptx")
+    assert cached_build_spec(spec, output, cache=cache) == "full"
+    assert cached_build_spec(spec, output, cache=cache) == "hit"
+    edited = dict(spec, slides=[dict(spec["slides"][0], title="Changed"), spec["slides"][1]])
+    assert cached_build_spec(edited, output, cache=cache) == "partial"
+    assert cached_build_spec(edited, output, cache=cache, force=True) == "full"
+
+
+def test_editing_a_generator_module_invalidates_the_key(spec, tmp_path, monkeypatch):
+    import build_cache
+
+    modules = tmp_path / "modules"
+    modules.mkdir()
+    for name in build_cache.SPEC_GENERATOR_MODULES:
+        (modules / name).write_text(f"# {name}\n")
+    monkeypatch.setattr(build_cache, "HERE", str(modules))
+    monkeypatch.setattr(build_cache, "_source_digests", {})
+    before = _spec_key(spec, None, build_cache.generator_digest(build_cache.SPEC_GENERATOR_MODULES))[0]
+
+    (modules / "data_binding.py").write_text("NATIVE_FIELDS = frozenset()\n")
+    build_cache._source_digests.clear()
+    after = _spec_key(spec, None, build_cache.generator_digest(build_cache.SPEC_GENERATOR_MODULES))[0]
+    assert "data_binding.py" in build_cache.SPEC_GENERATOR_MODULES
+    assert after != before
@@ -0,0 +1,42 @@
+import os
+
+from batch_build import HERE, DeckJob
+from build_server import IDLE_POLL_SECONDS, POLL_SECONDS, BuildServer, next_poll_delay
+
+
+def server(tmp_path):
+    jobs = [DeckJob("plan", str(tmp_path / "decks" / "plan.yaml"), "spec", None),
+            DeckJob("site", str(tmp_path / "presentations" / "site" / "index.html"), "html", None)]
+    srv = BuildServer(jobs, out_dir=str(tmp_path / "out"), workers=1)
+    srv.deps["plan"].add(str(tmp_path / "data" / "sales.csv"))
+    return srv
+
+
+def test_a_spec_module_rebuilds_every_deck(tmp_path):
+    assert server(tmp_path).affected({os.path.join(HERE, "deck_spec.py")}) == ({"plan", "site"}, True)
+
+
+def test_an_html_module_rebuilds_html_decks_only(tmp_path):
+    assert server(tmp_path).affected({os.path.join(HERE, "reveal_extractor.py")}) == ({"site"}, True)
+
+
+def test_a_source_or_asset_rebuilds_its_deck(tmp_path):
+    srv = server(tmp_path)
+    assert srv.affected({str(tmp_path / "decks" / "plan.yaml")}) == ({"plan"}, False)
+    assert srv.affected({str(tmp_path / "data" / "sales.csv")}) == ({"plan"}, False)
+    # Anything in a Reveal.js deck's folder belongs to it
+    assert srv.affected({str(tmp_path / "presentations" / "site" / "css" / "theme.css")}) == ({"site"}, False)
+
+
+def test_an_unrelated_file_rebuilds_nothing(tmp_path):
+    srv = server(tmp_path)
+    assert srv.affected({str(tmp_path / "decks" / "notes.txt")}) == (set(), False)
+    assert srv.affected({str(tmp_path / "presentations" / "site-old" / "index.html")}) == (set(), False)
+
+
+def test_polling_backs_off_while_idle():
+    delays = [POLL_SECONDS]
+    for _ in range(6):
+        delays.append(next_poll_delay(delays[-1], False))
+    assert delays == sorted(delays) and delays[-1] == IDLE_POLL_SECONDS
+    assert next_poll_delay(IDLE_POLL_SECONDS, True) == POLL_SECONDS
@@ -0,0 +1,43 @@
+from chartjs import chart_slide_specs, parse_literal
+from deck_spec import compile_deck
+
+SCRIPT = """
+const chartColors = { red: '#C80A28', blue: 'rgba(0, 120, 210, 0.8)' };
+// Cycle Time Chart
+const cycleCtx = document.getElementById('cycleTimeChart');
+new Chart(cycleCtx, {
+    type: 'bar',
+    data: {
+        labels: ['Analysis', 'Coding', 3],
+        datasets: [{
+            label: 'Days per Activity',
+            data: [2, 7.5, 'n/a'],
+            backgroundColor: [chartColors.blue, chartColors.red, '#abc'],
+            borderColor: chartColors.red,
+        }],
+    },
+    options: {
+        indexAxis: 'y',
+        plugins: { legend: { display: false }, tooltip: { callbacks: { label: (ctx) => ctx.raw + ' days' } } },
+        scales: { x: { title: { display: true, text: "Days" } } },
+    },
+});
+"""
+
+
+def test_literals_read_javascript_syntax():
+    text = "{a: 1, 'b': [true, null, -2.5e1,], /* note */ c: `x`, d: colors.red, e: function () { return 1; }}"
+    assert parse_literal(text, env={"colors": {"red": "#F00"}}) == {
+        "a": 1, "b": [True, None, -25.0], "c": "x", "d": "#F00", "e": None}
+
+
+def test_chart_config_becomes_a_compiled_chart():
+    slide, = chart_slide_specs(SCRIPT)
+    assert (slide["id"], slide["title"], slide["layout"]) == ("cycleTimeChart", "Cycle Time", "title_only")
+    chart, = compile_deck({"name": "charts", "slides": [slide]}).slides[0].charts
+    assert chart.spec["type"] == "bar"
+    assert chart.spec["categories"] == ["Analysis", "Coding", "3"]
+    assert chart.spec["legend"] is False and chart.spec["value_axis_title"] == "Days"
+    series, = chart.spec["series"]
+    assert series["name"] == "Days per Activity" and series["values"] == [2, 7.5, None]
+    assert series["colors"] == ["#0078D2", "#C80A28", "#AABBCC"] and series["line_color"] == "#C80A28"
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from data_binding import MARKER_PATTERN, DataBindingError, DataContext, bind_spec, bind_template, field_values
+from deck_spec import compile_deck
+
+BOX = {"left": 1, "top": 1, "width": 6, "height": 1}
+
+
+def deck(*slides, **fields):
+    return dict({"name": "test", "slides": list(slides)}, **fields)
+
+
+def test_lone_placeholder_in_text_binds_to_a_string():
+    spec = deck({"id": "s", "layout": "blank", "title": "{{days}}",
+                 "textboxes": [dict(BOX, text="{{days}}")],
+                 "sections": [{"heading": "{{days}}", "bullets": ["{{days}}"]}]},
+                params={"days": 52})
+    slide = compile_deck(spec).slides[0]
+    assert slide.title == "52"
+    assert slide.textboxes[0].paragraphs[0][0] == "52"
+    assert [text for text, _ in slide.paragraphs] == ["52", "52"]
+
+
+def test_lone_placeholder_in_numeric_field_keeps_its_type():
+    spec = deck({"id": "s", "layout": "blank",
+                 "progress": [dict(BOX, percent="{{adoption}}", label="Adoption", color="AA_RED")]},
+                params={"adoption": 0.35})
+    bar, = compile_deck(spec).slides[0].bars
+    assert bar.percent == 0.35
+    assert bar.label == "35% Adoption"
+
+
+def test_spec_with_only_params_is_bound():
+    spec = deck({"id": "s", "title": "Hi {{team}}"}, params={"team": "NXOP"})
+    assert compile_deck(spec).slides[0].title == "Hi NXOP"
+    assert compile_deck(spec, params={"team": "Crew"}).slides[0].title == "Hi Crew"
+
+
+def test_data_sources_fill_placeholders_and_tables(tmp_path):
+    (tmp_path / "delivery.json").write_text(json.dumps({"cycle_days": 3, "adoption": 0.35}))
+    (tmp_path / "kpis.csv").write_text("metric,value\nVelocity,40\nCoverage,86\n")
+    spec = deck(
+        {"id": "s", "title": "{{delivery.cycle_days}} Days at {{delivery.adoption:.0%}}",
+         "sections": [{"bullets": ["Velocity {{kpis.Velocity.value}}"]}]},
+        {"id": "t", "title": "KPIs", "layout": "title_only",
+         "tables": [{"data": "kpis", "top": 1.6, "row_height": 0.45, "font_size": 18}]},
+        data={"delivery": {"source": "delivery.json"}, "kpis": {"source": "kpis.csv", "key": "metric"}},
+        base_dir=str(tmp_path),
+    )
+    first, second = compile_deck(spec).slides
+    assert first.title == "3 Days at 35%"
+    assert first.paragraphs[0][0] == "Velocity 40"
+    assert [list(row) for row in second.tables[0].rows] == [["Velocity", 40], ["Coverage", 86]]
+
+
+def test_unknown_placeholder_is_an_error():
+    with pytest.raises(DataBindingError, match="missing"):
+        bind_spec(deck({"id": "s", "title": "{{team.missing}}"}, params={"team": {"name": "NXOP"}}))
+
+
+def test_template_fields_give_the_bound_text():
+    spec = deck({"id": "s", "title": "{{team}}: {{score:.1f}}", "sections": [{"bullets": ["{{team}} rocks"]}]},
+                params={"team": "NXOP", "score": 4.25})
+    template, fields = bind_template(spec)
+    values = field_values(fields, DataContext({}), {"team": "Crew", "score": 2})
+    title = MARKER_PATTERN.sub(lambda m: values[int(m.group(1))], template["slides"][0]["title"])
+    assert title == bind_spec(spec, {"team": "Crew", "score": 2})["slides"][0]["title"] == "Crew: 2.0"
+
+
+def test_partitioned_sqlite_source_gives_one_value_per_team(tmp_path):
+    import sqlite3
+
+    from data_binding import variant_values
+
+    with sqlite3.connect(tmp_path / "metrics.db") as conn:
+        conn.execute("CREATE TABLE kpi (team TEXT, metric TEXT, value REAL)")
+        conn.executemany("INSERT INTO kpi VALUES (?, ?, ?)",
+                         [("NXOP", "velocity", 40), ("Crew", "velocity", 25)])
+    conn.close()
+    spec = deck({"id": "s", "title": "{{team}}: {{teams.velocity.value}}"},
+                data={"teams": {"source": "metrics.db", "key": "metric", "partition": "team",
+                                "query": "SELECT team, metric, value FROM kpi"}},
+                base_dir=str(tmp_path))
+    context = DataContext(spec["data"], spec["base_dir"])
+    assert variant_values(context, "team") == ["Crew", "NXOP"]
+    titles = [bind_spec(spec, {"team": team}, context)["slides"][0]["title"] for team in ("NXOP", "Crew")]
+    assert titles == ["NXOP: 40.0", "Crew: 25.0"]
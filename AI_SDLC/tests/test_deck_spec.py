@@ -0,0 +1,45 @@
+from deck_spec import compile_deck
+
+BOX = {"left": 1, "top": 1, "width": 6, "height": 1}
+
+
+def deck(*slides, **fields):
+    return dict({"name": "test", "slides": list(slides)}, **fields)
+
+
+def test_sections_become_styled_paragraphs():
+    spec = deck({"id": "s", "title": "Agenda", "sections": [
+        {"heading": "Why", "heading_style": {"size": 20, "bold": True}, "bullets": ["One", "Two"]}]})
+    compiled = compile_deck(spec)
+    slide, = compiled.slides
+    assert slide.title == "Agenda"
+    assert [text for text, _ in slide.paragraphs] == ["Why", "One", "Two"]
+    assert slide.paragraphs[0][1].size.pt == 20 and slide.paragraphs[0][1].bold
+
+
+def test_slides_compile_in_spec_order_with_ids():
+    spec = deck({"id": "first", "title": "One"}, {"title": "Two"})
+    assert [slide.id for slide in compile_deck(spec).slides] == ["first", "slide2"]
+
+
+def test_textbox_text_list_is_one_paragraph_per_item():
+    spec = deck({"id": "s", "layout": "blank", "textboxes": [
+        dict(BOX, text=[{"text": ""}, "✓ One", "✓ Two"], style={"size": 22, "space_before": 12})]})
+    box, = compile_deck(spec).slides[0].textboxes
+    assert [text for text, _ in box.paragraphs] == ["", "✓ One", "✓ Two"]
+    assert box.paragraphs[0][1].space_before is None
+    assert box.paragraphs[1][1].space_before.pt == 12
+
+
+def test_shapes_render_bottom_to_top_by_z():
+    from deck_spec import new_presentation, render_slide
+
+    card = {"left": 1, "top": 2, "width": 3, "height": 2, "title": "Card", "content": "Body", "color": "AA_RED"}
+    spec = deck({"id": "s", "layout": "blank",
+                 "textboxes": [dict(BOX, text="Title"), dict(BOX, text="Footer", z=1)], "cards": [card]})
+    compiled = compile_deck(spec)
+    prs = new_presentation(compiled.width, compiled.height)
+    slide = render_slide(prs, compiled.slides[0])
+    texts = [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame and shape.text_frame.text]
+    assert texts[0] == "Title" and texts[-1] == "Footer"
+    assert any("Card" in text for text in texts[1:-1])
@@ -0,0 +1,37 @@
+import zipfile
+
+from pptx import Presentation
+
+from fan_out import fan_out
+
+SPEC = {"name": "fan", "params": {"team": "Crew"}, "slides": [
+    {"id": "cover", "title": "{{team}} review", "sections": [{"bullets": ["Owned by {{team}}"]}]},
+    {"id": "shared", "title": "Agenda", "sections": [{"bullets": ["Same for everyone"]}]},
+]}
+
+
+def texts(path):
+    return [[shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+            for slide in Presentation(path).slides]
+
+
+def test_one_spec_fans_out_to_a_deck_per_team(tmp_path):
+    results = fan_out(SPEC, "team", ["R&D", "Ops <EU>"], str(tmp_path / "out"), workers=1,
+                      store_dir=str(tmp_path / "store"))
+    assert [result.value for result in results] == ["R&D", "Ops <EU>"]
+    first, second = results
+    assert first.path.endswith("fan-R_D.pptx") and second.path.endswith("fan-Ops_EU.pptx")
+    assert texts(first.path) == [["R&D review", "Owned by R&D"], ["Agenda", "Same for everyone"]]
+    assert texts(second.path) == [["Ops <EU> review", "Owned by Ops <EU>"], ["Agenda", "Same for everyone"]]
+    # The shared slide is rendered once; the second team's cover is patched from the template
+    assert (second.rendered, second.patched, second.reused) == (0, 1, 1)
+
+
+def test_patched_values_are_escaped_in_the_slide_xml(tmp_path):
+    _, second = fan_out(SPEC, "team", ["R&D", "Ops <EU>"], str(tmp_path / "out"), workers=1,
+                        store_dir=str(tmp_path / "store"))
+    with zipfile.ZipFile(second.path) as package:
+        xml = package.read("ppt/slides/slide1.xml").decode("utf-8")
+    assert "Ops &lt;EU&gt; review" in xml and "<EU>" not in xml
+    with zipfile.ZipFile(tmp_path / "out" / "fan-R_D.pptx") as package:
+        assert "R&amp;D review" in package.read("ppt/slides/slide1.xml").decode("utf-8")
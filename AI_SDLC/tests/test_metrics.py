@@ -0,0 +1,49 @@
+import io
+
+from pptx import Presentation
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches
+
+from deck_spec import compile_deck, new_presentation, render_slide
+from metrics import load_table, table_layout
+
+
+def test_column_widths_follow_the_widest_text_and_fill_the_width():
+    rows = [("Velocity Improvement", 40), ("Coverage", 75.5)]
+    layout = table_layout(("Metric", "Value"), rows, Inches(8), Inches(0.5), Inches(2), 18)
+    assert sum(layout.widths) == Inches(8)
+    assert layout.widths[0] > 2 * layout.widths[1]
+    assert list(layout.pages) == [range(0, 2)]
+
+
+def test_rows_are_paged_below_a_repeated_header():
+    rows = [(f"Row {n}", n) for n in range(7)]
+    layout = table_layout(("Name", "N"), rows, Inches(8), Inches(0.5), Inches(2), 18)
+    # 2in holds 4 rows of 0.5in, one of them the header
+    assert [list(page) for page in layout.pages] == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_csv_numbers_are_typed(tmp_path):
+    path = tmp_path / "kpis.csv"
+    path.write_text("metric,value\nVelocity,40\nCoverage,75.5\nNotes,n/a\n")
+    table = load_table(str(path))
+    assert table.columns == ("metric", "value")
+    assert table.rows == (("Velocity", 40), ("Coverage", 75.5), ("Notes", "n/a"))
+
+
+def test_table_renders_as_a_native_table():
+    deck = compile_deck({"name": "table", "slides": [{"id": "t", "layout": "title_only", "tables": [
+        {"columns": ["Metric", "Value"], "rows": [["R&D <beta>", 40], ["Ops", 7.0]],
+         "header_fill": "AA_DARK_BLUE", "header_color": "WHITE", "font_size": 14}]}]})
+    prs = new_presentation(deck.width, deck.height)
+    render_slide(prs, deck.slides[0])
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    table = Presentation(buffer).slides[0].shapes[-1].table
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [
+        ["Metric", "Value"], ["R&D <beta>", "40"], ["Ops", "7"]]
+    header = table.cell(0, 0).text_frame.paragraphs[0]
+    assert header.runs[0].font.bold and str(header.runs[0].font.color.rgb) == "FFFFFF"
+    assert str(table.cell(0, 0).fill.fore_color.rgb) == "004B87"
+    assert table.cell(1, 1).text_frame.paragraphs[0].alignment == PP_ALIGN.RIGHT  # a numeric column
+    assert table.cell(1, 0).text_frame.paragraphs[0].alignment is None
@@ -0,0 +1,46 @@
+import pytest
+
+from deck_spec import compile_deck, write_deck
+from pptx_diff import diff_packages, format_diff
+
+
+def slides(*titles):
+    return [{"id": f"s{n}", "title": title, "sections": [{"bullets": [f"{title} point"]}]}
+            for n, title in enumerate(titles)]
+
+
+@pytest.fixture
+def build(tmp_path):
+    def build(name, slide_specs):
+        path = str(tmp_path / f"{name}.pptx")
+        write_deck(compile_deck({"name": name, "slides": slide_specs}), path)
+        return path
+    return build
+
+
+def test_rebuilds_of_the_same_deck_are_identical(build):
+    diff = diff_packages(build("a", slides("One", "Two")), build("b", slides("One", "Two")))
+    assert diff.identical and diff.slides == [] and diff.parts == []
+    assert format_diff(diff) == []
+
+
+def test_changed_text_is_reported_on_its_slide(build):
+    edited = slides("One", "Two")
+    edited[1]["sections"][0]["bullets"] = ["Two, revised"]
+    diff = diff_packages(build("a", slides("One", "Two")), build("b", edited))
+    change, = diff.slides
+    assert (change.kind, change.old, change.new, change.title) == ("~", 2, 2, "Two")
+    assert any("Two, revised" in detail for detail in change.details)
+    assert format_diff(diff)[0] == "~ slide 2  Two"
+
+
+def test_inserted_slide_is_one_addition(build):
+    diff = diff_packages(build("a", slides("One", "Three")), build("b", slides("One", "Two", "Three")))
+    assert [(c.kind, c.old, c.new) for c in diff.slides] == [("+", None, 2)]
+    assert not diff.identical
+
+
+def test_removed_slide_is_one_removal(build):
+    diff = diff_packages(build("a", slides("One", "Two", "Three")), build("b", slides("One", "Three")),
+                         details=False)
+    assert [(c.kind, c.old, c.new, c.title) for c in diff.slides] == [("-", 2, None, "Two")]
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from deck_spec import compile_deck, write_deck
+from profiling import PHASES, PhaseEvent, Profiler, phase, profile_options, slide
+
+
+def test_profile_options_are_read_from_the_command_line():
+    assert profile_options(["--force"]) is None
+    assert profile_options(["--profile", "p.json"]) == ("p.json", "json", False)
+    assert profile_options(["--force", "--profile", "p.json", "--profile-format", "chrome",
+                            "--profile-memory"]) == ("p.json", "chrome", True)
+    with pytest.raises(SystemExit):
+        profile_options(["--profile", "p.json", "--profile-format", "xml"])
+
+
+def test_summary_totals_phases_and_slides():
+    profiler = Profiler()
+    for event in (PhaseEvent("text", "a", 0.0, 0.25, 10, None, 1), PhaseEvent("text", "b", 0.3, 0.5, 5, None, 1),
+                  PhaseEvent("shapes", "a", 0.8, 0.125, -2, 64, 1), PhaseEvent("slide", "a", 0.0, 1.0, 0, None, 1),
+                  PhaseEvent("zip", None, 1.0, 0.5, 1, None, 1)):
+        profiler(event)
+    summary = profiler.summary()
+    assert summary["phases"] == {
+        "text": {"seconds": 0.75, "count": 2, "blocks": 15, "bytes": None},
+        "shapes": {"seconds": 0.125, "count": 1, "blocks": -2, "bytes": 64},
+        "zip": {"seconds": 0.5, "count": 1, "blocks": 1, "bytes": None},
+    }
+    assert summary["slides"] == [{"slide": "a", "seconds": 1.0, "phases": {"text": 0.25, "shapes": 0.125}},
+                                 {"slide": "b", "seconds": 0.0, "phases": {"text": 0.5}}]
+
+
+def test_phases_are_only_recorded_while_profiling(tmp_path):
+    with Profiler() as profiler:
+        with slide("s"), phase("text"):
+            pass
+        write_deck(compile_deck({"name": "p", "slides": [{"id": "one", "title": "One"}]}),
+                   str(tmp_path / "p.pptx"))
+    recorded = len(profiler.events)
+    with phase("text"):
+        pass
+    assert len(profiler.events) == recorded
+    summary = profiler.summary()
+    assert [entry["slide"] for entry in summary["slides"]] == ["s", "one"]
+    assert set(summary["phases"]) <= set(PHASES) and "zip" in summary["phases"]
+    profiler.write(str(tmp_path / "trace.json"), "chrome")
+    with open(tmp_path / "trace.json", encoding="utf-8") as f:
+        assert len(json.load(f)["traceEvents"]) == len(profiler.events)
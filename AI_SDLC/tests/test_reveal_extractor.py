@@ -0,0 +1,46 @@
+from reveal_extractor import iter_slide_specs
+
+PAGE = """
+<section id="stats"><h2>Impact</h2>
+  <div class="stat-number" data-target="78" data-suffix="%">0</div><div class="stat-label">Faster</div>
+  <div class="stat-number"><span id="velocity-gain">0</span>%</div><div class="stat-label">Velocity</div>
+  <div class="stat-number"><span id="vendors">0</span>/10</div><div class="stat-label">Vendors</div>
+  <div class="stat-number"><span id="unset">0</span>x</div><div class="stat-label">Unset</div>
+  <div class="stat-number">5.9</div><div class="stat-label">Days</div>
+</section>
+<section id="next"><h2>Next</h2><p>Text</p></section>
+<script>
+  animateCounter('velocity-gain', 40);
+  document.getElementById('vendors').textContent = '3';
+</script>
+"""
+
+
+def test_counters_are_read_at_their_final_value(tmp_path):
+    path = tmp_path / "index.html"
+    path.write_text(PAGE, encoding="utf-8")
+    stats, after = iter_slide_specs(str(path))
+    assert [section["heading"] for section in stats["sections"]] == [
+        "78% Faster", "40% Velocity", "3/10 Vendors", "Unset", "5.9 Days"]
+    assert after["id"] == "next"
+
+
+def test_counter_slides_are_released_once_their_script_is_read(tmp_path, monkeypatch):
+    from reveal_extractor import RevealParser
+
+    page = """
+<section id="stats"><div class="stat-number"><span id="gain">0</span>%</div><div class="stat-label">Gain</div></section>
+<section id="next"><h2>Next</h2></section>
+<script>animateCounter('gain', 40);</script>
+"""
+    filler = "".join(f'<section id="s{n}"><h2>Slide {n}</h2><p>{"text " * 40}</p></section>\n' for n in range(50))
+    path = tmp_path / "index.html"
+    path.write_text(page + filler, encoding="utf-8")
+    feeds = []
+    feed = RevealParser.feed
+    monkeypatch.setattr(RevealParser, "feed", lambda self, chunk: (feeds.append(chunk), feed(self, chunk)))
+    slides = iter_slide_specs(str(path), chunk_size=512)
+    assert next(slides)["sections"][0]["heading"] == "40% Gain"
+    assert next(slides)["id"] == "next"
+    assert len(feeds) == 1
+    assert len(list(slides)) == 50
@@ -0,0 +1,65 @@
+import json
+import os
+
+from pptx import Presentation
+
+from deck_spec import compile_deck
+from slide_graph import SlideStore, build_graph, deck_graph
+
+
+def deck(*titles):
+    return compile_deck({"name": "graph", "slides": [
+        {"id": f"s{n}", "title": title, "sections": [{"bullets": [f"{title} point"]}]}
+        for n, title in enumerate(titles)]})
+
+
+def titles(path):
+    return [slide.shapes.title.text_frame.text for slide in Presentation(path).slides]
+
+
+def test_editing_one_slide_rerenders_only_that_slide(tmp_path):
+    store, output = SlideStore(str(tmp_path / "store")), str(tmp_path / "deck.pptx")
+    assert build_graph(deck_graph(deck("One", "Two", "Three")), output, store) == (3, 0)
+    assert build_graph(deck_graph(deck("One", "Two", "Three")), output, store) == (0, 3)
+    assert build_graph(deck_graph(deck("One", "Second", "Three")), output, store) == (1, 2)
+    assert titles(output) == ["One", "Second", "Three"]
+
+
+def test_generator_change_rerenders_every_slide(tmp_path):
+    store, output = SlideStore(str(tmp_path / "store")), str(tmp_path / "deck.pptx")
+    build_graph(deck_graph(deck("One", "Two"), "v1"), output, store)
+    assert build_graph(deck_graph(deck("One", "Two"), "v2"), output, store) == (2, 0)
+
+
+def test_stale_store_entries_are_not_reattached(tmp_path):
+    store, output = SlideStore(str(tmp_path / "store")), str(tmp_path / "deck.pptx")
+    graph = deck_graph(deck("One", "Two"))
+    build_graph(graph, output, store)
+    one, two = (graph.key(node) for node in graph.nodes)
+
+    # An entry whose layout is not in the template is rendered afresh
+    path = store._path(one, "json")
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
+    entries[0]["rels"][0][3] = "/ppt/slideLayouts/slideLayout99.xml"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+    # An entry missing a piece is no entry at all
+    os.remove(store._path(two, "json"))
+
+    assert build_graph(deck_graph(deck("One", "Two")), output, store) == (2, 0)
+    assert titles(output) == ["One", "Two"]
+    assert build_graph(deck_graph(deck("One", "Two")), output, store) == (0, 2)
+
+
+def test_parallel_build_matches_single_process_build(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    graph = deck_graph(deck(*(f"Slide {n}" for n in range(16))))
+    outputs = []
+    for workers in (1, 4):
+        output = str(tmp_path / f"deck-{workers}.pptx")
+        store = SlideStore(str(tmp_path / f"store-{workers}"))
+        assert build_graph(graph, output, store, rebuild=True, workers=workers) == (16, 0)
+        with open(output, "rb") as f:
+            outputs.append(f.read())
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,83 @@
+import os
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from deck_spec import compile_deck, write_deck
+from streaming_writer import COMPRESSION_MODES, StreamingPackageWriter, _PartZip, recompress
+from spec_source import load_deck_spec
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NXOP_SPEC = os.path.join(HERE, "decks", "ai_sdlc_nxop.json")
+
+
+def build(path):
+    write_deck(compile_deck(load_deck_spec(NXOP_SPEC)), str(path))
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_source_date_epoch_gives_byte_identical_output(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    first = build(tmp_path / "a.pptx")
+    assert build(tmp_path / "b.pptx") == first
+    with zipfile.ZipFile(tmp_path / "a.pptx") as package:
+        assert {info.date_time for info in package.infolist()} == {(2023, 11, 14, 22, 13, 20)}
+    assert Presentation(str(tmp_path / "a.pptx")).core_properties.modified.year == 2023
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1800000000")
+    assert build(tmp_path / "c.pptx") != first
+
+
+def test_failed_build_keeps_the_previous_output(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    previous = build(path)
+    prs = Presentation()
+    with pytest.raises(RuntimeError):
+        with StreamingPackageWriter(prs, path) as writer:
+            prs.slides.add_slide(prs.slide_layouts[0])
+            writer.flush()
+            raise RuntimeError("render failed")
+    with open(path, "rb") as f:
+        assert f.read() == previous
+    assert os.listdir(tmp_path) == ["deck.pptx"]
+
+
+@pytest.mark.parametrize("compression, photo_type, flat_type", [
+    ("fast", zipfile.ZIP_STORED, zipfile.ZIP_STORED),
+    ("default", zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED),
+    ("max", zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED),
+])
+def test_part_zip_deflates_xml_and_only_media_that_shrinks(tmp_path, compression, photo_type, flat_type):
+    path = tmp_path / "parts.zip"
+    target = _PartZip(str(path), compression)
+    target.write("ppt/slides/slide1.xml", b"<p:sld/>" * 2000)
+    target.write("ppt/media/photo.png", os.urandom(32 * 1024))
+    target.write("ppt/media/flat.png", bytes(32 * 1024))
+    target.close()
+    with zipfile.ZipFile(path) as package:
+        types = {info.filename: info.compress_type for info in package.infolist()}
+    assert types == {"ppt/slides/slide1.xml": zipfile.ZIP_DEFLATED, "ppt/media/photo.png": photo_type,
+                     "ppt/media/flat.png": flat_type}
+    assert target.stats["xml"].parts == 1 and target.stats["media"].parts == 2
+    assert target.stats["xml"].written_bytes < target.stats["xml"].raw_bytes
+
+
+def test_unknown_compression_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown compression mode"):
+        _PartZip(str(tmp_path / "parts.zip"), "tiny")
+    assert sorted(COMPRESSION_MODES) == ["default", "fast", "max"]
+
+
+def test_recompress_keeps_every_part(tmp_path):
+    fast = str(tmp_path / "fast.pptx")
+    write_deck(compile_deck(load_deck_spec(NXOP_SPEC)), fast, "fast")
+    result = recompress(fast, str(tmp_path / "max.pptx"), "max")
+    assert result.path == str(tmp_path / "max.pptx") and result.mode == "max"
+    assert result.input_bytes == os.path.getsize(fast)
+    assert result.output_bytes < result.input_bytes
+    with zipfile.ZipFile(fast) as before, zipfile.ZipFile(result.path) as after:
+        assert before.namelist() == after.namelist()
+        assert all(before.read(name) == after.read(name) for name in before.namelist())
+    assert sorted(os.listdir(tmp_path)) == ["fast.pptx", "max.pptx"]
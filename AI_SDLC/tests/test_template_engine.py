@@ -0,0 +1,77 @@
+import pytest
+
+from template_engine import Markup, Template, TemplateError, compile_template
+
+
+def render(source, autoescape=True, **data):
+    return Template(source, "t.html", autoescape).render(data)
+
+
+def test_values_are_escaped_unless_safe():
+    assert render("<p>{{ text }}</p>", text='<b> & "') == "<p>&lt;b&gt; &amp; &quot;</p>"
+    assert render("{{ text | safe }}", text="<b>") == "<b>"
+    assert render("{{ text }}", text=Markup("<b>")) == "<b>"
+    assert render("{{ text }}", autoescape=False, text="<b>") == "<b>"
+
+
+def test_keys_read_as_attributes():
+    assert render("{{ hero.stats[1].value }}", hero={"stats": [{"value": 1}, {"value": 2}]}) == "2"
+
+
+def test_for_loop_and_loop_variables():
+    out = render("{% for x in items %}{{ loop.index }}{{ x }}{% if not loop.last %},{% endif %}{% endfor %}",
+                 items=["a", "b", "c"])
+    assert out == "1a,2b,3c"
+    assert render("{% for k, v in pairs %}{{ k }}={{ v }};{% endfor %}", pairs=[("a", 1), ("b", 2)]) == "a=1;b=2;"
+
+
+def test_if_elif_else():
+    source = "{% if n > 1 %}many{% elif n %}one{% else %}none{% endif %}"
+    assert [render(source, n=n) for n in (2, 1, 0)] == ["many", "one", "none"]
+
+
+def test_lines_holding_only_tags_are_dropped():
+    source = "<ul>\n  {% for x in items %}\n  <li>{{ x }}</li>\n  {% endfor %}\n</ul>\n"
+    assert render(source, items=[1, 2]) == "<ul>\n  <li>1</li>\n  <li>2</li>\n</ul>\n"
+
+
+def test_filters():
+    assert render("{{ missing | default('n/a') }}") == "n/a"
+    assert render("{{ items | join(', ') }}", items=[1, 2]) == "1, 2"
+
+
+def test_tojson_is_safe_inside_script():
+    out = render("{{ value | tojson }}", autoescape=False, value={"a": "</script><b>&'"})
+    assert "</script>" not in out and "'" not in out
+    assert out == '{"a": "\\u003c/script\\u003e\\u003cb\\u003e\\u0026\\u0027"}'
+
+
+def test_undefined_is_false_and_empty_but_cannot_be_output():
+    assert render("{% if hero.missing %}yes{% endif %}{% for x in nothing %}{{ x }}{% endfor %}", hero={}) == ""
+    with pytest.raises(TemplateError, match=r"t.html:2: .*missing is undefined"):
+        render("ok\n{{ hero.missing }}", hero={})
+
+
+def test_compile_errors_name_the_line():
+    with pytest.raises(TemplateError, match=r"t.html:2: Unknown filter: shout"):
+        Template("a\n{{ x | shout }}", "t.html")
+    with pytest.raises(TemplateError, match=r"t.html:1: for is never closed"):
+        Template("{% for x in y %}\n", "t.html")
+    with pytest.raises(TemplateError, match=r"t.html:1: Unexpected endif"):
+        Template("{% endif %}", "t.html")
+
+
+def test_globals_are_visible_and_templates_are_compiled_once():
+    template = compile_template("{{ double(n) }}", "g.txt", False)
+    assert template is compile_template("{{ double(n) }}", "g.txt", False)
+    assert template.render({"n": 2}, double=lambda n: n * 2) == "4"
+
+
+def test_templates_only_see_whitelisted_builtins():
+    assert render("{{ len(items) }} {{ max(items) }}", autoescape=False, items=[3, 1]) == "2 3"
+    with pytest.raises(TemplateError, match="open is undefined|not callable"):
+        render("{{ open('/etc/passwd') }}")
+    with pytest.raises(TemplateError, match="Name not allowed in templates: __import__"):
+        Template("{{ __import__('os') }}", "t.html")
+    with pytest.raises(TemplateError, match="Attribute not allowed in templates: __class__"):
+        Template("{{ x | default(().__class__) }}", "t.html")
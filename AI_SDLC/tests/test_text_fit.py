@@ -0,0 +1,53 @@
+import pytest
+
+from deck_spec import compile_deck
+from text_fit import EMU_PER_PT, INSET_Y, Measure, available_height, fit_scale, measure_height, split_pages
+
+
+def lines(count, level=0):
+    """count one-line 20pt paragraphs of exactly 24pt each (no spacing)"""
+    return [Measure("x", 20, False, level, 0, 0) for _ in range(count)]
+
+
+def height_for(points):
+    """A placeholder height (EMU) leaving exactly points for text"""
+    return round(points * EMU_PER_PT) + 2 * INSET_Y
+
+
+def test_text_that_fits_exactly_keeps_full_size():
+    height = height_for(240)
+    assert available_height(height) == pytest.approx(240)
+    assert measure_height(lines(10)) == pytest.approx(240)
+    assert fit_scale(lines(10), height=height) == 1.0
+    assert fit_scale(lines(10), height=height - 1) == 0.95
+
+
+def test_text_that_overflows_shrinks_to_the_largest_fitting_step():
+    # 11 lines: 264pt at 100%, 250.8pt at 95%, 237.6pt at 90%
+    assert fit_scale(lines(11), height=height_for(240)) == 0.9
+
+
+def test_text_too_long_at_the_smallest_step_is_split_into_full_size_pages():
+    paragraphs = lines(20)  # 336pt even at 70%
+    assert fit_scale(paragraphs, height=height_for(240)) is None
+    assert split_pages(paragraphs, height=height_for(240)) == [list(range(10)), list(range(10, 20))]
+
+
+def test_a_heading_is_never_left_at_the_bottom_of_a_page():
+    paragraphs = lines(9) + lines(1) + lines(2, level=1)  # the 10th paragraph heads the last two
+    assert split_pages(paragraphs, height=height_for(240)) == [list(range(9)), [9, 10, 11]]
+
+
+@pytest.mark.parametrize("bullets, notes, pages", [
+    (8, [], 1),
+    (14, ["s: body text shrunk to"], 1),
+    (40, ["s: body text split over"], 4),
+])
+def test_body_fitting_shrinks_or_splits_slides(bullets, notes, pages):
+    spec = {"name": "fit", "slides": [{"id": "s", "title": "Long", "sections": [
+        {"bullets": [f"Point {n}" for n in range(bullets)], "bullet_style": {"size": 24}}]}]}
+    deck = compile_deck(spec)
+    assert len(deck.slides) == pages
+    assert [note[:len(prefix)] for note, prefix in zip(deck.fit_log, notes)] == notes
+    assert len(deck.fit_log) == len(notes)
+    assert [slide.title for slide in deck.slides[1:]] == ["Long (cont.)"] * (pages - 1)
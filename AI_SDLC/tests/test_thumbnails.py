@@ -0,0 +1,45 @@
+import pytest
+from lxml import etree
+from PIL import Image, ImageChops
+
+from deck_spec import compile_deck, new_presentation, render_slide
+from thumbnails import render_thumbnail
+
+COLORS = {"Alpha": "#C80A28", "Beta": "#28A745", "Gamma": "#0078D2"}
+
+C = "{http://schemas.openxmlformats.org/drawingml/2006/chart}"
+
+
+def chart_deck(chart_type):
+    return compile_deck({"name": "thumbs", "slides": [{"id": "chart", "layout": "title_only", "charts": [
+        {"type": chart_type, "categories": list(COLORS), "legend": False,
+         "series": [{"name": "Days", "values": [3, 2, 1], "colors": list(COLORS.values())}]}]}]})
+
+
+def chart_order(deck):
+    """Categories in reading order (top to bottom or left to right) as the chart part draws them"""
+    prs = new_presentation(deck.width, deck.height)
+    slide = render_slide(prs, deck.slides[0])
+    chart = etree.fromstring(slide.shapes[-1].chart.part.blob)
+    categories = [v.text for v in chart.find(f".//{C}cat").iter(f"{C}v")]
+    reversed_axis = chart.find(f".//{C}catAx/{C}scaling/{C}orientation").get("val") == "maxMin"
+    horizontal = chart.find(f".//{C}barDir").get("val") == "bar"
+    # A horizontal bar chart's category axis runs bottom to top unless reversed
+    return categories if horizontal == reversed_axis else categories[::-1]
+
+
+def thumbnail_order(deck, horizontal):
+    """Categories in reading order as the thumbnail draws them, found by their bar colors"""
+    image = render_thumbnail(deck.slides[0], deck.width, deck.height, 480).convert("RGB")
+    positions = {}
+    for name, color in COLORS.items():
+        solid = Image.new("RGB", image.size, tuple(int(color[i:i + 2], 16) for i in (1, 3, 5)))
+        left, top, _, _ = ImageChops.difference(image, solid).convert("L").point(lambda v: 255 * (v == 0)).getbbox()
+        positions[name] = top if horizontal else left
+    return sorted(positions, key=positions.get)
+
+
+@pytest.mark.parametrize("chart_type", ["bar", "column"])
+def test_bar_thumbnails_follow_the_chart_parts_category_order(chart_type):
+    deck = chart_deck(chart_type)
+    assert thumbnail_order(deck, chart_type == "bar") == chart_order(deck)
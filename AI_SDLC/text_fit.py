@@ -0,0 +1,215 @@
+"""
+Text measurement and fitting for generated slides
+Estimates the rendered height of a text frame from font advance widths (real
+TrueType metrics when Calibri or its metric-compatible Carlito is installed,
+otherwise a built-in Calibri width table), then shrinks the text or splits the
+paragraphs across continuation slides so nothing overflows. Word widths are
+cached per font, so measuring a thousand-slide batch takes milliseconds.
+"""
+
+import math
+import os
+from collections import namedtuple
+
+# Default-template body placeholder geometry (EMU); python-pptx decks are 10 x 7.5in
+BODY_WIDTH = 8229600
+BODY_HEIGHT = 4525963
+INSET_X = 91440  # left + right insets are each 0.1in
+INSET_Y = 45720  # top + bottom insets are each 0.05in
+
+# Master body style per paragraph level: left margin (EMU) and default size (pt)
+LEVEL_MARGINS = (342900, 742950, 1143000, 1600200, 2057400)
+LEVEL_SIZES = (32, 28, 24, 20, 20)
+DEFAULT_SPACE_BEFORE = 0.2  # spcPct 20% of the font size
+
+LINE_HEIGHT = 1.2  # Calibri ascent + descent + gap, in em
+
+# Shrink steps tried before splitting, and the smallest allowed scale
+FONT_SCALES = (1.0, 0.95, 0.9, 0.85, 0.8, 0.75, 0.7)
+
+EMU_PER_PT = 12700
+
+# Paragraph geometry the fitter needs (sizes and spacing in points)
+Measure = namedtuple("Measure", ["text", "size", "bold", "level", "space_before", "space_after"])
+
+# Calibri advance widths for ASCII 32..126 in 1/2048 em
+_CALIBRI_WIDTHS = (
+    463, 544, 821, 1038, 1038, 1468, 1423, 452, 621, 621, 1038, 1038, 511, 627, 517, 791,
+    1038, 1038, 1038, 1038, 1038, 1038, 1038, 1038, 1038, 1038, 548, 548, 1038, 1038, 1038, 950,
+    1820, 1185, 1114, 1092, 1260, 1000, 941, 1292, 1276, 516, 653, 1064, 861, 1751, 1322, 1356,
+    1058, 1378, 1112, 941, 998, 1314, 1162, 1822, 1063, 998, 959, 628, 791, 628, 1038, 1038,
+    600, 981, 1076, 866, 1076, 1019, 625, 964, 1076, 470, 490, 931, 470, 1636, 1076, 1080,
+    1076, 1076, 714, 801, 686, 1076, 925, 1464, 887, 927, 809, 640, 943, 640, 1038,
+)
+_BOLD_FACTOR = 1.04
+
+# Searched in order for real metrics; DECK_FONT / DECK_FONT_BOLD override
+FONT_CANDIDATES = {
+    False: ("C:/Windows/Fonts/calibri.ttf", "/Library/Fonts/Microsoft/Calibri.ttf",
+            "/usr/share/fonts/truetype/crosextra/Carlito-Regular.ttf",
+            "/usr/share/fonts/carlito/Carlito-Regular.ttf"),
+    True: ("C:/Windows/Fonts/calibrib.ttf", "/Library/Fonts/Microsoft/Calibri Bold.ttf",
+           "/usr/share/fonts/truetype/crosextra/Carlito-Bold.ttf",
+           "/usr/share/fonts/carlito/Carlito-Bold.ttf"),
+}
+
+
+class FontMetrics:
+    """Advance widths (in em) for one font face, with per-word caching"""
+
+    def __init__(self, bold=False):
+        self.bold = bold
+        self._font = _load_font(bold)
+        self._chars = {}
+        self._words = {}
+        self.space = self.char(" ")
+
+    def char(self, ch):
+        width = self._chars.get(ch)
+        if width is None:
+            if self._font is not None:
+                width = self._font.getlength(ch) / 2048
+            else:
+                width = _table_width(ch, self.bold)
+            self._chars[ch] = width
+        return width
+
+    def word(self, word):
+        """Width of a word in em"""
+        width = self._words.get(word)
+        if width is None:
+            width = self._words[word] = sum(self.char(ch) for ch in word)
+        return width
+
+
+def font_path(bold=False):
+    """The Calibri-compatible font file in use, or None (built-in width table)"""
+    path = os.environ.get("DECK_FONT_BOLD" if bold else "DECK_FONT")
+    candidates = (path,) if path else FONT_CANDIDATES[bold]
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _load_font(bold):
+    path = font_path(bold)
+    if path is None:
+        return None
+    from PIL import ImageFont
+    return ImageFont.truetype(path, 2048)
+
+
+def _table_width(ch, bold):
+    code = ord(ch)
+    if 32 <= code <= 126:
+        width = _CALIBRI_WIDTHS[code - 32] / 2048
+    elif code >= 0x2190:
+        width = 1.0  # arrows, symbols and emoji are roughly square
+    else:
+        width = 0.507
+    return width * _BOLD_FACTOR if bold else width
+
+
+_metrics = {}
+
+
+def metrics(bold=False):
+    """Shared FontMetrics for the regular or bold face"""
+    font = _metrics.get(bold)
+    if font is None:
+        font = _metrics[bold] = FontMetrics(bold)
+    return font
+
+
+def count_lines(text, width_pt, size, bold=False):
+    """Lines a paragraph wraps to in a column width_pt wide at size pt"""
+    font = metrics(bold)
+    column = width_pt / size  # available width in em
+    space = font.space
+    lines = 0
+    for line in text.replace("\v", "\n").split("\n"):
+        lines += 1
+        used = 0.0
+        for word in line.split(" "):
+            if not word:
+                used += space
+                continue
+            width = font.word(word)
+            if used and used + width > column:
+                lines += 1
+                used = 0.0
+            if width > column:
+                # A word longer than the column breaks across lines
+                extra = math.ceil(width / column) - 1
+                lines += extra
+                width -= extra * column
+            used += width + space
+    return lines
+
+
+def line_width(text, size, bold=False):
+    """Width (pt) of the longest line of unwrapped text"""
+    font = metrics(bold)
+    return max(sum(font.word(word) for word in line.split(" ")) + font.space * line.count(" ")
+               for line in text.replace("\v", "\n").split("\n")) * size
+
+
+def _paragraph_height(p, scale, width, first):
+    level = min(p.level, len(LEVEL_MARGINS) - 1)
+    base_size = p.size or LEVEL_SIZES[level]
+    size = base_size * scale
+    column = (width - 2 * INSET_X - LEVEL_MARGINS[level]) / EMU_PER_PT
+    height = count_lines(p.text, column, size, p.bold) * size * LINE_HEIGHT
+    if not first:  # PowerPoint ignores space before the first paragraph
+        height += (p.space_before if p.space_before is not None else DEFAULT_SPACE_BEFORE * base_size) * scale
+    return height + (p.space_after or 0) * scale
+
+
+def measure_height(paragraphs, scale=1.0, width=BODY_WIDTH):
+    """Estimated height (pt) of Measures in a body placeholder at a font scale"""
+    return sum(_paragraph_height(p, scale, width, index == 0) for index, p in enumerate(paragraphs))
+
+
+def available_height(height=BODY_HEIGHT):
+    return (height - 2 * INSET_Y) / EMU_PER_PT
+
+
+def fit_scale(paragraphs, width=BODY_WIDTH, height=BODY_HEIGHT):
+    """Largest FONT_SCALES step at which the paragraphs fit, or None"""
+    limit = available_height(height)
+    for scale in FONT_SCALES:
+        if measure_height(paragraphs, scale, width) <= limit:
+            return scale
+    return None
+
+
+def split_pages(paragraphs, width=BODY_WIDTH, height=BODY_HEIGHT):
+    """Split Measures into runs that each fit at full size
+
+    Returns lists of indexes. A paragraph that introduces deeper-level ones
+    (a heading) is never left at the bottom of a page.
+    """
+    limit = available_height(height)
+    pages = [[]]
+    used = 0.0
+    for index, p in enumerate(paragraphs):
+        page = pages[-1]
+        added = _paragraph_height(p, 1.0, width, not page)
+        if page and used + added > limit:
+            # Carry a trailing heading over with its first child
+            carried = []
+            while len(page) > 1 and _is_heading(paragraphs, page[-1]):
+                carried.insert(0, page.pop())
+            page = carried + [index]
+            pages.append(page)
+            used = measure_height([paragraphs[i] for i in page], 1.0, width)
+        else:
+            page.append(index)
+            used += added
+    return pages
+
+
+def _is_heading(paragraphs, index):
+    following = paragraphs[index + 1] if index + 1 < len(paragraphs) else None
+    return following is not None and following.level > paragraphs[index].level
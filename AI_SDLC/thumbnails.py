@@ -0,0 +1,348 @@
+"""
+PNG slide thumbnails drawn straight from a compiled deck
+Each CompiledSlide is painted with Pillow: background, title and body text laid
+out in the default template's placeholder boxes (with Calibri metrics when
+text_fit finds the font), text boxes, images and simple chart sketches. No
+PPTX is opened and no office suite is needed, so thumbnails can be drawn
+alongside the PPTX export from the same model.
+"""
+
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+from text_fit import (DEFAULT_SPACE_BEFORE, EMU_PER_PT, INSET_X, INSET_Y, LEVEL_MARGINS, LEVEL_SIZES,
+                      LINE_HEIGHT, font_path)
+
+# Thumbnail width in pixels; the height follows the slide's aspect ratio
+THUMBNAIL_WIDTH = 640
+
+TITLE_SIZE = 44
+SUBTITLE_SIZE = 32
+SUBTITLE_COLOR = (137, 137, 137)
+TEXT_COLOR = (0, 0, 0)
+AXIS_COLOR = (191, 191, 191)
+
+# Table style fills (Medium Style 2 - Accent 1): header and alternating bands
+TABLE_HEADER_FILL = (68, 114, 196)
+TABLE_BANDS = ((207, 213, 234), (233, 235, 245))
+TABLE_GRID_COLOR = (255, 255, 255)
+
+# Office theme accents, used for chart series without a color
+SERIES_COLORS = ((68, 114, 196), (237, 125, 49), (165, 165, 165), (255, 192, 0), (91, 155, 213),
+                 (112, 173, 71))
+
+BULLET_INDENT = 342900  # master hanging indent (EMU)
+
+CARD_LINE = 25400  # 2pt card outline (EMU)
+
+_fonts = {}
+_placeholders = None
+
+
+def _font(size_px, bold):
+    key = (max(1, round(size_px)), bool(bold))
+    font = _fonts.get(key)
+    if font is None:
+        path = font_path(key[1]) or font_path(False)
+        font = ImageFont.truetype(path, key[0]) if path else ImageFont.load_default(key[0])
+        _fonts[key] = font
+    return font
+
+
+def placeholder_boxes():
+    """{layout index: {placeholder idx: (left, top, width, height)}} of the default template"""
+    global _placeholders
+    if _placeholders is None:
+        from pptx import Presentation
+        _placeholders = [
+            {ph.placeholder_format.idx: (ph.left, ph.top, ph.width, ph.height) for ph in layout.placeholders}
+            for layout in Presentation().slide_layouts
+        ]
+    return _placeholders
+
+
+def _wrap(text, font, width):
+    """Lines of text broken at spaces to fit width px (None: no wrapping)"""
+    lines = []
+    for line in text.replace("\v", "\n").split("\n"):
+        current = ""
+        for word in line.split(" "):
+            candidate = f"{current} {word}" if current else word
+            if width is not None and current and font.getlength(candidate) > width:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        lines.append(current)
+    return lines
+
+
+def _draw_text(draw, box, paragraphs, scale, body=False, size=None, color=TEXT_COLOR, center=False,
+               middle=False, wrap=True):
+    """Lay out (text, style) paragraphs in an EMU box the way PowerPoint roughly would"""
+    from pptx.enum.text import PP_ALIGN
+
+    left, top, width, height = box
+    inner_left = (left + INSET_X) * scale
+    inner_width = (width - 2 * INSET_X) * scale
+    rows = []
+    bullets = []  # drawn as dots: not every fallback font has a bullet glyph
+    y = 0.0
+    for index, (text, style) in enumerate(paragraphs):
+        level = min(style.level, len(LEVEL_MARGINS) - 1) if body else 0
+        base = LEVEL_SIZES[level] if body else size or 18
+        size_pt = style.size.pt if style.size is not None else base
+        px = size_pt * EMU_PER_PT * scale
+        font = _font(px, style.bold)
+        fill = tuple(style.color) if style.color is not None else color
+        margin = LEVEL_MARGINS[level] * scale if body else 0
+        if index:
+            if style.space_before is not None:
+                y += style.space_before.pt * EMU_PER_PT * scale
+            elif body:
+                y += DEFAULT_SPACE_BEFORE * px
+        column = inner_width - margin
+        alignment = style.alignment or (PP_ALIGN.CENTER if center else PP_ALIGN.LEFT)
+        for number, line in enumerate(_wrap(text, font, column if wrap else None)):
+            offset = column - font.getlength(line)
+            if alignment == PP_ALIGN.CENTER:
+                x = inner_left + margin + offset / 2
+            elif alignment == PP_ALIGN.RIGHT:
+                x = inner_left + margin + offset
+            else:
+                x = inner_left + margin
+            if body and number == 0 and line:
+                bullets.append((x - BULLET_INDENT * scale, y, px, fill))
+            rows.append((x, y, line, font, fill))
+            y += px * LINE_HEIGHT
+        if style.space_after is not None:
+            y += style.space_after.pt * EMU_PER_PT * scale
+
+    y0 = top * scale + INSET_Y * scale
+    if middle:
+        y0 += (height * scale - 2 * INSET_Y * scale - y) / 2
+    for x, y, line, font, fill in rows:
+        draw.text((x, y0 + y), line, font=font, fill=fill)
+    for x, y, px, fill in bullets:
+        radius = px * 0.12
+        cx, cy = x + radius, y0 + y + px * 0.6
+        draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=fill)
+
+
+def _image_box(image, path_size, scale, slide_width):
+    from assets import EMU_PER_INCH, TARGET_DPI
+
+    px_width, px_height = path_size
+    width, height = image.width, image.height
+    if width is None and height is None:
+        width = px_width * EMU_PER_INCH / TARGET_DPI
+    if width is None:
+        width = height * px_width / px_height
+    elif height is None:
+        height = width * px_height / px_width
+    left = image.left if image.left is not None else (slide_width - width) / 2
+    return (round(left * scale), round((image.top or 0) * scale),
+            max(1, round(width * scale)), max(1, round(height * scale)))
+
+
+def _series_color(series, index):
+    return _rgb(series.get("color")) or SERIES_COLORS[index % len(SERIES_COLORS)]
+
+
+def _rgb(value):
+    if not value:
+        return None
+    value = value.lstrip("#")
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _draw_gradient(image, top, bottom):
+    """Fill image with a vertical linear gradient from top to bottom color"""
+    draw = ImageDraw.Draw(image)
+    last = max(1, image.height - 1)
+    for y in range(image.height):
+        t = y / last
+        draw.line((0, y, image.width, y), fill=tuple(round(a + (b - a) * t) for a, b in zip(top, bottom)))
+
+
+def _style(size, bold=None, color=None, alignment=None):
+    """A ParagraphStyle for the fixed text of the dashboard templates"""
+    from pptx.util import Pt
+
+    from brand_styles import ParagraphStyle
+
+    return ParagraphStyle(Pt(size), bold, color, 0, None, None, alignment)
+
+
+def _draw_card(draw, card, scale):
+    """A card, mirroring deck_spec.render_card"""
+    from pptx.enum.text import PP_ALIGN
+
+    box = (card.left, card.top, card.width, card.height)
+    draw.rectangle(tuple(round(v * scale) for v in (card.left, card.top, card.left + card.width,
+                                                    card.top + card.height)),
+                   fill=tuple(card.fill), outline=tuple(card.accent),
+                   width=max(1, round(CARD_LINE * scale)))
+    # The card template starts with an empty paragraph
+    paragraphs = [("", _style(18))]
+    if card.icon:
+        paragraphs.append((card.icon, _style(32, True, card.accent, PP_ALIGN.CENTER)))
+    paragraphs.append((card.title, _style(18, True, card.accent, PP_ALIGN.CENTER)))
+    paragraphs.append((card.content, _style(14, None, card.body, PP_ALIGN.CENTER)))
+    _draw_text(draw, box, paragraphs, scale, middle=True)
+
+
+def _draw_bar(draw, bar, scale):
+    """A progress bar, mirroring deck_spec.render_bar"""
+    from deck_spec import PROGRESS_LABEL_WIDTH
+
+    left, top, bottom = bar.left * scale, bar.top * scale, (bar.top + bar.height) * scale
+    draw.rectangle((left, top, (bar.left + bar.width) * scale, bottom), fill=tuple(bar.track))
+    draw.rectangle((left, top, (bar.left + int(bar.width * bar.percent)) * scale, bottom), fill=tuple(bar.color))
+    label_box = (bar.left + bar.width + bar.width // 20, bar.top, PROGRESS_LABEL_WIDTH, bar.height)
+    _draw_text(draw, label_box, ((bar.label, _style(14, True, bar.color)),), scale, wrap=False)
+
+
+def _draw_table(draw, table, scale):
+    """A native table's header, banded rows and cell text"""
+    from metrics import cell_text
+    from text_fit import EMU_PER_PT, INSET_X
+
+    px = table.font_size * EMU_PER_PT * scale
+    fonts = (_font(px, True), _font(px, False))
+    edges = [table.left]
+    for width in table.widths:
+        edges.append(edges[-1] + width)
+    rows = [(table.header, _rgb(table.header_fill) or TABLE_HEADER_FILL, _rgb(table.header_color) or (255, 255, 255),
+             fonts[0])]
+    rows += [(values, TABLE_BANDS[index % 2], _rgb(table.text_color) or TEXT_COLOR, fonts[1])
+             for index, values in enumerate(table.rows)]
+    for number, (values, fill, color, font) in enumerate(rows):
+        top = table.top + number * table.row_height
+        box = [v * scale for v in (table.left, top, edges[-1], top + table.row_height)]
+        draw.rectangle(box, fill=fill, outline=TABLE_GRID_COLOR)
+        for index, value in enumerate(values):
+            text = cell_text(value)
+            if table.align[index] == "r":
+                x = edges[index + 1] * scale - INSET_X * scale - font.getlength(text)
+            else:
+                x = (edges[index] + INSET_X) * scale
+            draw.text((x, box[1] + (box[3] - box[1] - px) / 2), text, font=font, fill=color)
+
+
+def _draw_chart(draw, chart, scale, background):
+    """A rough sketch of a chart: bars, lines or pie slices in the series colors"""
+    spec = chart.spec
+    left, top = chart.left * scale, chart.top * scale
+    width, height = chart.width * scale, chart.height * scale
+    pad = 0.08 * min(width, height)
+    x0, y0, x1, y1 = left + pad, top + pad, left + width - pad, top + height - pad
+    series = spec["series"]
+
+    if spec["type"] in ("pie", "doughnut"):
+        values = [v or 0 for v in series[0]["values"]]
+        total = sum(values) or 1
+        colors = [_rgb(c) for c in series[0].get("colors") or ()]
+        side = min(x1 - x0, y1 - y0)
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        bounds = (cx - side / 2, cy - side / 2, cx + side / 2, cy + side / 2)
+        angle = -90.0
+        for index, value in enumerate(values):
+            sweep = 360.0 * value / total
+            fill = colors[index] if index < len(colors) else SERIES_COLORS[index % len(SERIES_COLORS)]
+            draw.pieslice(bounds, angle, angle + sweep, fill=fill)
+            angle += sweep
+        if spec["type"] == "doughnut":
+            hole = side / 4
+            draw.ellipse((cx - hole, cy - hole, cx + hole, cy + hole), fill=background)
+        return
+
+    values = [v for s in series for v in s["values"] if v is not None]
+    top_value = max(values + [0]) or 1
+    categories = max(len(s["values"]) for s in series) or 1
+    horizontal = spec["type"] == "bar"
+    draw.line((x0, y1, x1, y1) if not horizontal else (x0, y0, x0, y1), fill=AXIS_COLOR)
+
+    if spec["type"] == "line":
+        step = (x1 - x0) / max(1, categories - 1)
+        for index, s in enumerate(series):
+            points = [(x0 + i * step, y1 - (y1 - y0) * v / top_value)
+                      for i, v in enumerate(s["values"]) if v is not None]
+            fill = _rgb(s.get("line_color")) or _series_color(s, index)
+            if len(points) > 1:
+                draw.line(points, fill=fill, width=max(1, round(2 * scale * 12700)))
+            for x, y in points:
+                draw.ellipse((x - 2, y - 2, x + 2, y + 2), fill=fill)
+        return
+
+    extent = (y1 - y0) if horizontal else (x1 - x0)
+    group = extent / categories
+    bar = group * 0.7 / len(series)
+    for index, s in enumerate(series):
+        colors = [_rgb(c) for c in s.get("colors") or ()]
+        for i, value in enumerate(s["values"]):
+            if not value:
+                continue
+            fill = colors[i] if i < len(colors) else _series_color(s, index)
+            start = group * i + group * 0.15 + bar * index
+            if horizontal:
+                # Bar charts run their category axis bottom to top, like PowerPoint's default minMax
+                length = (x1 - x0) * value / top_value
+                draw.rectangle((x0, y1 - start - bar, x0 + length, y1 - start), fill=fill)
+            else:
+                length = (y1 - y0) * value / top_value
+                draw.rectangle((x0 + start, y1 - length, x0 + start + bar, y1), fill=fill)
+
+
+def render_thumbnail(slide, slide_width, slide_height, width=THUMBNAIL_WIDTH):
+    """A PIL image of one CompiledSlide, width pixels wide"""
+    from deck_spec import slide_shapes
+
+    scale = width / slide_width
+    background = tuple(slide.background) if slide.background is not None else (255, 255, 255)
+    image = Image.new("RGB", (width, max(1, round(slide_height * scale))), background)
+    if slide.gradient is not None:
+        _draw_gradient(image, *slide.gradient)
+    draw = ImageDraw.Draw(image)
+    boxes = placeholder_boxes()[slide.layout]
+
+    if slide.title is not None and 0 in boxes:
+        _draw_text(draw, boxes[0], ((slide.title, slide.title_style),), scale,
+                   size=TITLE_SIZE, center=True, middle=True)
+    if slide.paragraphs and 1 in boxes:
+        if slide.layout == 0:  # the title layout's second placeholder is the subtitle
+            _draw_text(draw, boxes[1], slide.paragraphs, scale, size=SUBTITLE_SIZE, color=SUBTITLE_COLOR,
+                       center=True)
+        else:
+            _draw_text(draw, boxes[1], slide.paragraphs, scale, body=True)
+
+    for kind, shape in slide_shapes(slide):
+        if kind == "textboxes":
+            _draw_text(draw, (shape.left, shape.top, shape.width, shape.height), shape.paragraphs, scale,
+                       wrap=False)
+        elif kind == "cards":
+            _draw_card(draw, shape, scale)
+        elif kind == "bars":
+            _draw_bar(draw, shape, scale)
+        elif kind == "tables":
+            _draw_table(draw, shape, scale)
+        elif kind == "images":
+            with Image.open(shape.path) as source:
+                left, top, w, h = _image_box(shape, source.size, scale, slide_width)
+                resized = source.convert("RGBA").resize((w, h), Image.LANCZOS)
+            image.paste(resized, (left, top), resized)
+        else:
+            _draw_chart(draw, shape, scale, background)
+    return image
+
+
+def write_thumbnails(deck, folder, width=THUMBNAIL_WIDTH):
+    """Save slide-001.png, slide-002.png, ... for every slide of a CompiledDeck"""
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for number, slide in enumerate(deck.slides, 1):
+        path = os.path.join(folder, f"slide-{number:03d}.png")
+        render_thumbnail(slide, deck.width, deck.height, width).save(path, optimize=True)
+        paths.append(path)
+    return paths